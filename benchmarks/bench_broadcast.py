@@ -0,0 +1,128 @@
+"""
+bench_broadcast.py
+----------------
+Author: Nida Anis
+Date: 18/10/2026
+----------------
+Description:
+-> Benchmarks broadcast fan-out to many local WebSocket display clients
+
+Usage:
+-> python -m benchmarks.bench_broadcast [--clients 10 100 500] [--updates 5]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import tempfile
+import threading
+import time
+
+from datetime import datetime, timedelta
+
+from tornado.websocket import websocket_connect
+
+def write_events(events_file, offset_minutes):
+    """Write a small schedule whose next event moves with each update."""
+    from src.core.model import serialise_event
+
+    now = datetime.now()
+    events = []
+    for i in range(20):
+        start = now + timedelta(minutes=offset_minutes + i * 30)
+        events.append(serialise_event({
+            "name": f"Event {i}",
+            "start": start,
+            "end": start + timedelta(minutes=25),
+            "duration": 25
+        }))
+
+    with open(events_file, "w") as f:
+        json.dump(events, f)
+
+def thread_cpu_seconds(thread):
+    """CPU time consumed so far by a single thread (Linux)."""
+    return time.clock_gettime(time.pthread_getcpuclockid(thread.ident))
+
+async def run_round(server, port, client_count, updates, events_file, board_id):
+    """Connect clients, push updates and collect per-client delivery latency."""
+    url = f"ws://127.0.0.1:{port}/ws/board"
+    clients = await asyncio.gather(*(websocket_connect(url) for _ in range(client_count)))
+
+    # Drain the state each client receives on connect
+    await asyncio.gather(*(client.read_message() for client in clients))
+
+    hub = server.request_callback.hubs.hubs[board_id]
+
+    server_thread = next(t for t in threading.enumerate() if t.name == "countdown-api")
+    cpu_before = thread_cpu_seconds(server_thread)
+    refreshes_before = hub.refresh_count
+    broadcasts_before = hub.broadcast_count
+
+    latencies = []
+    for update in range(updates):
+        write_events(events_file, 60 + update + 1)
+        sent = time.perf_counter()
+        hub.task.get_loop().call_soon_threadsafe(hub.notify)
+
+        async def receive(client):
+            await client.read_message()
+            return time.perf_counter() - sent
+
+        latencies.extend(await asyncio.gather(*(receive(client) for client in clients)))
+
+    cpu_used = thread_cpu_seconds(server_thread) - cpu_before
+    refreshes = hub.refresh_count - refreshes_before
+    broadcasts = hub.broadcast_count - broadcasts_before
+
+    for client in clients:
+        client.close()
+
+    return latencies, cpu_used, refreshes, broadcasts
+
+def main():
+    parser = argparse.ArgumentParser(description="Broadcast fan-out benchmark")
+    parser.add_argument("--clients", type=int, nargs="+", default=[10, 100, 250, 500])
+    parser.add_argument("--updates", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Board paths are resolved when the store is imported, so point it at the temporary directory first
+        os.environ["COUNTDOWN_DATA_DIR"] = os.path.join(tmp, "data")
+        os.environ["COUNTDOWN_ASSETS_DIR"] = os.path.join(tmp, "assets")
+
+        from src.api import start_api_server
+        from src.core.boards import DEFAULT_BOARD, board_paths
+
+        paths = board_paths(DEFAULT_BOARD)
+        os.makedirs(paths["data_dir"])
+        write_events(paths["events_file"], 60)
+
+        server, port = start_api_server(port=0)
+
+        print(
+            f"{'clients':>8} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8} "
+            f"{'refreshes':>10} {'broadcasts':>11} {'cpu ms/update':>14}"
+        )
+
+        for client_count in args.clients:
+            latencies, cpu_used, refreshes, broadcasts = asyncio.run(
+                run_round(server, port, client_count, args.updates, paths["events_file"], DEFAULT_BOARD)
+            )
+            latencies.sort()
+            p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+
+            print(
+                f"{client_count:>8} "
+                f"{statistics.median(latencies) * 1000:>8.2f} "
+                f"{p99 * 1000:>8.2f} "
+                f"{latencies[-1] * 1000:>8.2f} "
+                f"{refreshes:>10} "
+                f"{broadcasts:>11} "
+                f"{cpu_used * 1000 / args.updates:>14.2f}"
+            )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+"""
+load_test.py
+----------------
+Author: Nida Anis
+Date: 19/10/2026
+----------------
+Description:
+-> Concurrent-session load test for the Streamlit app using AppTest
+
+Each simulated session is a headless AppTest instance rerunning the app
+script at a fixed refresh rate against a seeded, generated schedule in a
+temporary data directory, so runs are offline and reproducible. Sessions
+run in worker processes to get real concurrency.
+
+Usage:
+-> python -m benchmarks.load_test --sessions 50 --reruns 20 --events 500
+-> python -m benchmarks.load_test --query kiosk=1 --json load_report.json
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import resource
+import statistics
+import sys
+import tempfile
+import time
+
+from datetime import datetime, timedelta
+
+from streamlit.testing.v1 import AppTest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_SCRIPT = os.path.join(REPO_ROOT, "src", "streamlit_app.py")
+
+def generate_events(count, seed):
+    """Generate a reproducible schedule of upcoming events."""
+    rng = random.Random(seed)
+    now = datetime.now().replace(microsecond=0)
+    events = []
+
+    for i in range(count):
+        start = now + timedelta(minutes=rng.randint(1, 60 * 24 * 30))
+        duration = rng.choice([15, 30, 45, 60, 90, 120])
+        events.append({
+            "id": f"load-{i}",
+            "name": f"Load test event {i}",
+            "start": start.isoformat(),
+            "end": (start + timedelta(minutes=duration)).isoformat(),
+            "duration": duration
+        })
+
+    return events
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+def current_rss_mb():
+    """Current resident set size of this process in MB (Linux)."""
+    with open("/proc/self/statm") as f:
+        resident_pages = int(f.read().split()[1])
+    return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+def run_worker(session_indices, args, results, start_barrier):
+    """
+    Run a group of simulated browser sessions in one worker process.
+
+    AppTest swaps a global Streamlit runtime in and out around each run, so
+    concurrent sessions need separate processes; sessions sharing a worker
+    take turns within each refresh period.
+    """
+    sessions = []
+    for _ in session_indices:
+        app = AppTest.from_file(args.script, default_timeout=args.timeout)
+        for pair in args.query:
+            key, _, value = pair.partition("=")
+            app.query_params[key] = value
+        sessions.append(app)
+
+    latencies = []
+    errors = []
+
+    start_barrier.wait()
+
+    # Stagger workers across one refresh period like real browsers
+    time.sleep((session_indices[0] / args.sessions) * args.refresh_ms / 1000)
+
+    for _ in range(args.reruns):
+        round_started = time.perf_counter()
+
+        for app in sessions:
+            started = time.perf_counter()
+            try:
+                app.run()
+                if app.exception:
+                    errors.append(str(app.exception[0].message))
+            except Exception as e:
+                errors.append(f"{type(e).__name__}: {str(e)}")
+            latencies.append(time.perf_counter() - started)
+
+        time.sleep(max(0.0, args.refresh_ms / 1000 - (time.perf_counter() - round_started)))
+
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    results.put({
+        "latencies": latencies,
+        "errors": errors,
+        "rss_mb": current_rss_mb(),
+        # ru_maxrss is reported in kilobytes on Linux
+        "peak_rss_mb": usage.ru_maxrss / 1024
+    })
+
+def run_load_test(args):
+    """Run all sessions concurrently and return a report dictionary."""
+    workers = max(1, min(args.workers or args.sessions, args.sessions))
+    groups = [list(range(args.sessions))[i::workers] for i in range(workers)]
+
+    results = multiprocessing.Queue()
+    start_barrier = multiprocessing.Barrier(workers + 1)
+
+    processes = [
+        multiprocessing.Process(target=run_worker, args=(group, args, results, start_barrier), daemon=True)
+        for group in groups
+    ]
+    for process in processes:
+        process.start()
+
+    start_barrier.wait()
+    wall_start = time.perf_counter()
+
+    # Drain results before joining so full queues cannot block the workers
+    worker_results = [results.get() for _ in processes]
+    wall = time.perf_counter() - wall_start
+
+    for process in processes:
+        process.join()
+
+    # Children are reaped now, so their CPU time is included
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    cpu = usage.ru_utime + usage.ru_stime
+
+    latencies = sorted(latency for result in worker_results for latency in result["latencies"])
+    errors = [error for result in worker_results for error in result["errors"]]
+
+    return {
+        "sessions": args.sessions,
+        "workers": workers,
+        "reruns_per_session": args.reruns,
+        "events": args.events,
+        "refresh_ms": args.refresh_ms,
+        "query": args.query,
+        "seed": args.seed,
+        "reruns": len(latencies),
+        "errors": len(errors),
+        "first_errors": errors[:5],
+        "wall_seconds": wall,
+        "throughput_reruns_per_second": len(latencies) / wall if wall else 0.0,
+        "latency_ms": {
+            "mean": statistics.fmean(latencies) * 1000 if latencies else 0.0,
+            "p50": percentile(latencies, 0.50) * 1000,
+            "p90": percentile(latencies, 0.90) * 1000,
+            "p95": percentile(latencies, 0.95) * 1000,
+            "p99": percentile(latencies, 0.99) * 1000,
+            "max": (latencies[-1] if latencies else 0.0) * 1000
+        },
+        "cpu_seconds": cpu,
+        "cpu_utilisation_cores": cpu / wall if wall else 0.0,
+        "rss_mb_total": sum(result["rss_mb"] for result in worker_results),
+        "rss_mb_per_worker": max(result["rss_mb"] for result in worker_results),
+        "peak_rss_mb_per_worker": max(result["peak_rss_mb"] for result in worker_results)
+    }
+
+def print_report(report):
+    latency = report["latency_ms"]
+    print(f"Sessions:     {report['sessions']} x {report['reruns_per_session']} reruns "
+          f"in {report['workers']} processes, {report['events']} events, refresh {report['refresh_ms']} ms")
+    print(f"Reruns:       {report['reruns']} in {report['wall_seconds']:.2f}s "
+          f"({report['throughput_reruns_per_second']:.1f}/s), errors: {report['errors']}")
+    print(f"Latency ms:   p50 {latency['p50']:.1f}  p90 {latency['p90']:.1f}  "
+          f"p95 {latency['p95']:.1f}  p99 {latency['p99']:.1f}  max {latency['max']:.1f}")
+    print(f"CPU:          {report['cpu_seconds']:.2f}s ({report['cpu_utilisation_cores']:.2f} cores)")
+    print(f"RSS MB:       {report['rss_mb_total']:.1f} total, {report['rss_mb_per_worker']:.1f} per process "
+          f"(peak {report['peak_rss_mb_per_worker']:.1f})")
+    for error in report["first_errors"]:
+        print(f"Error:        {error}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent-session load test")
+    parser.add_argument("--sessions", type=int, default=50, help="Simulated browser sessions")
+    parser.add_argument("--reruns", type=int, default=20, help="Reruns per session")
+    parser.add_argument("--events", type=int, default=500, help="Events in the generated schedule")
+    parser.add_argument("--refresh-ms", type=int, default=1000, help="Interval between reruns per session")
+    parser.add_argument("--workers", type=int, default=0, help="Worker processes (default: one per session)")
+    parser.add_argument("--timeout", type=float, default=30, help="Per-rerun timeout in seconds")
+    parser.add_argument("--seed", type=int, default=1234, help="Schedule generator seed")
+    parser.add_argument("--query", nargs="*", default=[], help="Query params, e.g. kiosk=1 board=room-1")
+    parser.add_argument("--script", default=APP_SCRIPT, help="App script to run")
+    parser.add_argument("--json", help="Also write the report to this file")
+    args = parser.parse_args()
+
+    args.script = os.path.abspath(args.script)
+    json_path = os.path.abspath(args.json) if args.json else None
+
+    # The app imports from src and reads data/ relative to the working directory
+    sys.path.insert(0, REPO_ROOT)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        os.makedirs("data")
+        os.makedirs("assets")
+
+        with open(os.path.join("data", "events.json"), "w") as f:
+            json.dump(generate_events(args.events, args.seed), f)
+
+        report = run_load_test(args)
+
+    print_report(report)
+
+    if json_path:
+        with open(json_path, "w") as f:
+            json.dump(report, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""
+api.py
+----------------
+Author: Nida Anis
+Date: 18/10/2026
+----------------
+Description:
+-> Read-only JSON HTTP API for events and clock state, plus static board pages
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+
+from datetime import datetime
+
+import tornado.httpserver
+import tornado.netutil
+import tornado.web
+
+from src import clock
+from src.broadcast import HubRegistry, BoardSocketHandler, BoardStreamHandler, get_board_argument
+from src.core.model import serialise_event
+from src.core.queries import get_board_state
+from src.core.store import get_cached_events
+from src.static_export import export_board_html, read_export_version
+
+API_ADDRESS = os.environ.get("COUNTDOWN_API_ADDRESS", "127.0.0.1")
+API_PORT = int(os.environ.get("COUNTDOWN_API_PORT", "8502"))
+
+def parse_datetime_argument(value):
+    """Parses an optional ISO datetime query argument."""
+    if not value:
+        return None
+
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise tornado.web.HTTPError(400, reason=f"Invalid datetime: {value}")
+
+class BaseAPIHandler(tornado.web.RequestHandler):
+    """Shared JSON and ETag handling for API endpoints."""
+
+    def prepare(self):
+        self.board_id = get_board_argument(self)
+
+    def set_default_headers(self):
+        self.set_header("Content-Type", "application/json; charset=utf-8")
+        self.set_header("Cache-Control", "no-cache")
+
+    def not_modified(self, etag_key):
+        """Sets the ETag header and returns True if the client copy is current."""
+        etag = hashlib.sha1(etag_key.encode("utf-8")).hexdigest()
+        self.set_header("Etag", f'"{etag}"')
+
+        if self.check_etag_header():
+            self.set_status(304)
+            return True
+        return False
+
+    def write_json(self, data):
+        self.write(json.dumps(data))
+
+class EventsHandler(BaseAPIHandler):
+    """GET /api/events[?board=name&start=ISO&end=ISO] -> stored events, optionally windowed."""
+
+    def get(self):
+        start = parse_datetime_argument(self.get_query_argument("start", None))
+        end = parse_datetime_argument(self.get_query_argument("end", None))
+
+        version, events = get_cached_events(self.board_id)
+
+        # The event list only changes with the store, so the version is enough
+        if self.not_modified(version):
+            return
+
+        if start:
+            events = [event for event in events if event["end"] >= start]
+        if end:
+            events = [event for event in events if event["start"] <= end]
+
+        self.write_json({
+            "version": version,
+            "events": [serialise_event(event) for event in events]
+        })
+
+class StateHandler(BaseAPIHandler):
+    """GET /api/state[?board=name] -> currently active and next event."""
+
+    def get(self):
+        version, events = get_cached_events(self.board_id)
+        state = get_board_state(events, clock.now())
+
+        # The clock moves on without the store changing, so key on the events shown too
+        current_start = state["current_event"]["start"] if state["current_event"] else ""
+        next_start = state["next_event"]["start"] if state["next_event"] else ""
+        if self.not_modified(f"{version}|{current_start}|{next_start}"):
+            return
+
+        state["version"] = version
+        self.write_json(state)
+
+class StaticBoardHandler(BaseAPIHandler):
+    """GET /board.html[?board=name] -> the board's self-contained offline page."""
+
+    def set_default_headers(self):
+        self.set_header("Content-Type", "text/html; charset=utf-8")
+        self.set_header("Cache-Control", "no-cache")
+
+    def get(self):
+        # Only rebuilt when the store or logo changed since the last export
+        output_path, _ = export_board_html(self.board_id)
+
+        if self.not_modified(read_export_version(output_path)):
+            return
+
+        with open(output_path, "rb") as f:
+            self.write(f.read())
+
+def make_app():
+    """Build the Tornado application serving the API."""
+    hubs = HubRegistry()
+
+    app = tornado.web.Application([
+        (r"/api/events", EventsHandler),
+        (r"/api/state", StateHandler),
+        (r"/board.html", StaticBoardHandler),
+        (r"/ws/board", BoardSocketHandler, {"hubs": hubs}),
+        (r"/sse/board", BoardStreamHandler, {"hubs": hubs})
+    ])
+    app.hubs = hubs
+
+    return app
+
+def start_api_server(port=API_PORT, address=API_ADDRESS):
+    """
+    Start the API on its own event loop in a daemon thread.
+
+    Args:
+    -> port: Port to listen on (0 picks a free port)
+    -> address: Interface to bind, localhost by default
+
+    Returns:
+    -> Tuple of (server, port actually bound); broadcast hubs are in server.request_callback.hubs
+    """
+    started = threading.Event()
+    result = {}
+
+    def run():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+        try:
+            sockets = tornado.netutil.bind_sockets(port, address=address)
+            server = tornado.httpserver.HTTPServer(make_app())
+            server.add_sockets(sockets)
+            result["server"] = server
+            result["port"] = sockets[0].getsockname()[1]
+        except Exception as e:
+            result["error"] = e
+            started.set()
+            return
+
+        started.set()
+        loop.run_forever()
+
+    threading.Thread(target=run, name="countdown-api", daemon=True).start()
+    started.wait()
+
+    if "error" in result:
+        raise result["error"]
+
+    return result["server"], result["port"]
+
+if __name__ == "__main__":
+    _, bound_port = start_api_server()
+    print(f"Countdown API listening on http://{API_ADDRESS}:{bound_port}")
+    threading.Event().wait()
@@ -0,0 +1,135 @@
+"""
+arrow_store.py
+----------------
+Author: Nida Anis
+Date: 19/10/2026
+----------------
+Description:
+-> Memory-mapped Arrow IPC (Feather) snapshots of the event store
+"""
+
+import json
+import os
+
+from datetime import datetime, timedelta
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# Times are stored as naive wall-clock microseconds, matching the app's naive datetimes
+EPOCH = datetime(1970, 1, 1)
+CORE_FIELDS = ("id", "name", "start", "end", "duration")
+
+SNAPSHOT_SCHEMA = pa.schema([
+    ("id", pa.string()),
+    ("name", pa.string()),
+    ("start", pa.int64()),
+    ("end", pa.int64()),
+    ("duration", pa.int64()),
+    # Any other event keys, JSON encoded, so new fields survive a round trip
+    ("extra", pa.string())
+])
+
+def to_microseconds(moment):
+    """Converts a naive datetime into int64 microseconds since the epoch."""
+    return (moment - EPOCH) // timedelta(microseconds=1)
+
+def is_whole_minutes(duration):
+    """True if a duration fits the int64 column without losing anything."""
+    return duration is None or (isinstance(duration, int) and not isinstance(duration, bool))
+
+def events_to_table(events):
+    """Builds an Arrow table from event dictionaries."""
+    durations = []
+    extras = []
+    for event in events:
+        extra = {key: value for key, value in event.items() if key not in CORE_FIELDS}
+
+        # Arrow would truncate 30.5 to 30, so other durations are kept exactly in the JSON column
+        duration = event.get("duration")
+        if not is_whole_minutes(duration):
+            extra["duration"] = duration
+            duration = None
+
+        durations.append(duration)
+        extras.append(json.dumps(extra) if extra else None)
+
+    return pa.table({
+        "id": [event.get("id") for event in events],
+        "name": [event["name"] for event in events],
+        "start": [to_microseconds(event["start"]) for event in events],
+        "end": [to_microseconds(event["end"]) for event in events],
+        "duration": durations,
+        "extra": extras
+    }, schema=SNAPSHOT_SCHEMA)
+
+def write_snapshot(events, snapshot_file):
+    """
+    Writes events as an uncompressed Arrow IPC file.
+
+    Compression is left off so readers can memory-map the columns directly.
+    The file is replaced atomically so readers never see a partial write.
+    """
+    table = events_to_table(events)
+    tmp_path = f"{snapshot_file}.tmp"
+
+    with pa.OSFile(tmp_path, "wb") as sink:
+        with pa.ipc.new_file(sink, SNAPSHOT_SCHEMA) as writer:
+            writer.write_table(table)
+
+    os.replace(tmp_path, snapshot_file)
+
+def open_snapshot(snapshot_file):
+    """Memory-maps a snapshot and returns it as a zero-copy Arrow table."""
+    with pa.memory_map(snapshot_file, "r") as source:
+        return pa.ipc.open_file(source).read_all()
+
+def filter_range(table, start=None, end=None):
+    """
+    Returns the rows of events overlapping a window, computed on the int64 columns.
+
+    Args:
+    -> table: Snapshot table
+    -> start: Optional datetime; drop events ending before it
+    -> end: Optional datetime; drop events starting after it
+    """
+    mask = None
+
+    if start is not None:
+        mask = pc.greater_equal(table["end"], to_microseconds(start))
+    if end is not None:
+        end_mask = pc.less_equal(table["start"], to_microseconds(end))
+        mask = end_mask if mask is None else pc.and_(mask, end_mask)
+
+    return table if mask is None else table.filter(mask)
+
+def table_to_events(table):
+    """Converts snapshot rows into event dictionaries."""
+    # Casting to timestamps lets Arrow build the datetimes instead of a Python loop
+    starts = table["start"].cast(pa.timestamp("us")).to_pylist()
+    ends = table["end"].cast(pa.timestamp("us")).to_pylist()
+
+    events = []
+    for event_id, name, start, end, duration, extra in zip(
+        table["id"].to_pylist(),
+        table["name"].to_pylist(),
+        starts,
+        ends,
+        table["duration"].to_pylist(),
+        table["extra"].to_pylist()
+    ):
+        event = {"id": event_id, "name": name, "start": start, "end": end, "duration": duration}
+        if extra:
+            event.update(json.loads(extra))
+        events.append(event)
+
+    return events
+
+def load_snapshot_events(snapshot_file, start=None, end=None):
+    """
+    Loads events from a snapshot, optionally only those overlapping a window.
+
+    The window is applied to the memory-mapped columns first, so rows outside
+    it never become Python objects.
+    """
+    return table_to_events(filter_range(open_snapshot(snapshot_file), start, end))
@@ -0,0 +1,29 @@
+"""
+boards.py
+----------------
+Author: Nida Anis
+Date: 18/10/2026
+----------------
+Description:
+-> Named boards, each with its own events, settings, themes and logo
+"""
+
+import streamlit as st
+
+# Board naming and storage live in the core; DEFAULT_BOARD is re-exported for the UI modules
+from src.core.boards import DEFAULT_BOARD, is_valid_board_id, board_paths
+
+def get_current_board_id():
+    """Returns the board selected with ?board=<name>, falling back to the default board."""
+    board_id = st.query_params.get("board", DEFAULT_BOARD).lower()
+
+    if not is_valid_board_id(board_id):
+        st.warning(f"Unknown board name '{board_id}', showing the default board.")
+        board_id = DEFAULT_BOARD
+
+    st.session_state["board_id"] = board_id
+    return board_id
+
+def get_session_board_paths():
+    """Returns the storage locations of the board this session is showing."""
+    return board_paths(st.session_state.get("board_id", DEFAULT_BOARD))
@@ -0,0 +1,230 @@
+"""
+broadcast.py
+----------------
+Author: Nida Anis
+Date: 18/10/2026
+----------------
+Description:
+-> Pushes board state to kiosk displays over WebSocket and Server-Sent Events
+"""
+
+import asyncio
+import json
+
+from datetime import timedelta
+
+import tornado.iostream
+import tornado.web
+import tornado.websocket
+
+from src import clock
+from src.core.change_feed import subscribe
+from src.core.boards import DEFAULT_BOARD, is_valid_board_id
+from src.core.queries import get_board_state, get_next_transition
+from src.core.store import get_cached_events
+
+# How often the store version is checked for edits made by other processes
+STORE_POLL_SECONDS = 1.0
+# Delay after a transition so the boundary comparison has flipped
+TRANSITION_MARGIN = timedelta(milliseconds=50)
+
+class BroadcastHub:
+    """
+    Computes the board state once per transition and fans it out to clients.
+
+    The state is recomputed only when an event starts or ends or the store
+    changes, then serialised once and written to every subscriber, so server
+    work per transition does not grow with the number of screens.
+
+    refresh_count counts every recomputation (each poll, transition and
+    store change); broadcast_count only those that changed the state.
+    """
+
+    def __init__(self, board_id=DEFAULT_BOARD):
+        self.board_id = board_id
+        self.clients = set()
+        self.payload = None
+        self.state_key = None
+        self.refresh_count = 0
+        self.broadcast_count = 0
+        self.wake = None
+        self.task = None
+        self.loop = None
+        self.unsubscribe = None
+
+    def start(self):
+        """Start the hub loop on the current event loop."""
+        self.wake = asyncio.Event()
+        self.loop = asyncio.get_event_loop()
+        self.task = self.loop.create_task(self.run())
+
+        # Saves in this process push a refresh straight away instead of waiting for the poll
+        self.unsubscribe = subscribe(self.on_change, self.board_id)
+
+    def stop(self):
+        if self.unsubscribe is not None:
+            self.unsubscribe()
+            self.unsubscribe = None
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+
+    def on_change(self, change):
+        """Change feed subscriber; runs on the saving thread, so hand over to the hub's loop."""
+        self.loop.call_soon_threadsafe(self.notify)
+
+    def add_client(self, client):
+        """Register a client and send it the latest state straight away."""
+        self.clients.add(client)
+        if self.payload is not None:
+            client.send_payload(self.payload)
+
+    def remove_client(self, client):
+        self.clients.discard(client)
+
+    def notify(self):
+        """Wake the hub early, e.g. after a known store change."""
+        if self.wake is not None:
+            self.wake.set()
+
+    def refresh(self, now=None):
+        """
+        Recompute the state and broadcast it if it changed.
+
+        Returns:
+        -> The next transition datetime, or None if there is none
+        """
+        now = now or clock.now()
+        self.refresh_count += 1
+        version, events = get_cached_events(self.board_id)
+        state = get_board_state(events, now)
+
+        state_key = (
+            version,
+            state["current_event"]["start"] if state["current_event"] else None,
+            state["next_event"]["start"] if state["next_event"] else None
+        )
+
+        if state_key != self.state_key:
+            self.broadcast_count += 1
+            self.state_key = state_key
+            state["version"] = version
+            self.payload = json.dumps(state)
+            self.broadcast(self.payload)
+
+        return get_next_transition(events, now)
+
+    def broadcast(self, payload):
+        """Write an already serialised payload to every connected client."""
+        for client in list(self.clients):
+            client.send_payload(payload)
+
+    async def run(self):
+        """Sleep until the next transition or store poll, then refresh."""
+        while True:
+            now = clock.now()
+            next_transition = self.refresh(now)
+
+            timeout = STORE_POLL_SECONDS
+            if next_transition is not None:
+                timeout = min(timeout, clock.real_seconds_until(next_transition + TRANSITION_MARGIN, now))
+
+            try:
+                await asyncio.wait_for(self.wake.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            self.wake.clear()
+
+class HubRegistry:
+    """One hub per board with connected screens, created on first subscriber."""
+
+    def __init__(self):
+        self.hubs = {}
+
+    def subscribe(self, board_id, client):
+        """Attach a client to a board's hub, starting the hub if needed."""
+        hub = self.hubs.get(board_id)
+        if hub is None:
+            hub = BroadcastHub(board_id)
+            hub.start()
+            self.hubs[board_id] = hub
+
+        hub.add_client(client)
+        return hub
+
+    def unsubscribe(self, hub, client):
+        """Detach a client, stopping its hub once no screens are left."""
+        hub.remove_client(client)
+        if not hub.clients and self.hubs.get(hub.board_id) is hub:
+            hub.stop()
+            del self.hubs[hub.board_id]
+
+def get_board_argument(handler):
+    """Reads and validates the ?board= argument of a request."""
+    board_id = handler.get_query_argument("board", DEFAULT_BOARD).lower()
+    if not is_valid_board_id(board_id):
+        raise tornado.web.HTTPError(400, reason=f"Invalid board name: {board_id}")
+    return board_id
+
+class BoardSocketHandler(tornado.websocket.WebSocketHandler):
+    """WebSocket /ws/board -> board state pushed on every change."""
+
+    def initialize(self, hubs):
+        self.hubs = hubs
+        self.hub = None
+
+    def check_origin(self, origin):
+        # Kiosk pages may be served from a different host or a local file
+        return True
+
+    def prepare(self):
+        self.board_id = get_board_argument(self)
+
+    def open(self):
+        self.hub = self.hubs.subscribe(self.board_id, self)
+
+    def on_close(self):
+        if self.hub is not None:
+            self.hubs.unsubscribe(self.hub, self)
+            self.hub = None
+
+    def send_payload(self, payload):
+        try:
+            self.write_message(payload)
+        except tornado.websocket.WebSocketClosedError:
+            self.on_close()
+
+class BoardStreamHandler(tornado.web.RequestHandler):
+    """Server-Sent Events /sse/board -> board state pushed on every change."""
+
+    def initialize(self, hubs):
+        self.hubs = hubs
+        self.hub = None
+        self.closed = None
+
+    async def get(self):
+        board_id = get_board_argument(self)
+
+        self.set_header("Content-Type", "text/event-stream")
+        self.set_header("Cache-Control", "no-cache")
+        self.set_header("Access-Control-Allow-Origin", "*")
+
+        self.closed = asyncio.Event()
+        self.hub = self.hubs.subscribe(board_id, self)
+
+        # Keep the response open until the client disconnects
+        await self.closed.wait()
+
+    def on_connection_close(self):
+        if self.hub is not None:
+            self.hubs.unsubscribe(self.hub, self)
+            self.hub = None
+        if self.closed is not None:
+            self.closed.set()
+
+    def send_payload(self, payload):
+        try:
+            self.write(f"data: {payload}\n\n")
+            self.flush()
+        except tornado.iostream.StreamClosedError:
+            self.on_connection_close()
@@ -0,0 +1,100 @@
+"""
+bulk_operations.py
+----------------
+Author: Nida Anis
+Date: 19/10/2026
+----------------
+Description:
+-> Bulk event operations applied as a single mutation
+"""
+
+from datetime import datetime, timedelta
+
+from src.core.boards import DEFAULT_BOARD
+from src.core.model import new_event_id
+from src.core.store import get_board, save_board_events
+
+# Calendar sync fields; a copy belongs to the board, not to the calendar it came from
+SYNC_FIELDS = ("uid", "sequence", "source")
+
+def select_event_ids(events, event_ids=None, start=None, end=None):
+    """
+    Returns the IDs of events matching a selection.
+
+    Args:
+    -> events: List of event dictionaries
+    -> event_ids: Optional iterable of IDs to select
+    -> start: Optional datetime; only events starting at or after it
+    -> end: Optional datetime; only events starting before it
+
+    Returns:
+    -> Set of selected event IDs
+    """
+    wanted = set(event_ids) if event_ids is not None else None
+
+    return {
+        event["id"] for event in events
+        if (wanted is None or event["id"] in wanted)
+        and (start is None or event["start"] >= start)
+        and (end is None or event["start"] < end)
+    }
+
+def delete_events(events, event_ids):
+    """Returns the events without the given IDs."""
+    event_ids = set(event_ids)
+    return [event for event in events if event["id"] not in event_ids]
+
+def shift_events(events, event_ids, minutes):
+    """Returns the events with the given IDs moved by a number of minutes (may be negative)."""
+    event_ids = set(event_ids)
+    offset = timedelta(minutes=minutes)
+
+    return [
+        {**event, "start": event["start"] + offset, "end": event["end"] + offset}
+        if event["id"] in event_ids else event
+        for event in events
+    ]
+
+def set_duration(events, event_ids, minutes):
+    """Returns the events with the given IDs changed to a new duration in minutes."""
+    event_ids = set(event_ids)
+
+    return [
+        {**event, "end": event["start"] + timedelta(minutes=minutes), "duration": minutes}
+        if event["id"] in event_ids else event
+        for event in events
+    ]
+
+def duplicate_day(events, source_date, target_date):
+    """Returns the events plus copies of every event on source_date moved to target_date."""
+    offset = datetime.combine(target_date, datetime.min.time()) - datetime.combine(source_date, datetime.min.time())
+
+    copies = []
+    for event in events:
+        if event["start"].date() != source_date:
+            continue
+
+        copy = {key: value for key, value in event.items() if key not in SYNC_FIELDS}
+        copy.update(id=new_event_id(), start=event["start"] + offset, end=event["end"] + offset)
+        copies.append(copy)
+
+    return events + copies
+
+def apply_to_board(operation, *args, board_id=DEFAULT_BOARD, **kwargs):
+    """
+    Apply a bulk operation to a stored board with a single write, without Streamlit.
+
+    Example:
+    -> apply_to_board(shift_events, ids, 30, board_id="room-1")
+
+    Args:
+    -> operation: One of the operations in this module
+    -> board_id: Board slug
+
+    Returns:
+    -> The board's new list of events
+    """
+    events = [event.copy() for event in get_board(board_id)["events"]]
+    events = operation(events, *args, **kwargs)
+    save_board_events(board_id, events)
+    return events
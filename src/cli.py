@@ -0,0 +1,225 @@
+"""
+cli.py
+----------------
+Author: Nida Anis
+Date: 19/10/2026
+----------------
+Description:
+-> countdown: batch import/export, pruning and reports without starting a server
+
+Usage:
+-> python -m src.cli boards
+-> python -m src.cli import schedule.ics --board room-1
+-> python -m src.cli export --board room-1 --output events.json
+-> python -m src.cli prune --before 2026-10-01T00:00
+-> python -m src.cli report --board room-1 --json
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from collections import Counter
+from datetime import datetime
+
+from src import clock
+from src.core.archive import list_partitions
+from src.core.boards import DEFAULT_BOARD, board_paths, list_board_ids
+from src.core.model import new_event_id, parse_event, serialise_event
+from src.core.persistence import write_events
+from src.core.queries import get_current_and_next_event
+from src.core.store import get_board, get_persister, prune_board, save_board_events
+
+def parse_datetime(value):
+    """argparse type for ISO datetimes."""
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid datetime: {value}")
+
+def read_events_file(file_path):
+    """
+    Read events from a JSON export or an .ics calendar.
+
+    Events stored without an ID come back with "id" None rather than a new
+    random one, so merge_events can match them on a stable key instead.
+    """
+    if file_path.lower().endswith(".ics"):
+        # Only needed for calendars, and it pulls in watchdog
+        from src.ics_sync import parse_ics_file
+        return list(parse_ics_file(file_path).values())
+
+    with open(file_path, "r") as f:
+        raw_events = json.load(f)
+
+    events = []
+    for raw_event in raw_events:
+        event_id = raw_event.get("id") or None
+        events.append({**parse_event(raw_event), "id": event_id})
+
+    return events
+
+def stable_key(event):
+    """Identity of an event across reads of a file without IDs: its ICS UID, or its name, start and end."""
+    return event.get("uid") or (event["name"], event["start"], event["end"])
+
+def merge_events(events, incoming):
+    """
+    Merge imported events into a board's events.
+
+    Events are matched by ID, or by stable_key when the import has no ID
+    for them, so importing the same file twice adds nothing the second time.
+
+    Returns:
+    -> Tuple of (merged events, number added, number updated)
+    """
+    merged = {event["id"]: event for event in events}
+    ids_by_key = {stable_key(event): event["id"] for event in events}
+    added = updated = 0
+
+    for event in incoming:
+        event_id = event["id"] or ids_by_key.get(stable_key(event))
+
+        if event_id in merged:
+            event = {**event, "id": event_id}
+            updated += merged[event_id] != event
+        else:
+            event = {**event, "id": event_id or new_event_id()}
+            ids_by_key.setdefault(stable_key(event), event["id"])
+            added += 1
+        merged[event["id"]] = event
+
+    return list(merged.values()), added, updated
+
+def build_report(board_id, now):
+    """Summary of a board: event counts, what is on now and next, and its busiest day."""
+    events = get_board(board_id)["events"]
+    current_event, next_event = get_current_and_next_event(events, now)
+    days = Counter(event["start"].date().isoformat() for event in events)
+    busiest_day, busiest_count = days.most_common(1)[0] if days else (None, 0)
+
+    return {
+        "board": board_id,
+        "now": now.isoformat(timespec="seconds"),
+        "events": len(events),
+        "upcoming": sum(1 for event in events if event["start"] > now),
+        "finished": sum(1 for event in events if event["end"] <= now),
+        "current_event": serialise_event(current_event) if current_event else None,
+        "next_event": serialise_event(next_event) if next_event else None,
+        "first_start": events[0]["start"].isoformat() if events else None,
+        "last_end": max(event["end"] for event in events).isoformat() if events else None,
+        "busiest_day": busiest_day,
+        "busiest_day_events": busiest_count,
+        "archive_partitions": len(list_partitions(board_paths(board_id)["archive_dir"]))
+    }
+
+def command_boards(args):
+    for board_id in list_board_ids():
+        print(f"{board_id:<24} {len(get_board(board_id)['events']):>8} events")
+
+def command_import(args):
+    incoming = read_events_file(args.file)
+
+    if args.replace:
+        events, added, updated = merge_events([], incoming)
+    else:
+        events, added, updated = merge_events(get_board(args.board)["events"], incoming)
+
+    save_board_events(args.board, events)
+    print(f"Imported {len(incoming)} events into {args.board}: {added} added, {updated} updated")
+
+def command_export(args):
+    events = get_board(args.board)["events"]
+    if args.start:
+        events = [event for event in events if event["end"] >= args.start]
+    if args.end:
+        events = [event for event in events if event["start"] <= args.end]
+
+    if args.output in (None, "-"):
+        json.dump([serialise_event(event) for event in events], sys.stdout, indent=2)
+        print()
+        return
+
+    directory = os.path.dirname(args.output)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    write_events(args.output, events)
+    print(f"Exported {len(events)} events from {args.board} to {args.output}", file=sys.stderr)
+
+def command_prune(args):
+    pruned = prune_board(args.board, args.before or clock.now(), archive=not args.no_archive)
+    action = "Removed" if args.no_archive else "Archived"
+    print(f"{action} {pruned} finished events from {args.board}")
+
+def command_report(args):
+    report = build_report(args.board, clock.now())
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"Board:           {report['board']}")
+    print(f"Events:          {report['events']} ({report['upcoming']} upcoming, {report['finished']} finished)")
+    print(f"Active now:      {report['current_event']['name'] if report['current_event'] else '-'}")
+    next_event = report["next_event"]
+    print(f"Next event:      {next_event['name'] + ' at ' + next_event['start'] if next_event else '-'}")
+    print(f"Range:           {report['first_start'] or '-'} to {report['last_end'] or '-'}")
+    print(f"Busiest day:     {report['busiest_day'] or '-'} ({report['busiest_day_events']} events)")
+    print(f"Archived months: {report['archive_partitions']}")
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="countdown", description="Manage Countdown Timer Pro boards from the command line")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    boards = commands.add_parser("boards", help="List boards and their event counts")
+    boards.set_defaults(func=command_boards)
+
+    import_parser = commands.add_parser("import", help="Import events from a JSON export or .ics file")
+    import_parser.add_argument("file")
+    import_parser.add_argument("--board", default=DEFAULT_BOARD)
+    import_parser.add_argument("--replace", action="store_true", help="Replace the board's events instead of merging them")
+    import_parser.set_defaults(func=command_import)
+
+    export = commands.add_parser("export", help="Export events as JSON")
+    export.add_argument("--board", default=DEFAULT_BOARD)
+    export.add_argument("--output", help="File to write (default: stdout)")
+    export.add_argument("--start", type=parse_datetime, help="Only events ending at or after this ISO datetime")
+    export.add_argument("--end", type=parse_datetime, help="Only events starting at or before this ISO datetime")
+    export.set_defaults(func=command_export)
+
+    prune = commands.add_parser("prune", help="Move finished events into the monthly archive")
+    prune.add_argument("--board", default=DEFAULT_BOARD)
+    prune.add_argument("--before", type=parse_datetime, help="Prune events ended by this ISO datetime (default: now)")
+    prune.add_argument("--no-archive", action="store_true", help="Drop finished events instead of archiving them")
+    prune.set_defaults(func=command_prune)
+
+    report = commands.add_parser("report", help="Summarise a board")
+    report.add_argument("--board", default=DEFAULT_BOARD)
+    report.add_argument("--json", action="store_true", help="Print the report as JSON")
+    report.set_defaults(func=command_report)
+
+    return parser
+
+def main():
+    parser = build_parser()
+    args = parser.parse_args()
+
+    try:
+        args.func(args)
+    except (OSError, ValueError) as e:
+        parser.exit(1, f"countdown: error: {e}\n")
+    finally:
+        # Saves are written behind; make sure they reach disk before exiting
+        persister = get_persister()
+        persister.flush()
+
+        failures = persister.get_failures()
+        if failures:
+            parser.exit(1, "".join(
+                f"countdown: error: could not save board {board_id}: {failure['error']}\n"
+                for board_id, failure in failures.items()
+            ))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+clock.py
+----------------
+Author: Nida Anis
+Date: 19/10/2026
+----------------
+Description:
+-> Pluggable time source used by every time-dependent function
+"""
+
+import threading
+import time
+
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+class SystemClock:
+    """The real wall clock."""
+
+    speed = 1.0
+
+    def now(self):
+        return datetime.now()
+
+class ReplayClock:
+    """
+    A clock that starts at a chosen moment and runs N times faster than real time.
+
+    Args:
+    -> start: Datetime the clock shows when created
+    -> speed: How many simulated seconds pass per real second
+    """
+
+    def __init__(self, start, speed=1.0):
+        self.lock = threading.Lock()
+        self.start = start
+        self.speed = float(speed)
+        self.real_start = time.monotonic()
+
+    def now(self):
+        with self.lock:
+            elapsed = time.monotonic() - self.real_start
+            return self.start + timedelta(seconds=elapsed * self.speed)
+
+    def jump(self, moment):
+        """Move the clock to a moment; it keeps running at the same speed from there."""
+        with self.lock:
+            self.start = moment
+            self.real_start = time.monotonic()
+
+class ManualClock:
+    """A stopped clock that only moves when told to, for stepping through a schedule."""
+
+    # Nothing moves on its own, so waits should not be scaled
+    speed = 1.0
+
+    def __init__(self, start):
+        self.moment = start
+
+    def now(self):
+        return self.moment
+
+    def jump(self, moment):
+        self.moment = moment
+
+    def advance(self, delta):
+        self.moment += delta
+
+_source = SystemClock()
+
+def now():
+    """Current time according to the active time source."""
+    return _source.now()
+
+def get_time_source():
+    return _source
+
+def set_time_source(source):
+    """Replace the process-wide time source, e.g. with a ReplayClock."""
+    global _source
+    _source = source
+
+def reset_time_source():
+    set_time_source(SystemClock())
+
+@contextmanager
+def use_time_source(source):
+    """Temporarily use another time source."""
+    previous = _source
+    set_time_source(source)
+    try:
+        yield source
+    finally:
+        set_time_source(previous)
+
+def real_seconds_until(moment, reference=None):
+    """Real seconds to wait until the active clock reaches a moment."""
+    reference = reference or now()
+    return max(0.0, (moment - reference).total_seconds() / _source.speed)
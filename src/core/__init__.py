@@ -0,0 +1,11 @@
+"""
+core
+----------------
+Author: Nida Anis
+Date: 19/10/2026
+----------------
+Description:
+-> Streamlit-free engine: event model, queries, board store, persistence, write-behind
+   saving, change feed, archive and themes.
+   The Streamlit UI, the API and the countdown CLI are thin layers on top of it.
+"""
@@ -0,0 +1,107 @@
+"""
+archive.py
+----------------
+Author: Nida Anis
+Date: 18/10/2026
+----------------
+Description:
+-> Archives finished events into compressed monthly partitions
+"""
+
+import gzip
+import json
+import os
+
+from src.core.model import serialise_event, parse_event
+
+ARCHIVE_DIR = os.path.join("data", "archive")
+PARTITION_FORMAT = "%Y-%m"
+PARTITION_SUFFIX = ".jsonl.gz"
+
+def partition_key(event):
+    """Returns the monthly partition key (YYYY-MM) an event belongs to."""
+    return event["end"].strftime(PARTITION_FORMAT)
+
+def partition_path(key, archive_dir=ARCHIVE_DIR):
+    """Returns the file path of a monthly partition."""
+    return os.path.join(archive_dir, f"{key}{PARTITION_SUFFIX}")
+
+def archive_events(events, archive_dir=ARCHIVE_DIR):
+    """
+    Appends finished events to their monthly archive partitions.
+
+    Appends to one archive are not safe to run concurrently; boards are
+    archived through prune_board, which takes the board's prune lock.
+
+    Args:
+    -> events: List of event dictionaries with datetime start/end values
+    -> archive_dir: Directory holding the partitions
+
+    Returns:
+    -> Number of events written
+    """
+    if not events:
+        return 0
+
+    os.makedirs(archive_dir, exist_ok=True)
+
+    # Group by month so each partition is opened once
+    partitions = {}
+    for event in events:
+        partitions.setdefault(partition_key(event), []).append(event)
+
+    for key, partition_events in partitions.items():
+        # Appending to a gzip file adds a new member, which readers handle transparently
+        with gzip.open(partition_path(key, archive_dir), "at", encoding="utf-8") as f:
+            for event in partition_events:
+                f.write(json.dumps(serialise_event(event)) + "\n")
+
+    return len(events)
+
+def list_partitions(archive_dir=ARCHIVE_DIR):
+    """Returns the sorted partition keys available in the archive."""
+    if not os.path.isdir(archive_dir):
+        return []
+
+    return sorted(
+        name[:-len(PARTITION_SUFFIX)]
+        for name in os.listdir(archive_dir)
+        if name.endswith(PARTITION_SUFFIX)
+    )
+
+def query_archive(start=None, end=None, archive_dir=ARCHIVE_DIR):
+    """
+    Lazily yields archived events overlapping a time window.
+
+    Only the partitions covering the window are opened, and events are
+    decoded one line at a time so history never has to fit in memory.
+
+    Args:
+    -> start: Optional datetime lower bound (events ending before it are skipped)
+    -> end: Optional datetime upper bound (events starting after it are skipped)
+    -> archive_dir: Directory holding the partitions
+
+    Returns:
+    -> Generator of event dictionaries with datetime start/end values
+    """
+    start_key = start.strftime(PARTITION_FORMAT) if start else None
+
+    for key in list_partitions(archive_dir):
+        # Events are partitioned by end time, so later partitions may still
+        # hold events that started inside the window
+        if start_key and key < start_key:
+            continue
+
+        with gzip.open(partition_path(key, archive_dir), "rt", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+
+                event = parse_event(json.loads(line))
+
+                if start and event["end"] < start:
+                    continue
+                if end and event["start"] > end:
+                    continue
+
+                yield event
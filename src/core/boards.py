@@ -0,0 +1,67 @@
+"""
+boards.py
+----------------
+Author: Nida Anis
+Date: 19/10/2026
+----------------
+Description:
+-> Named boards and where each one keeps its files
+"""
+
+import os
+import re
+
+DEFAULT_BOARD = "default"
+BOARD_ID_PATTERN = re.compile(r"^[a-z0-9][a-z0-9_-]{0,63}$")
+
+# Relative to the working directory unless configured, e.g. for benchmarks
+DATA_DIR = os.environ.get("COUNTDOWN_DATA_DIR", "data")
+ASSETS_DIR = os.environ.get("COUNTDOWN_ASSETS_DIR", "assets")
+
+def is_valid_board_id(board_id):
+    """Board IDs are lowercase slugs so they are safe to use as directory names."""
+    return bool(board_id) and BOARD_ID_PATTERN.match(board_id) is not None
+
+def board_paths(board_id=DEFAULT_BOARD):
+    """
+    Returns the storage locations for a board.
+
+    The default board keeps the original data/ and assets/ layout so existing
+    installs carry on working; other boards are sharded into their own folders.
+
+    Args:
+    -> board_id: Board slug
+
+    Returns:
+    -> Dictionary of data_dir, events_file (JSON), snapshot_file (Arrow),
+       settings_file, themes_file, archive_dir and logo_dir
+    """
+    if not is_valid_board_id(board_id):
+        raise ValueError(f"Invalid board name: {board_id!r}")
+
+    if board_id == DEFAULT_BOARD:
+        data_dir = DATA_DIR
+        logo_dir = ASSETS_DIR
+    else:
+        data_dir = os.path.join(DATA_DIR, "boards", board_id)
+        logo_dir = os.path.join(ASSETS_DIR, "boards", board_id)
+
+    return {
+        "data_dir": data_dir,
+        "events_file": os.path.join(data_dir, "events.json"),
+        "snapshot_file": os.path.join(data_dir, "events.arrow"),
+        "settings_file": os.path.join(data_dir, "settings.json"),
+        "themes_file": os.path.join(data_dir, "themes.json"),
+        "archive_dir": os.path.join(data_dir, "archive"),
+        "logo_dir": logo_dir
+    }
+
+def list_board_ids(data_dir=DATA_DIR):
+    """Returns the default board followed by every other board stored on disk."""
+    board_ids = [DEFAULT_BOARD]
+    boards_dir = os.path.join(data_dir, "boards")
+
+    if os.path.isdir(boards_dir):
+        board_ids += sorted(name for name in os.listdir(boards_dir) if is_valid_board_id(name))
+
+    return board_ids
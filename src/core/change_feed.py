@@ -0,0 +1,170 @@
+"""
+change_feed.py
+----------------
+Author: Nida Anis
+Date: 19/10/2026
+----------------
+Description:
+-> Publishes what changed in a board's events so consumers can apply deltas
+"""
+
+import itertools
+import logging
+import threading
+
+from collections import deque
+
+ADDED = "added"
+UPDATED = "updated"
+REMOVED = "removed"
+BULK = "bulk"
+
+# Recent changes kept for consumers that poll with changes_since
+FEED_HISTORY = 1000
+
+logger = logging.getLogger(__name__)
+
+def event_key(event):
+    """Identity of an event across saves; events without an ID fall back to name and start."""
+    return event.get("id") or (event["name"], event["start"])
+
+def diff_events(previous_events, events):
+    """
+    Compare two versions of a board's events.
+
+    Returns:
+    -> List of (kind, event, previous event) tuples, where kind is ADDED,
+       UPDATED or REMOVED and the missing side is None
+    """
+    previous_by_key = {event_key(event): event for event in previous_events}
+    changes = []
+
+    for event in events:
+        previous = previous_by_key.pop(event_key(event), None)
+        if previous is None:
+            changes.append((ADDED, event, None))
+        elif previous != event:
+            changes.append((UPDATED, event, previous))
+
+    changes.extend((REMOVED, None, previous) for previous in previous_by_key.values())
+    return changes
+
+class ChangeFeed:
+    """
+    Versioned stream of event changes for every board in the process.
+
+    Each save that changes a board is published once. A single change is
+    delivered as an ADDED, UPDATED or REMOVED change; several at once as one
+    BULK change listing them. Every change carries:
+
+    -> kind, board_id and version (increasing by one per published change)
+    -> event / previous: the event after and before the change (single changes)
+    -> changes: list of single changes (BULK), or None if the previous
+       events were unknown and consumers should rebuild from "events"
+    -> events: the board's complete event list after the change
+
+    Subscribers are called on the publishing thread, so they must be quick
+    and must not modify the events.
+    """
+
+    def __init__(self, history=FEED_HISTORY):
+        self.lock = threading.RLock()
+        self.version = 0
+        self.board_versions = {}
+        self.subscribers = {}
+        self.subscriber_ids = itertools.count()
+        self.history = deque(maxlen=history)
+
+    def subscribe(self, callback, board_id=None):
+        """
+        Call back with every change, or only those of one board.
+
+        Returns:
+        -> A function that cancels the subscription
+        """
+        with self.lock:
+            subscriber_id = next(self.subscriber_ids)
+            self.subscribers[subscriber_id] = (board_id, callback)
+
+        def unsubscribe():
+            with self.lock:
+                self.subscribers.pop(subscriber_id, None)
+
+        return unsubscribe
+
+    def publish(self, board_id, previous_events, events):
+        """
+        Publish the difference between a board's previous and new events.
+
+        Args:
+        -> board_id: Board slug
+        -> previous_events: Events before the save, or None if unknown
+        -> events: Complete new list of events
+
+        Returns:
+        -> The published change, or None if nothing changed
+        """
+        if previous_events is None:
+            changes = None
+        else:
+            changes = diff_events(previous_events, events)
+            if not changes:
+                return None
+
+        with self.lock:
+            self.version += 1
+            self.board_versions[board_id] = self.version
+
+            change = {"board_id": board_id, "version": self.version, "events": events}
+            if changes is not None and len(changes) == 1:
+                kind, event, previous = changes[0]
+                change.update(kind=kind, event=event, previous=previous)
+            else:
+                change.update(kind=BULK, changes=changes)
+
+            self.history.append(change)
+
+            # Delivered under the lock so every subscriber sees versions in order
+            for subscribed_board, callback in list(self.subscribers.values()):
+                if subscribed_board is None or subscribed_board == board_id:
+                    try:
+                        callback(change)
+                    except Exception:
+                        logger.exception("Change feed subscriber failed")
+
+        return change
+
+    def get_version(self, board_id=None):
+        """Latest published version, overall or for one board (0 if none yet)."""
+        with self.lock:
+            if board_id is None:
+                return self.version
+            return self.board_versions.get(board_id, 0)
+
+    def changes_since(self, version, board_id=None):
+        """
+        Returns the changes published after a version, oldest first.
+
+        Returns None if some of them have already dropped out of the history,
+        in which case the caller has to rebuild from the full event list.
+        """
+        with self.lock:
+            if self.history and self.history[0]["version"] > version + 1:
+                return None
+
+            return [
+                change for change in self.history
+                if change["version"] > version and (board_id is None or change["board_id"] == board_id)
+            ]
+
+_feed = ChangeFeed()
+
+def get_feed():
+    """Returns the process-wide change feed."""
+    return _feed
+
+def subscribe(callback, board_id=None):
+    return _feed.subscribe(callback, board_id)
+
+def publish(board_id, previous_events, events):
+    return _feed.publish(board_id, previous_events, events)
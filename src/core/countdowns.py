@@ -0,0 +1,153 @@
+"""
+countdowns.py
+----------------
+Author: Nida Anis
+Date: 19/10/2026
+----------------
+Description:
+-> Batch countdown formatting with granularity-aware caching
+"""
+
+import threading
+
+from collections import OrderedDict
+from datetime import timedelta
+
+NOW = 0
+SECONDS = 1
+MINUTES = 2
+DAYS = 3
+
+# Seconds are only shown within the hour; days only for events a week or more away
+SECONDS_UNTIL = 60 * 60
+DAYS_FROM = 7 * 24 * 60 * 60
+# Distinct (granularity, value) strings kept; seconds alone need at most 3600
+FORMAT_CACHE_SIZE = 8192
+
+def quantise_remaining(remaining_us):
+    """Returns (granularity, value) for a remaining time in microseconds."""
+    if remaining_us <= 0:
+        return NOW, 0
+
+    remaining = remaining_us // 1_000_000
+    if remaining < SECONDS_UNTIL:
+        return SECONDS, remaining
+    if remaining < DAYS_FROM:
+        return MINUTES, remaining // 60
+    return DAYS, remaining // (24 * 60 * 60)
+
+def format_countdown(granularity, value):
+    """
+    Format one countdown from its granularity and value in that unit.
+
+    Returns "MM:SS" within the hour, "Hh MMm" within a day, "N days HHMM"
+    within a week and "N days" beyond that.
+    """
+    if granularity == NOW:
+        return "now"
+
+    if granularity == SECONDS:
+        minutes, seconds = divmod(value, 60)
+        return f"{minutes:02}:{seconds:02}"
+
+    if granularity == MINUTES:
+        days, remainder = divmod(value, 24 * 60)
+        hours, minutes = divmod(remainder, 60)
+        if days > 0:
+            return f"{days} days {hours:02}{minutes:02}"
+        # Not "HH:MM", which would read like the "MM:SS" shown within the hour
+        return f"{hours}h {minutes:02}m"
+
+    return f"{value} days"
+
+def format_remaining_time(remaining_time):
+    """Formats a single remaining timedelta the same way as the event list."""
+    return format_countdown(*quantise_remaining(remaining_time // timedelta(microseconds=1)))
+
+class CountdownService:
+    """
+    Formats the countdowns of many events at once from a single `now`.
+
+    Remaining times are computed as one NumPy array and reduced to the
+    coarsest unit worth showing, so an event days away yields the same
+    string on every rerun within a minute (or day) and its card does not
+    change. Formatted strings are cached by (granularity, value).
+    """
+
+    def __init__(self, cache_size=FORMAT_CACHE_SIZE):
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def quantise(self, starts, now):
+        """
+        Returns (granularity, value) arrays for start times in microseconds.
+
+        Args:
+        -> starts: Event start times as int64 microseconds (naive wall clock)
+        -> now: Reference datetime
+        """
+        # Imported here so the core package stays quick to import
+        import numpy as np
+        import pandas as pd
+
+        remaining_us = starts - pd.Timestamp(now).value // 1000
+        remaining = remaining_us // 1_000_000
+
+        granularity = np.select(
+            [remaining_us <= 0, remaining < SECONDS_UNTIL, remaining < DAYS_FROM],
+            [NOW, SECONDS, MINUTES],
+            default=DAYS
+        )
+        value = np.select(
+            [granularity == SECONDS, granularity == MINUTES, granularity == DAYS],
+            [remaining, remaining // 60, remaining // (24 * 60 * 60)],
+            default=0
+        )
+
+        return granularity, value
+
+    def format_events(self, events, now):
+        """
+        Countdown strings for a batch of events, in the same order.
+
+        Args:
+        -> events: Event dictionaries with datetime start values
+        -> now: The one reference time used for the whole batch
+        """
+        if not events:
+            return []
+
+        import pandas as pd
+
+        # pandas converts datetimes to int64 much faster than np.array
+        starts = pd.DatetimeIndex([event["start"] for event in events]).asi8 // 1000
+        granularity, value = self.quantise(starts, now)
+
+        strings = []
+        with self.lock:
+            for key in zip(granularity.tolist(), value.tolist()):
+                text = self.cache.get(key)
+                if text is None:
+                    self.misses += 1
+                    text = format_countdown(*key)
+                    self.cache[key] = text
+                    if len(self.cache) > self.cache_size:
+                        self.cache.popitem(last=False)
+                else:
+                    self.hits += 1
+                    self.cache.move_to_end(key)
+                strings.append(text)
+
+        return strings
+
+_service = CountdownService()
+
+def get_countdown_service():
+    """Returns the process-wide countdown service shared by every session."""
+    return _service
+
+def format_countdowns(events, now):
+    return _service.format_events(events, now)
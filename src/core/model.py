@@ -0,0 +1,53 @@
+"""
+model.py
+----------------
+Author: Nida Anis
+Date: 19/10/2026
+----------------
+Description:
+-> The event model: IDs, JSON conversion and splitting finished events off
+"""
+
+import uuid
+
+from datetime import datetime
+
+def new_event_id():
+    """Returns a new unique event ID."""
+    return uuid.uuid4().hex
+
+def serialise_event(event):
+    """Returns a JSON-safe copy of an event with ISO formatted start/end."""
+    event_copy = event.copy()
+    event_copy["start"] = event_copy["start"].isoformat()
+    event_copy["end"] = event_copy["end"].isoformat()
+    return event_copy
+
+def parse_event(event_data):
+    """Converts a stored event's ISO start/end strings back into datetimes (in place)."""
+    event_data["start"] = datetime.fromisoformat(event_data["start"])
+    event_data["end"] = datetime.fromisoformat(event_data["end"])
+
+    # Events saved before IDs existed get one on load
+    if not event_data.get("id"):
+        event_data["id"] = new_event_id()
+
+    return event_data
+
+def split_past_events(events, now):
+    """
+    Separates events that have finished from those still to come or running.
+
+    Returns:
+    -> Tuple of (upcoming_events, past_events), keeping the original order
+    """
+    upcoming_events = []
+    past_events = []
+
+    for event in events:
+        if event["end"] > now:
+            upcoming_events.append(event)
+        else:
+            past_events.append(event)
+
+    return upcoming_events, past_events
@@ -0,0 +1,93 @@
+"""
+persistence.py
+----------------
+Author: Nida Anis
+Date: 19/10/2026
+----------------
+Description:
+-> Reading and writing board files: Arrow snapshots, JSON settings and exports
+"""
+
+import json
+import os
+
+from src.core.boards import DATA_DIR
+from src.core.model import serialise_event, parse_event
+
+EVENTS_FILE = os.path.join(DATA_DIR, "events.json")
+SETTINGS_FILE = os.path.join(DATA_DIR, "settings.json")
+THEMES_FILE = os.path.join(DATA_DIR, "themes.json")
+
+def load_events(events_file=EVENTS_FILE):
+    """Load events from a JSON file (the import/export format) without touching session state."""
+    if not os.path.exists(events_file):
+        return []
+
+    with open(events_file, "r") as f:
+        return [parse_event(event) for event in json.load(f)]
+
+def load_json(file_path, default):
+    """Load a JSON file, returning the default if it does not exist."""
+    if not os.path.exists(file_path):
+        return default
+
+    with open(file_path, "r") as f:
+        return json.load(f)
+
+def get_store_version(events_file=EVENTS_FILE):
+    """
+    Returns an opaque version string for the persisted event store.
+
+    The version changes whenever the events file is rewritten, so it can be
+    used as a cache key or HTTP ETag by readers outside Streamlit.
+    """
+    try:
+        stat = os.stat(events_file)
+    except FileNotFoundError:
+        return "0"
+
+    return f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+
+def snapshot_is_current(paths):
+    """The Arrow snapshot is used unless a newer events.json has been dropped in."""
+    if not os.path.exists(paths["snapshot_file"]):
+        return False
+    if not os.path.exists(paths["events_file"]):
+        return True
+    return os.stat(paths["snapshot_file"]).st_mtime_ns >= os.stat(paths["events_file"]).st_mtime_ns
+
+def load_board_events(paths):
+    """Load a board's events from its Arrow snapshot, falling back to JSON."""
+    if snapshot_is_current(paths):
+        # pyarrow is only imported once a snapshot is read, so the core imports quickly
+        from src.arrow_store import load_snapshot_events
+        return load_snapshot_events(paths["snapshot_file"])
+    return load_events(paths["events_file"])
+
+def get_board_version(paths):
+    """Returns the combined version of a board's events, settings and themes files."""
+    events_version = f"{get_store_version(paths['snapshot_file'])}.{get_store_version(paths['events_file'])}"
+
+    return (
+        events_version,
+        get_store_version(paths["settings_file"]),
+        get_store_version(paths["themes_file"])
+    )
+
+def write_json_if_changed(file_path, data):
+    """Write JSON data to a file, skipping the write if the content is unchanged."""
+    content = json.dumps(data, indent=2)
+
+    if os.path.exists(file_path):
+        with open(file_path, "r") as f:
+            if f.read() == content:
+                return False
+
+    with open(file_path, "w") as f:
+        f.write(content)
+
+    return True
+
+def write_events(events_file, events):
+    """Write events to a JSON file (the import/export format), skipping the write if nothing changed."""
+    return write_json_if_changed(events_file, [serialise_event(event) for event in events])
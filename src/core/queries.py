@@ -0,0 +1,48 @@
+"""
+queries.py
+----------------
+Author: Nida Anis
+Date: 19/10/2026
+----------------
+Description:
+-> Active/next event and transition queries over a list of events
+"""
+
+from src.core.model import serialise_event
+
+def get_current_and_next_event(events, now):
+    """
+    Finds the active event and the next upcoming event.
+
+    Args:
+    -> events: List of event dictionaries with datetime start/end values
+    -> now: Reference datetime
+
+    Returns:
+    -> Tuple of (current_event, next_event), either of which may be None
+    """
+    sorted_events = sorted(events, key=lambda x: x["start"])
+
+    current_event = next((event for event in sorted_events if event["start"] <= now <= event["end"]), None)
+    next_event = next((event for event in sorted_events if event["start"] > now), None)
+
+    return current_event, next_event
+
+def get_next_transition(events, now):
+    """Returns the next datetime at which an event starts or ends, or None."""
+    upcoming = [
+        moment for event in events
+        for moment in (event["start"], event["end"])
+        if moment > now
+    ]
+    return min(upcoming, default=None)
+
+def get_board_state(events, now):
+    """Returns the clock state shown by display_clock as a JSON-safe dictionary."""
+    current_event, next_event = get_current_and_next_event(events, now)
+
+    return {
+        "now": now.isoformat(timespec="seconds"),
+        "current_event": serialise_event(current_event) if current_event else None,
+        "next_event": serialise_event(next_event) if next_event else None
+    }
@@ -0,0 +1,258 @@
+"""
+store.py
+----------------
+Author: Nida Anis
+Date: 19/10/2026
+----------------
+Description:
+-> Process-wide board store: shared cache, saves, change publishing and pruning
+"""
+
+import itertools
+import os
+import threading
+import time
+
+from collections import OrderedDict
+
+from src.core.archive import archive_events
+from src.core.boards import DEFAULT_BOARD, board_paths
+from src.core.change_feed import publish
+from src.core.model import split_past_events
+from src.core.persistence import (
+    load_json,
+    load_board_events,
+    snapshot_is_current,
+    get_board_version,
+    write_json_if_changed
+)
+from src.core.write_behind import WriteBehindPersister
+
+# Loaded boards shared by every session and API reader, least recently used first
+BOARD_CACHE_SIZE = 128
+BOARD_IDLE_SECONDS = 15 * 60
+_board_cache = OrderedDict()
+_board_lock = threading.Lock()
+# Numbers the versions of boards whose files have not been written yet
+_commit_counter = itertools.count(1)
+# One prune at a time per board, so finished events are archived exactly once
+_prune_locks = {}
+
+def write_board_entry(entry, events_changed=True):
+    """
+    Write a board entry to its files; runs on the write-behind thread.
+
+    Args:
+    -> entry: Board entry with board_id, events, settings and themes
+    -> events_changed: False if only the settings or themes need writing
+    """
+    board_id = entry["board_id"]
+    paths = board_paths(board_id)
+
+    os.makedirs(paths["data_dir"], exist_ok=True)
+    if events_changed or not snapshot_is_current(paths):
+        # Imported on first write so the core stays quick to import
+        from src.arrow_store import write_snapshot
+        write_snapshot(entry["events"], paths["snapshot_file"])
+
+    if entry["settings"]:
+        write_json_if_changed(paths["settings_file"], entry["settings"])
+    if entry["themes"]:
+        write_json_if_changed(paths["themes_file"], entry["themes"])
+
+    # The entry now matches the files, unless a newer save has replaced it
+    version = get_board_version(paths)
+    with _board_lock:
+        if _board_cache.get(board_id) is entry:
+            entry["version"] = version
+
+_persister = WriteBehindPersister(write_board_entry)
+
+def get_persister():
+    return _persister
+
+def get_save_failure(board_id=DEFAULT_BOARD):
+    """Returns why a board's latest changes are not on disk yet, or None (see WriteBehindPersister.get_failure)."""
+    return _persister.get_failure(board_id)
+
+def commit_board(entry, previous=None):
+    """
+    Make a board's new data visible to every reader now and queue its files to be written.
+
+    Args:
+    -> entry: New board entry with board_id, events sorted by start, settings and themes
+    -> previous: The entry it replaces, or None if unknown
+
+    Returns:
+    -> False if nothing changed, so nothing was queued
+    """
+    events_changed = previous is None or entry["events"] != previous["events"]
+    if not events_changed and entry["settings"] == previous["settings"] and entry["themes"] == previous["themes"]:
+        return False
+
+    board_id = entry["board_id"]
+    entry["version"] = (f"pending-{next(_commit_counter)}",) * 3
+    entry["last_access"] = time.monotonic()
+
+    # Queued before caching: if the write finishes first, the next read reloads the files
+    _persister.enqueue(entry, events_changed)
+    cache_board(entry)
+
+    # Published after caching so subscribers reading the board see the new events
+    if events_changed:
+        publish(board_id, previous["events"] if previous else None, entry["events"])
+
+    return True
+
+def save_board_events(board_id, events):
+    """
+    Save a board's events without a Streamlit session, e.g. from scripts.
+
+    Args:
+    -> board_id: Board slug
+    -> events: Complete new list of events for the board
+
+    Returns:
+    -> True if the events changed
+    """
+    # Settings and themes are untouched, so carry the cached copies over
+    entry = get_board(board_id)
+    sorted_events = sorted((event.copy() for event in events), key=lambda x: x["start"])
+
+    return commit_board({**entry, "events": sorted_events}, entry)
+
+def load_board(board_id, version):
+    """Read a board's files into a cache entry."""
+    paths = board_paths(board_id)
+
+    return {
+        "board_id": board_id,
+        "version": version,
+        "events": sorted(load_board_events(paths), key=lambda x: x["start"]),
+        "settings": load_json(paths["settings_file"], {}),
+        "themes": load_json(paths["themes_file"], {}),
+        "last_access": time.monotonic()
+    }
+
+def evict_idle_boards(now):
+    """Drop boards nobody has read for BOARD_IDLE_SECONDS; the caller holds _board_lock."""
+    # Least recently used first, so stop at the first board still in use
+    while _board_cache:
+        cached = next(iter(_board_cache.values()))
+        if now - cached["last_access"] <= BOARD_IDLE_SECONDS:
+            break
+        _board_cache.popitem(last=False)
+
+def cache_board(entry):
+    """Store a board entry as most recently used, evicting idle and excess boards."""
+    now = time.monotonic()
+
+    with _board_lock:
+        _board_cache[entry["board_id"]] = entry
+        _board_cache.move_to_end(entry["board_id"])
+        evict_idle_boards(now)
+
+        while len(_board_cache) > BOARD_CACHE_SIZE:
+            _board_cache.popitem(last=False)
+
+def get_board(board_id=DEFAULT_BOARD):
+    """
+    Returns a board's cached data, loading it on first access or after a change on disk.
+
+    Callers must treat the returned entry as read-only.
+    """
+    with _board_lock:
+        # Reads sweep too, so boards nobody edits any more are still released
+        evict_idle_boards(time.monotonic())
+        entry = _board_cache.get(board_id)
+        # The files lag behind a queued write, so the cached copy is the newer one
+        if entry is not None and _persister.is_pending(board_id):
+            entry["last_access"] = time.monotonic()
+            _board_cache.move_to_end(board_id)
+            return entry
+
+    # An evicted board with a write in progress has to reach disk before it is re-read
+    queued = _persister.get_queued(board_id)
+    if queued is None and _persister.is_pending(board_id):
+        _persister.flush()
+        queued = _persister.get_queued(board_id)
+
+    # Its files are behind (e.g. the write keeps failing), so the queued entry is the newer one
+    if queued is not None:
+        queued["last_access"] = time.monotonic()
+        cache_board(queued)
+        return queued
+
+    version = get_board_version(board_paths(board_id))
+
+    with _board_lock:
+        entry = _board_cache.get(board_id)
+        if entry is not None and entry["version"] == version:
+            entry["last_access"] = time.monotonic()
+            _board_cache.move_to_end(board_id)
+            return entry
+
+    # Parse outside the lock so a large board does not stall the others
+    entry = load_board(board_id, version)
+    cache_board(entry)
+    return entry
+
+def peek_board(board_id):
+    """Returns a board's cache entry if it is loaded, without loading or touching it."""
+    with _board_lock:
+        return _board_cache.get(board_id)
+
+def evict_board(board_id):
+    """Drop a board from memory; it is reloaded on next access."""
+    with _board_lock:
+        _board_cache.pop(board_id, None)
+
+def get_cached_events(board_id=DEFAULT_BOARD):
+    """
+    Returns (version, events) for readers outside Streamlit sessions.
+
+    Events are sorted by start time and shared process-wide, so callers must
+    treat the list as read-only.
+    """
+    entry = get_board(board_id)
+    return entry["version"][0], entry["events"]
+
+def delete_board_data(board_id=DEFAULT_BOARD):
+    """Remove a board's events, settings and themes files and drop it from memory."""
+    paths = board_paths(board_id)
+    _persister.cancel(board_id)
+
+    for key in ("events_file", "snapshot_file", "settings_file", "themes_file"):
+        if os.path.exists(paths[key]):
+            os.remove(paths[key])
+
+    cached = peek_board(board_id)
+    evict_board(board_id)
+    publish(board_id, cached["events"] if cached else None, [])
+
+def prune_board(board_id, now, archive=True):
+    """
+    Move a board's finished events into its monthly archive.
+
+    Args:
+    -> board_id: Board slug
+    -> now: Events that ended at or before this are pruned
+    -> archive: Write the pruned events to the archive rather than dropping them
+
+    Returns:
+    -> Number of events pruned
+    """
+    with _board_lock:
+        prune_lock = _prune_locks.setdefault(board_id, threading.Lock())
+
+    # Every session showing the board prunes it; only the first finds anything to archive
+    with prune_lock:
+        upcoming_events, past_events = split_past_events(get_board(board_id)["events"], now)
+        if not past_events:
+            return 0
+
+        if archive:
+            archive_events(past_events, board_paths(board_id)["archive_dir"])
+
+        save_board_events(board_id, upcoming_events)
+        return len(past_events)
@@ -0,0 +1,132 @@
+"""
+themes.py
+----------------
+Author: Nida Anis
+Date: 19/10/2026
+----------------
+Description:
+-> Built-in themes and compiling a theme into CSS
+"""
+
+# Define available themes
+DEFAULT_THEMES = {
+    "light": {
+        "name": "Light",
+        "description": "Clean light theme",
+        "primary_colour": "#4C78AF",
+        "secondary_colour": "#FFD700",
+        "background_colour": "#FFFFFF",
+        "text_colour": "#262730",
+        "font": "sans-serif",
+        "clock_background": "#F0F2F6",  # Light grey background for the clock in light mode
+        "clock_text": "#262730",         # Dark text for clock in light mode
+        "active_event_colour": "#FF8C00",  # Orange for active events
+        "next_event_colour": "#3B82F6"     # Blue for next events
+    },
+    "dark": {
+        "name": "Dark",
+        "description": "Dark theme for low light conditions",
+        "primary_colour": "#3B82F6",
+        "secondary_colour": "#F59E0B",
+        "background_colour": "#121212",
+        "text_colour": "#E5E7EB",
+        "font": "sans-serif",
+        "clock_background": "#1E1E1E",  # Dark grey background for clock in dark mode
+        "clock_text": "#FFFFFF",         # White text for clock in dark mode
+        "active_event_colour": "#F59E0B",  # Amber for active events
+        "next_event_colour": "#60A5FA"     # Light blue for next events
+    }
+}
+
+def adjust_brightness(hex_colour, amount):
+    """
+    Adjust the brightness of a hex colour.
+    
+    Args:
+    -> hex_colour: Hex colour code (e.g., '#FFFFFF')
+    -> amount: Amount to adjust (-100 to +100)
+
+    Returns:
+    -> Adjusted hex colour
+    """
+    # Convert hex to RGB
+    hex_colour = hex_colour.lstrip('#')
+    r, g, b = tuple(int(hex_colour[i:i+2], 16) for i in (0, 2, 4))
+    
+    # Adjust brightness
+    r = max(0, min(255, r + amount))
+    g = max(0, min(255, g + amount))
+    b = max(0, min(255, b + amount))
+
+    # Convert back into hex
+    return f"#{int(r):02x}{int(g):02x}{int(b):02x}"
+
+def build_theme_css(theme):
+    """Build the theme stylesheet, shared by the app and static board exports."""
+    return f"""
+        <style>
+            /* Base styles */
+            body {{
+                color: {theme["text_colour"]};
+                font-family: {theme["font"]};
+                background-color: {theme["background_colour"]};
+            }}
+
+            /* Headings */
+            h1, h2, h3, h4, h5, h6 {{
+                color: {theme["primary_colour"]};
+            }}
+
+            /* Links */
+            a {{
+                color: {theme["primary_colour"]};
+            }}
+
+            /* Buttons */
+            .stButton > button {{
+                background-color: {theme["primary_colour"]};
+                color: white;
+                border-radius: 8px;
+                font-weight: 500;
+                border: none;
+                transition: all 0.3s ease;
+            }}
+
+            .stButton > button:hover {{
+                background-color: {theme["secondary_colour"]};
+                color: {theme["text_colour"]};
+                transform: translateY(-2px);
+                box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+            }}
+
+            /* Input fields */
+            div[data-baseweb="input"] input {{
+                border-color: {theme["primary_colour"]};
+            }}
+
+            /* Sidebar */
+            [data-testid="stSidebar"] {{
+                background-color: {adjust_brightness(theme["background_colour"], -10)};
+            }}
+
+            /* Clock styles */
+            .clock-container {{
+                background-color: {theme["clock_background"]};
+                color: {theme["clock_text"]};
+            }}
+
+            .active-event {{
+                color: {theme["active_event_colour"]};
+            }}
+
+            .next-event {{
+                color: {theme["next_event_colour"]};
+            }}
+        </style>
+    """
+
+def resolve_theme(theme_id, custom_themes=None):
+    """Look up a theme outside a session: custom themes first, then defaults, then light."""
+    if custom_themes and theme_id in custom_themes:
+        return custom_themes[theme_id]
+    return DEFAULT_THEMES.get(theme_id, DEFAULT_THEMES["light"])
@@ -0,0 +1,296 @@
+"""
+write_behind.py
+----------------
+Author: Nida Anis
+Date: 19/10/2026
+----------------
+Description:
+-> Background writer that coalesces board saves off the rerun path
+"""
+
+import atexit
+import logging
+import threading
+import time
+
+from collections import Counter
+
+# Saves arriving within this window of the first queued one share a write
+COALESCE_SECONDS = 0.5
+# A failing write is retried after 0.5s, 1s, 2s ... up to a minute apart
+RETRY_BASE_SECONDS = 0.5
+RETRY_MAX_SECONDS = 60
+# After this many failures in a row a board is only written again on its next save or a flush
+MAX_WRITE_ATTEMPTS = 8
+
+logger = logging.getLogger(__name__)
+
+class WriteBehindPersister:
+    """
+    Writes boards to disk on a background thread.
+
+    Saving only queues the board's latest entry, replacing any entry still
+    waiting, so a burst of edits costs one write per board. Whatever is
+    queued is written at interpreter exit.
+
+    A failed write is retried with exponential backoff. After
+    max_attempts failures the board is held until its next save or a
+    flush, and get_failure reports the error so the UI can show it.
+
+    Listeners added with add_listener are called with the board ID after
+    each successful write, on the writing thread, so they must be quick.
+
+    Args:
+    -> write: Callable (entry, events_changed) that writes one board entry
+    -> window: Seconds to wait for further saves before writing
+    -> retry_base: Seconds before the first retry of a failed write, doubling each time
+    -> max_attempts: Failures in a row before automatic retries stop
+    """
+
+    def __init__(self, write, window=COALESCE_SECONDS, retry_base=RETRY_BASE_SECONDS, max_attempts=MAX_WRITE_ATTEMPTS):
+        self.write = write
+        self.window = window
+        self.retry_base = retry_base
+        self.max_attempts = max_attempts
+        self.condition = threading.Condition()
+        self.write_lock = threading.Lock()
+        self.pending = {}
+        # Boards whose last write failed: waiting for a retry, or given up on
+        self.retrying = {}
+        self.failed = {}
+        self.failures = {}
+        self.in_flight = Counter()
+        self.first_queued = None
+        self.thread = None
+        self.running = False
+        self.write_count = 0
+        self.listeners = []
+
+    def start(self):
+        """Start the writer thread and flush on exit."""
+        with self.condition:
+            if self.running:
+                return
+            self.running = True
+
+        self.thread = threading.Thread(target=self.run, name="countdown-persister", daemon=True)
+        self.thread.start()
+        atexit.register(self.stop)
+
+    def stop(self):
+        """Stop the writer thread after writing everything still queued."""
+        with self.condition:
+            self.running = False
+            self.condition.notify()
+
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        self.flush()
+
+    def enqueue(self, entry, events_changed=True):
+        """
+        Queue a board entry to be written.
+
+        Args:
+        -> entry: Board entry with board_id, events, settings and themes
+        -> events_changed: False if only the settings or themes need writing
+        """
+        if not self.running:
+            self.start()
+
+        with self.condition:
+            board_id = entry["board_id"]
+            if not self.pending:
+                self.first_queued = time.monotonic()
+
+            # A replaced entry's events must still be written if they had changed
+            _, pending_changed = self.pop_queued(board_id)
+            self.pending[board_id] = (entry, events_changed or pending_changed)
+            self.condition.notify()
+
+    def pop_queued(self, board_id):
+        """Remove a board's unwritten entry (called with the condition held); returns (entry, events_changed)."""
+        if board_id in self.retrying:
+            entry, events_changed, _ = self.retrying.pop(board_id)
+            return entry, events_changed
+        if board_id in self.failed:
+            return self.failed.pop(board_id)
+        return self.pending.pop(board_id, (None, False))
+
+    def get_queued(self, board_id):
+        """Returns a board's entry that has not been written yet, or None."""
+        with self.condition:
+            if board_id in self.pending:
+                return self.pending[board_id][0]
+            if board_id in self.retrying:
+                return self.retrying[board_id][0]
+            if board_id in self.failed:
+                return self.failed[board_id][0]
+            return None
+
+    def is_pending(self, board_id):
+        """True while a board has a write queued, in progress or failed, so its files are behind."""
+        with self.condition:
+            return (
+                board_id in self.pending
+                or board_id in self.retrying
+                or board_id in self.failed
+                or self.in_flight[board_id] > 0
+            )
+
+    def get_failure(self, board_id):
+        """
+        Returns why a board's files are behind, or None if its last write succeeded.
+
+        Returns:
+        -> Dictionary with attempts, error (message of the last failure) and
+           gave_up (True once automatic retries have stopped)
+        """
+        with self.condition:
+            failure = self.failures.get(board_id)
+            return dict(failure) if failure else None
+
+    def get_failures(self):
+        """Returns get_failure for every board whose last write failed."""
+        with self.condition:
+            return {board_id: dict(failure) for board_id, failure in self.failures.items()}
+
+    def add_listener(self, callback):
+        """
+        Call back with the board ID whenever a board has been written.
+
+        Returns:
+        -> A function that removes the listener
+        """
+        with self.condition:
+            self.listeners.append(callback)
+
+        def remove():
+            with self.condition:
+                if callback in self.listeners:
+                    self.listeners.remove(callback)
+
+        return remove
+
+    def cancel(self, board_id):
+        """Drop a board's queued write, waiting for one in progress to finish."""
+        with self.write_lock:
+            with self.condition:
+                self.pop_queued(board_id)
+                self.failures.pop(board_id, None)
+
+    def take_batch(self, everything=False):
+        """
+        Remove what is due and mark it in flight (called with the condition held).
+
+        Args:
+        -> everything: Also take saves still inside the window, retries not
+           yet due and boards that were given up on
+        """
+        now = time.monotonic()
+        batch = {}
+
+        if self.pending and (everything or now >= self.first_queued + self.window):
+            batch = self.pending
+            self.pending = {}
+
+        # A board is only ever in one of pending, retrying and failed
+        for board_id, (entry, events_changed, retry_at) in list(self.retrying.items()):
+            if everything or now >= retry_at:
+                batch[board_id] = (entry, events_changed)
+                del self.retrying[board_id]
+
+        if everything:
+            batch.update(self.failed)
+            self.failed = {}
+
+        self.in_flight.update(batch.keys())
+        return batch
+
+    def next_due(self):
+        """Monotonic time of the next window end or retry (called with the condition held)."""
+        due = [retry_at for _, _, retry_at in self.retrying.values()]
+        if self.pending:
+            due.append(self.first_queued + self.window)
+        return min(due, default=None)
+
+    def run(self):
+        """Wait for saves, let the window pass, then write the batch."""
+        while True:
+            with self.condition:
+                while self.running and self.next_due() is None:
+                    self.condition.wait()
+
+                # stop() flushes whatever is left on its own thread
+                if not self.running:
+                    return
+
+                delay = self.next_due() - time.monotonic()
+                if delay > 0:
+                    self.condition.wait(delay)
+                    continue
+
+                batch = self.take_batch()
+
+            self.write_batch(batch)
+
+    def flush(self):
+        """Write everything queued now, on the calling thread, including boards given up on."""
+        with self.condition:
+            batch = self.take_batch(everything=True)
+        self.write_batch(batch)
+
+    def record_failure(self, board_id, entry, events_changed, error):
+        """Count a failed write and hold the entry for a retry (called with the condition held)."""
+        attempts = self.failures.get(board_id, {}).get("attempts", 0) + 1
+        gave_up = attempts >= self.max_attempts
+        self.failures[board_id] = {"attempts": attempts, "error": str(error), "gave_up": gave_up}
+
+        if attempts == 1:
+            logger.error("Could not write board %s", board_id, exc_info=error)
+        elif gave_up:
+            logger.error("Could not write board %s after %d attempts, retrying on its next save: %s", board_id, attempts, error)
+        else:
+            logger.warning("Could not write board %s (attempt %d): %s", board_id, attempts, error)
+
+        # A newer save replaces the data and is written on its own schedule
+        if board_id in self.pending:
+            return
+
+        if gave_up or not self.running:
+            self.failed[board_id] = (entry, events_changed)
+        else:
+            delay = min(RETRY_MAX_SECONDS, self.retry_base * 2 ** (attempts - 1))
+            self.retrying[board_id] = (entry, events_changed, time.monotonic() + delay)
+            self.condition.notify()
+
+    def write_batch(self, batch):
+        written = []
+
+        with self.write_lock:
+            for board_id, (entry, events_changed) in batch.items():
+                try:
+                    self.write(entry, events_changed)
+                    self.write_count += 1
+                except Exception as e:
+                    with self.condition:
+                        self.record_failure(board_id, entry, events_changed, e)
+                else:
+                    written.append(board_id)
+                    with self.condition:
+                        self.failures.pop(board_id, None)
+
+            with self.condition:
+                for board_id in batch:
+                    self.in_flight[board_id] -= 1
+                    if not self.in_flight[board_id]:
+                        del self.in_flight[board_id]
+                listeners = list(self.listeners)
+
+        for board_id in written:
+            for callback in listeners:
+                try:
+                    callback(board_id)
+                except Exception:
+                    logger.exception("Write listener failed")
@@ -1,4 +1,3 @@
-
 """
 database.py
 ----------------
@@ -10,100 +9,88 @@ Description:
 """
 
 import streamlit as st
-import json
 import os
-from datetime import datetime
+
+from src.boards import DEFAULT_BOARD, board_paths, get_current_board_id
 from src.state_management import initialise_session_state
 
-DATA_DIR = "data"
-EVENTS_FILE = os.path.join(DATA_DIR, "events.json")
-SETTINGS_FILE = os.path.join(DATA_DIR, "settings.json")
-THEMES_FILE = os.path.join(DATA_DIR, "themes.json")
+from src.core.persistence import load_json
+from src.core.store import commit_board, get_board, peek_board, delete_board_data
+
+def initialise_db(read_only=False):
+    """
+    Initialise database and load saved data for the selected board.
 
-def initialise_db():
-    """Initialise database and load saved data."""
+    Args:
+    -> read_only: Only read existing files, e.g. for kiosk displays
+    """
     initialise_session_state()
 
+    board_id = get_current_board_id()
+
     # Ensure data directory exists
-    os.makedirs(DATA_DIR, exist_ok=True)
-
-    # Load events
-    if os.path.exists(EVENTS_FILE):
-        try:
-            with open(EVENTS_FILE, "r") as f:
-                events_data = json.load(f)
-                for event in events_data:
-                    event["start"] = datetime.fromisoformat(event["start"])
-                    event["end"] = datetime.fromisoformat(event["end"])
-                st.session_state["events"] = events_data
-        
-        except Exception as e:
-            st.warning(f"Could not load saved events: {str(e)}")
-        
+    if not read_only:
+        os.makedirs(board_paths(board_id)["data_dir"], exist_ok=True)
+
+    try:
+        board = get_board(board_id)
+
+    except Exception as e:
+        st.warning(f"Could not load saved data: {str(e)}")
+        return
+
+    # Sessions edit their own copies, the cached board stays untouched
+    st.session_state["events"] = [event.copy() for event in board["events"]]
+
     # Load settings
-    if os.path.exists(SETTINGS_FILE):
-        try:
-            with open(SETTINGS_FILE, "r") as f:
-                settings_data = json.load(f)
-                st.session_state["active_theme"] = settings_data.get("active_theme", "light")
-                st.session_state["team_logo"] = settings_data.get("team logo")
-            
-        except Exception as e:
-            st.warning(f"Could not load saved settings: {str(e)}")
-    
-    # Load custom themes:
-    if os.path.exists(THEMES_FILE):
-        try:
-            with open(THEMES_FILE,"r") as f:
-                themes_data = json.load(f)
-                st.session_state["custom_themes"] = themes_data
-        
-        except Exception as e:
-            st.warning(f"Could not load saved themes: {str(e)}")
+    if board["settings"]:
+        st.session_state["active_theme"] = board["settings"].get("active_theme", "light")
+        st.session_state["team_logo"] = board["settings"].get("team_logo")
+
+    # Load custom themes
+    if board["themes"]:
+        st.session_state["custom_themes"] = dict(board["themes"])
 
 def save_session_data():
-    """Save current session data to files."""
+    """Save current session data to the selected board, writing its files in the background."""
+    board_id = st.session_state.get("board_id", DEFAULT_BOARD)
+    paths = board_paths(board_id)
+
     try:
-        # Ensure data directory exists
-        os.makedirs(DATA_DIR, exist_ok=True)
-
-        # Save events
-        events_data = []
-        for event in st.session_state.get("events", []):
-            event_copy = event.copy()
-            event_copy["start"] = event_copy["start"].isoformat()
-            event_copy["end"] = event_copy["end"].isoformat()
-            events_data.append(event_copy)
-
-        with open(EVENTS_FILE, "w") as f:
-            json.dump(events_data, f, indent=2)
+        cached = peek_board(board_id)
+
+        # Events
+        events = st.session_state.get("events", [])
+        sorted_events = sorted((event.copy() for event in events), key=lambda x: x["start"])
         
-        # Save settings
+        # Settings
         settings_data = {
             "active_theme": st.session_state.get("active_theme", "light"),
             "team_logo": st.session_state.get("team_logo")
         }
 
-        with open(SETTINGS_FILE, "w") as f:
-            json.dump(settings_data, f, indent=2)
-        
-        # Save custom themes
-        if st.session_state.get("custom_themes"):
-            with open(THEMES_FILE, "w") as f:
-                json.dump(st.session_state["custom_themes"], f, indent=2)
+        # Custom themes are only written once there are some
+        themes_data = st.session_state.get("custom_themes") or {}
+        if not themes_data:
+            themes_data = cached["themes"] if cached else load_json(paths["themes_file"], {})
+
+        # The shared copy is updated now; the files are written in the background
+        commit_board({
+            "board_id": board_id,
+            "events": sorted_events,
+            "settings": settings_data,
+            "themes": dict(themes_data)
+        }, cached)
         
     except Exception as e:
         st.error(f"Error saving data: {str(e)}")
 
 def clear_all_data():
-    """Clear all saved data."""
+    """Clear all saved data for the selected board."""
+    board_id = st.session_state.get("board_id", DEFAULT_BOARD)
+
     try:
-        if os.path.exists(EVENTS_FILE):
-            os.remove(EVENTS_FILE)
-        if os.path.exists(SETTINGS_FILE):
-            os.remove(SETTINGS_FILE)
-        if os.path.exists(THEMES_FILE):
-            os.remove(THEMES_FILE)
+        delete_board_data(board_id)
         
         st.session_state["events"] = []
         st.session_state["custom_themes"] = []
@@ -114,4 +101,3 @@ def clear_all_data():
     
     except Exception as e:
         st.error(f"Error clearing data: {str(e)}")
-        
\ No newline at end of file
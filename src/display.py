@@ -11,15 +11,57 @@ Description:
 import streamlit as st
 import os
 import base64
+import json
 
-from datetime import datetime
-from streamlit_autorefresh import st_autorefresh
-
-from src.helpers import format_remaining_time
+from src import clock
+from src.core.countdowns import format_countdowns
+from src.core.queries import get_current_and_next_event
+from src.core.themes import adjust_brightness
 from src.state_management import remove_past_events, initialise_session_state
+from src.boards import DEFAULT_BOARD, get_session_board_paths
+from src.core.store import get_save_failure
+from src.logo_processing import find_logo, variant_path
+from src.reminders import get_scheduler
+from src.memory_profiling import (
+    build_memory_report,
+    dump_memory_report,
+    format_bytes,
+    is_tracing,
+    start_tracing,
+    stop_tracing
+)
 from src.ui_themes import get_active_theme
 
-def display_clock():
+# Cards rendered per page of the event list; more are shown on request
+EVENT_LIST_PAGE_SIZE = 50
+
+def display_reminder_toasts():
+    """Shows reminders fired since this session's last rerun as toasts."""
+    board_id = st.session_state.get("board_id")
+    latest_sequence, messages = get_scheduler().get_toasts(board_id, st.session_state.get("reminder_sequence", 0))
+
+    # A newly opened session starts from now rather than replaying old reminders
+    if "reminder_sequence" in st.session_state:
+        for message in messages:
+            st.toast(message, icon="⏰")
+
+    st.session_state["reminder_sequence"] = latest_sequence
+
+def display_save_status():
+    """Warns when this board's latest changes could not be written to disk."""
+    failure = get_save_failure(st.session_state.get("board_id", DEFAULT_BOARD))
+    if failure is None:
+        return
+
+    if failure["gave_up"]:
+        st.error(
+            f"Changes could not be saved after {failure['attempts']} attempts ({failure['error']}). "
+            "They are kept in memory and saving is tried again with your next change."
+        )
+    else:
+        st.warning(f"Changes could not be saved yet ({failure['error']}). Retrying...")
+
+def display_clock(read_only=False):
     """Displays a large digital clock that highlights active events."""
     # Get theme colours
     theme = get_active_theme()
@@ -32,14 +74,11 @@ def display_clock():
     event_placeholder = st.empty()
     next_event_placeholder = st.empty()
 
-    now = datetime.now()
+    now = clock.now()
     current_time = now.strftime("%H:%M:%S")
     
-    remove_past_events()
-    sorted_events = sorted(st.session_state.get("events", []), key=lambda x: x["start"])
-
-    current_event = next((event for event in sorted_events if event["start"] <= now <= event["end"]), None)
-    next_event = next((event for event in sorted_events if event["start"] > now), None)
+    remove_past_events(archive=not read_only)
+    current_event, next_event = get_current_and_next_event(st.session_state.get("events", []), now)
 
     # Use theme-aware colours
     clock_html = f"""
@@ -81,8 +120,8 @@ def display_clock():
         """
         next_event_placeholder.markdown(next_event_html, unsafe_allow_html=True)
 
-def display_event_list():
-    """Displays list of upcoming events with countdowns and remove buttons."""
+def display_event_list(read_only=False):
+    """Displays list of upcoming events with countdowns and, unless read-only, remove buttons."""
     theme = get_active_theme()
     primary_colour = theme["primary_colour"]
     text_colour = theme["text_colour"]
@@ -91,17 +130,21 @@ def display_event_list():
     st.subheader("Upcoming events")
 
     if not st.session_state.get("events"):
-        st.info("No upcoming events. Add one in the sidebar.")
+        st.info("No upcoming events." if read_only else "No upcoming events. Add one in the sidebar.")
         return
     
-    remove_past_events()
+    remove_past_events(archive=not read_only)
     sorted_events = sorted(st.session_state["events"], key=lambda x: x["start"])
 
-    for i, event in enumerate(sorted_events):
-        remaining_time = event["start"] - datetime.now()
+    # Only the visible cards are rendered, and their countdowns come from one batch
+    limit = st.session_state.get("event_list_limit", EVENT_LIST_PAGE_SIZE)
+    visible_events = sorted_events[:limit]
+    countdowns = format_countdowns(visible_events, clock.now())
+
+    # Create a theme-aware card style
+    card_bg = adjust_brightness(bg_colour, 10)
 
-        # Create a theme-aware card style
-        card_bg = adjust_brightness(bg_colour, 10)
+    for i, (event, countdown) in enumerate(zip(visible_events, countdowns)):
 
         with st.container():
             st.markdown(
@@ -117,16 +160,34 @@ def display_event_list():
                     <h3 style="color: {primary_colour};">{event['name']}</h3>
                     <p><strong>Start:</strong> {event['start'].strftime('%Y-%m-%d %H:%M:%S')}</p>
                     <p><strong>End:</strong> {event['end'].strftime('%Y-%m-%d %H:%M:%S')}</p>
-                    <p><strong>Time until start:</strong> {format_remaining_time(remaining_time)}</p>
+                    <p><strong>Time until start:</strong> {countdown}</p>
                     </div>
                 """,
                 unsafe_allow_html = True
             )
 
-            if st.button(f"Remove {event['name']}", key=f"remove_{i}"):
-                st.session_state["events"] = [e for e in st.session_state["events"] if e != event]
+            if not read_only and st.button(f"Remove {event['name']}", key=f"remove_{event.get('id', i)}"):
+                st.session_state["events"] = [e for e in st.session_state["events"] if e.get("id") != event.get("id")]
                 st.rerun()
 
+    hidden = len(sorted_events) - len(visible_events)
+    if hidden > 0:
+        if read_only:
+            st.caption(f"And {hidden} more events.")
+        elif st.button(f"Show more events ({hidden} hidden)", key="event_list_more"):
+            st.session_state["event_list_limit"] = limit + EVENT_LIST_PAGE_SIZE
+            st.rerun()
+
+@st.cache_data(max_entries=16)
+def load_logo_data_uri(logo_path, modified_time):
+    """Returns a base64 data URI for a logo file, cached until the file changes."""
+    mime_type = "image/webp" if logo_path.endswith(".webp") else "image/png"
+
+    with open(logo_path, "rb") as img_f:
+        encoded = base64.b64encode(img_f.read()).decode("utf-8")
+
+    return f"data:{mime_type};base64,{encoded}"
+
 def display_team_logo(centered=False):
     """Displays the team logo within a sticky header."""
     initialise_session_state()
@@ -136,18 +197,23 @@ def display_team_logo(centered=False):
     primary_colour = theme["primary_colour"]
     text_colour = theme["text_colour"]
 
-    logo_path = "assets/team_logo.png"
-
-    if os.path.exists(logo_path):
-        with open(logo_path, "rb") as img_f:
-            encoded = base64.b64encode(img_f.read()).decode("utf-8")
-            logo_html = f"""
-            <img src="
-            data:image/png;
-            base64,{encoded}"
-            style="height:100px;
-            width:auto">
-            """
+    logo_path = st.session_state.get("team_logo") or find_logo(get_session_board_paths()["logo_dir"])
+
+    if logo_path and os.path.exists(logo_path):
+        extension = logo_path.rsplit(".", 1)[-1]
+        # src is the 1x candidate and the fallback for browsers without srcset
+        src = load_logo_data_uri(logo_path, os.path.getmtime(logo_path))
+        srcset = ""
+
+        hidpi_path = variant_path(extension, 2, os.path.dirname(logo_path))
+        if os.path.exists(hidpi_path):
+            srcset = f'srcset="{load_logo_data_uri(hidpi_path, os.path.getmtime(hidpi_path))} 2x"'
+
+        logo_html = f"""
+        <img src="{src}" {srcset}
+        style="height:100px;
+        width:auto">
+        """
         
     else:
         # Display theme-aware title text if no logo is available
@@ -182,25 +248,69 @@ def display_team_logo(centered=False):
     # Display header
     st.markdown(logo_display_html, unsafe_allow_html=True)
 
-def adjust_brightness(hex_colour, amount):
-    """
-    Adjust the brightness of a hex colour.
-    
-    Args:
-    -> hex_colour: Hex colour code (e.g., '#FFFFFF')
-    -> amount: Amount to adjust (-100 to +100)
+def toggle_memory_tracing():
+    """Starts or stops tracing for the whole process when a viewer flips the toggle."""
+    if st.session_state["memory_tracing"]:
+        start_tracing()
+    else:
+        stop_tracing()
 
-    Returns:
-    -> Adjusted hex colour
-    """
-    # Convert hex to RGB
-    hex_colour = hex_colour.lstrip('#')
-    r, g, b = tuple(int(hex_colour[i:i+2], 16) for i in (0, 2, 4))
-    
-    # Adjust brightness
-    r = max(0, min(255, r + amount))
-    g = max(0, min(255, g + amount))
-    b = max(0, min(255, b + amount))
+def display_memory_debug_panel():
+    """Displays memory usage for this session and the process in the sidebar."""
+    with st.sidebar.expander("Memory (debug)"):
+        # Tracing is process-wide: show whether it is on and only change it when this toggle is flipped
+        st.session_state["memory_tracing"] = is_tracing()
+        st.toggle("Trace allocations (tracemalloc)", key="memory_tracing", on_change=toggle_memory_tracing)
+
+        report = build_memory_report(st.session_state)
+
+        st.metric("Process RSS", format_bytes(report["rss_bytes"]))
+        st.metric("This session", format_bytes(report["session"]["total_bytes"]))
+
+        if report["tracemalloc"]:
+            st.caption(
+                f"Traced: {format_bytes(report['tracemalloc']['current_bytes'])} "
+                f"(peak {format_bytes(report['tracemalloc']['peak_bytes'])})"
+            )
+
+        st.markdown("**Session state by key**")
+        st.dataframe(
+            [{"key": key, "size": format_bytes(size)} for key, size in report["session"]["keys"].items()],
+            hide_index=True
+        )
+
+        if report["sessions"]:
+            st.markdown(f"**Active sessions ({len(report['sessions'])})**")
+            st.dataframe(
+                [
+                    {"session": session["session_id"][:8], "size": format_bytes(session["total_bytes"])}
+                    for session in report["sessions"]
+                ],
+                hide_index=True
+            )
+
+        if report["top_allocation_sites"]:
+            st.markdown("**Top allocation sites**")
+            st.dataframe(
+                [
+                    {
+                        "site": f"{os.path.basename(site['file'])}:{site['line']}",
+                        "size": format_bytes(site["size_bytes"]),
+                        "count": site["count"]
+                    }
+                    for site in report["top_allocation_sites"]
+                ],
+                hide_index=True
+            )
+
+        st.download_button(
+            "Download report",
+            data=json.dumps(report, indent=2),
+            file_name="memory_report.json",
+            mime="application/json"
+        )
 
-    # Convert back into hex
-    return f"#{int(r):02x}{int(g):02x}{int(b):02x}"
+        if st.button("Save report to data/"):
+            path = os.path.join("data", "memory_reports", f"memory_{report['timestamp'].replace(':', '-')}.json")
+            dump_memory_report(path, st.session_state)
+            st.success(f"Saved {path}")
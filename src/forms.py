@@ -11,9 +11,18 @@ Description:
 import streamlit as st
 
 from datetime import datetime, timedelta
-from src.helpers import validate_time_input
+from src import clock
+from src.core.model import new_event_id
+from src.helpers import validate_time_input, validate_reminder_input
 from src.state_management import initialise_session_state, save_uploaded_file
 from src.database import save_session_data
+from src.bulk_operations import (
+    select_event_ids,
+    delete_events,
+    shift_events,
+    set_duration,
+    duplicate_day
+)
 
 def add_event_form():
     """Displays sidebar form for adding events."""
@@ -22,9 +31,10 @@ def add_event_form():
     st.sidebar.subheader("Add an event")
     with st.sidebar.form("add_event_form"):
         event_name = st.text_input("Event name", placeholder="Enter event name")
-        event_date = st.date_input("Event date", min_value=datetime.now().date())
+        event_date = st.date_input("Event date", min_value=clock.now().date())
         event_time_str = st.text_input("Event time (HH:MM)", placeholder="12:34")
         event_duration = st.number_input("Duration (minutes)", min_value=1, value=60)
+        reminder_str = st.text_input("Reminders (minutes before, comma separated)", value="15, 5")
         submit_button = st.form_submit_button("Add event")
 
         st.session_state["error_messages"] = []
@@ -37,6 +47,10 @@ def add_event_form():
             if event_time == "error":
                 st.session_state["error_messages"].append("Please enter the time in HH:MM format.")
 
+            reminders = validate_reminder_input(reminder_str)
+            if reminders == "error":
+                st.session_state["error_messages"].append("Please enter reminders as whole minutes, e.g. 15, 5.")
+
             if st.session_state["error_messages"]:
                 for error in st.session_state["error_messages"]:
                     st.error(error)
@@ -46,10 +60,12 @@ def add_event_form():
                 event_end = event_start + timedelta(minutes=event_duration)
 
                 st.session_state["events"].append({
+                    "id": new_event_id(),
                     "name": event_name,
                     "start": event_start,
                     "end": event_end,
-                    "duration": event_duration
+                    "duration": event_duration,
+                    "reminders": reminders
                 })
 
                 st.success(f"Event '{event_name}' added.")
@@ -114,10 +130,12 @@ def edit_event_form():
 
                     # Update the event
                     st.session_state["events"][event_index] = {
+                        "id": event.get("id") or new_event_id(),
                         "name": event_name,
                         "start": event_start,
                         "end": event_end,
-                        "duration": event_duration
+                        "duration": event_duration,
+                        "reminders": event.get("reminders")
                     }
 
                     st.success(f"Event '{event_name} updated.")
@@ -145,7 +163,86 @@ def upload_logo_form():
         if file_extension not in allowed_extensions:
             st.sidebar.error("Invalid file type. Please upload a .png, .jpg, or .jpeg file.")
         else:
-            save_uploaded_file(uploaded_file)
+            try:
+                save_uploaded_file(uploaded_file)
+            except ValueError as e:
+                st.sidebar.error(str(e))
+                return
+
             st.sidebar.success("Logo uploaded successfully.")
             save_session_data()
             st.rerun()
+
+def bulk_edit_form():
+    """Displays bulk operations that update many events with one save and one rerun."""
+    initialise_session_state()
+
+    events = st.session_state["events"]
+    if not events:
+        return
+
+    with st.expander("Bulk edit"):
+        operation = st.selectbox(
+            "Operation",
+            options=["delete", "shift", "shift_range", "duration", "duplicate_day"],
+            format_func=lambda x: {
+                "delete": "Delete selected events",
+                "shift": "Shift selected events",
+                "shift_range": "Shift all events in a date range",
+                "duration": "Change duration of selected events",
+                "duplicate_day": "Duplicate a day to another date"
+            }[x]
+        )
+
+        sorted_events = sorted(events, key=lambda x: x["start"])
+        labels = {event["id"]: f"{event['name']} ({event['start'].strftime('%Y-%m-%d %H:%M')})" for event in sorted_events}
+
+        selected_ids = []
+        if operation in ("delete", "shift", "duration"):
+            selected_ids = st.multiselect(
+                "Events",
+                options=list(labels.keys()),
+                format_func=lambda x: labels[x]
+            )
+
+        if operation == "shift_range":
+            col1, col2 = st.columns(2)
+            with col1:
+                range_start = st.date_input("From date", value=sorted_events[0]["start"].date())
+            with col2:
+                range_end = st.date_input("To date", value=sorted_events[-1]["start"].date())
+
+        if operation in ("shift", "shift_range"):
+            minutes = st.number_input("Shift by (minutes, negative moves earlier)", value=15, step=5)
+
+        if operation == "duration":
+            duration = st.number_input("New duration (minutes)", min_value=1, value=60)
+
+        if operation == "duplicate_day":
+            col1, col2 = st.columns(2)
+            with col1:
+                source_date = st.date_input("Copy events from", value=sorted_events[0]["start"].date())
+            with col2:
+                target_date = st.date_input("To date", value=source_date + timedelta(days=1))
+
+        if st.button("Apply to events"):
+            if operation == "delete":
+                events = delete_events(events, selected_ids)
+            elif operation == "shift":
+                events = shift_events(events, selected_ids, minutes)
+            elif operation == "shift_range":
+                range_ids = select_event_ids(
+                    events,
+                    start=datetime.combine(range_start, datetime.min.time()),
+                    end=datetime.combine(range_end + timedelta(days=1), datetime.min.time())
+                )
+                events = shift_events(events, range_ids, minutes)
+            elif operation == "duration":
+                events = set_duration(events, selected_ids, duration)
+            elif operation == "duplicate_day":
+                events = duplicate_day(events, source_date, target_date)
+
+            # One mutation, one save and one rerun for the whole batch
+            st.session_state["events"] = events
+            save_session_data()
+            st.rerun()
@@ -10,22 +10,6 @@ Description:
 
 from datetime import datetime
 
-def format_remaining_time(remaining_time):
-    """Formats remaining time as HH:MM:SS or 'now'."""
-    if remaining_time.total_seconds() <= 0:
-        return "now"
-
-    hours, remainder = divmod(remaining_time.seconds, 3600)
-    minutes, seconds = divmod(remainder, 60)
-    days = remaining_time.days
-
-    if days > 0:
-        return f"{days} days {hours:02}{minutes:02}"
-    elif hours > 0:
-        return f"{hours:02}:{minutes:02}:{seconds:02}"
-    else:
-        return f"{minutes:02}:{seconds:02}"
-    
 def validate_time_input(event_time_str):
     """Validates time input in HH:MM:SS format. Returns a time object."""
     if event_time_str == "":
@@ -35,3 +19,17 @@ def validate_time_input(event_time_str):
         return datetime.strptime(event_time_str, "%H:%M").time()
     except ValueError:
         return "error"
+
+def validate_reminder_input(reminder_str):
+    """Validates comma separated reminder lead times in minutes. Returns a list of ints."""
+    if reminder_str.strip() == "":
+        return []
+
+    try:
+        leads = sorted({int(part) for part in reminder_str.split(",") if part.strip()}, reverse=True)
+    except ValueError:
+        return "error"
+
+    if any(lead <= 0 for lead in leads):
+        return "error"
+    return leads
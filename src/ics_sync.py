@@ -0,0 +1,314 @@
+"""
+ics_sync.py
+----------------
+Author: Nida Anis
+Date: 19/10/2026
+----------------
+Description:
+-> Incremental UID-based sync of a watched folder of .ics files
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+
+from datetime import date, datetime, timedelta
+
+from icalendar import Calendar
+from watchdog.events import FileSystemEventHandler
+from watchdog.observers import Observer
+
+from src.core.boards import DEFAULT_BOARD, board_paths
+from src.core.store import get_board, save_board_events
+
+ICS_SYNC_DIR = os.environ.get("COUNTDOWN_ICS_DIR")
+ICS_SYNC_BOARD = os.environ.get("COUNTDOWN_ICS_BOARD", DEFAULT_BOARD)
+# Quiet period before syncing, so a file being written is only parsed once
+DEBOUNCE_SECONDS = 1.0
+STATE_FILENAME = "ics_sync.json"
+
+logger = logging.getLogger(__name__)
+
+def file_fingerprint(file_path):
+    """Content hash of a file, so touched-but-unchanged files are skipped."""
+    digest = hashlib.sha1()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def ics_event_id(uid):
+    """Stable event ID derived from an ICS UID."""
+    return f"ics-{hashlib.sha1(uid.encode('utf-8')).hexdigest()[:20]}"
+
+def to_local_datetime(value):
+    """Converts an ICS date or datetime to the app's naive local datetimes."""
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            return value.astimezone().replace(tzinfo=None)
+        return value
+    if isinstance(value, date):
+        return datetime.combine(value, datetime.min.time())
+    raise ValueError(f"Unsupported date value: {value!r}")
+
+def parse_ics_file(file_path):
+    """
+    Parse the VEVENTs of an .ics file.
+
+    Recurring events are imported as their first occurrence only.
+
+    Returns:
+    -> Dictionary of UID -> event dictionary
+    """
+    with open(file_path, "rb") as f:
+        calendar = Calendar.from_ical(f.read())
+
+    events = {}
+    source = os.path.basename(file_path)
+
+    for component in calendar.walk("VEVENT"):
+        uid = str(component.get("UID", "")).strip()
+        if not uid or component.get("DTSTART") is None:
+            continue
+
+        start = to_local_datetime(component.decoded("DTSTART"))
+        if component.get("DTEND") is not None:
+            end = to_local_datetime(component.decoded("DTEND"))
+        elif component.get("DURATION") is not None:
+            end = start + component.decoded("DURATION")
+        else:
+            end = start + timedelta(hours=1)
+
+        events[uid] = {
+            "id": ics_event_id(uid),
+            "name": str(component.get("SUMMARY", "Untitled event")),
+            "start": start,
+            "end": end,
+            "duration": max(1, int((end - start).total_seconds() // 60)),
+            "uid": uid,
+            "sequence": int(component.get("SEQUENCE", 0)),
+            "source": source
+        }
+
+    return events
+
+def is_newer(incoming, current):
+    """An incoming event replaces the stored one on a higher sequence or changed content."""
+    if incoming["sequence"] != current.get("sequence", 0):
+        return incoming["sequence"] > current.get("sequence", 0)
+
+    # Many exporters never bump SEQUENCE, so compare the fields we display
+    return any(incoming[key] != current.get(key) for key in ("name", "start", "end"))
+
+class IcsFolderSync:
+    """
+    Keeps a board in step with a folder of .ics exports.
+
+    Each file's content hash and UIDs are remembered in the board's data
+    folder, so only files that actually changed are parsed and only the
+    added, updated and removed UIDs are applied, in one write per batch.
+    """
+
+    def __init__(self, folder, board_id=ICS_SYNC_BOARD):
+        self.folder = folder
+        self.board_id = board_id
+        self.state_file = os.path.join(board_paths(board_id)["data_dir"], STATE_FILENAME)
+        self.state = self.load_state()
+        self.lock = threading.Lock()
+        self.pending = set()
+        self.timer = None
+        self.observer = None
+
+    def load_state(self):
+        if not os.path.exists(self.state_file):
+            return {"files": {}}
+
+        with open(self.state_file, "r") as f:
+            return json.load(f)
+
+    def save_state(self):
+        os.makedirs(os.path.dirname(self.state_file), exist_ok=True)
+        tmp_path = f"{self.state_file}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.state, f, indent=2)
+        os.replace(tmp_path, self.state_file)
+
+    def scan(self):
+        """Sync every changed, new or deleted file in the folder; used at start-up."""
+        on_disk = {
+            os.path.join(self.folder, name)
+            for name in os.listdir(self.folder)
+            if name.lower().endswith(".ics")
+        }
+        known = {os.path.join(self.folder, name) for name in self.state["files"]}
+        return self.sync_files(on_disk | known)
+
+    def sync_files(self, file_paths):
+        """
+        Apply the changes in the given files to the board.
+
+        Returns:
+        -> Dictionary with counts of added, updated and removed events
+        """
+        with self.lock:
+            adds = {}
+            updates = {}
+            removed_uids = set()
+            changed = False
+
+            for file_path in file_paths:
+                name = os.path.basename(file_path)
+                previous = self.state["files"].get(name)
+
+                if not os.path.exists(file_path):
+                    if previous:
+                        removed_uids.update(previous["uids"])
+                        del self.state["files"][name]
+                        changed = True
+                    continue
+
+                fingerprint = file_fingerprint(file_path)
+                if previous and previous["fingerprint"] == fingerprint:
+                    continue
+
+                try:
+                    parsed = parse_ics_file(file_path)
+                except Exception:
+                    logger.exception("Could not parse %s", file_path)
+                    continue
+
+                previous_uids = set(previous["uids"]) if previous else set()
+                removed_uids.update(previous_uids - parsed.keys())
+
+                for uid, event in parsed.items():
+                    if uid in previous_uids:
+                        updates[uid] = event
+                    else:
+                        adds[uid] = event
+
+                self.state["files"][name] = {"fingerprint": fingerprint, "uids": sorted(parsed)}
+                changed = True
+
+            if not changed:
+                return {"added": 0, "updated": 0, "removed": 0}
+
+            result = self.apply(adds, updates, removed_uids)
+            self.save_state()
+            return result
+
+    def apply(self, adds, updates, removed_uids):
+        """
+        Merge a batch of changes into the board with a single save.
+
+        Called with the lock held, after the file index has been updated for
+        the batch.
+        """
+        events = get_board(self.board_id)["events"]
+        incoming = {**adds, **updates}
+
+        # A UID moved between files is an update, not a removal, even if the
+        # file it moved to was synced in an earlier batch
+        still_listed = {uid for tracked in self.state["files"].values() for uid in tracked["uids"]}
+        removed_uids = removed_uids - incoming.keys() - still_listed
+
+        result = {"added": 0, "updated": 0, "removed": 0}
+        new_events = []
+
+        for event in events:
+            uid = event.get("uid")
+            if uid is None:
+                new_events.append(event)
+            elif uid in removed_uids:
+                result["removed"] += 1
+            elif uid in incoming:
+                replacement = incoming.pop(uid)
+                if is_newer(replacement, event):
+                    # Keep app-side fields such as reminders
+                    new_events.append({**event, **replacement})
+                    result["updated"] += 1
+                else:
+                    new_events.append(event)
+            else:
+                new_events.append(event)
+
+        new_events.extend(incoming.values())
+        result["added"] = len(incoming)
+
+        if any(result.values()):
+            save_board_events(self.board_id, new_events)
+
+        return result
+
+    def queue(self, file_path):
+        """Collect a changed file and sync once the folder has been quiet briefly."""
+        if not file_path.lower().endswith(".ics"):
+            return
+
+        with self.lock:
+            self.pending.add(file_path)
+            if self.timer is not None:
+                self.timer.cancel()
+            self.timer = threading.Timer(DEBOUNCE_SECONDS, self.flush)
+            self.timer.daemon = True
+            self.timer.start()
+
+    def flush(self):
+        with self.lock:
+            file_paths = self.pending
+            self.pending = set()
+            self.timer = None
+
+        try:
+            result = self.sync_files(file_paths)
+            logger.info("ICS sync for board %s: %s", self.board_id, result)
+        except Exception:
+            logger.exception("ICS sync failed")
+
+    def start(self):
+        """Sync the folder once, then watch it for changes."""
+        os.makedirs(self.folder, exist_ok=True)
+        self.scan()
+
+        self.observer = Observer()
+        self.observer.schedule(IcsEventHandler(self), self.folder, recursive=False)
+        self.observer.daemon = True
+        self.observer.start()
+
+    def stop(self):
+        if self.observer is not None:
+            self.observer.stop()
+            self.observer.join()
+
+class IcsEventHandler(FileSystemEventHandler):
+    """Forwards file system events in the watched folder to the sync."""
+
+    def __init__(self, sync):
+        self.sync = sync
+
+    def on_created(self, event):
+        if not event.is_directory:
+            self.sync.queue(event.src_path)
+
+    def on_modified(self, event):
+        if not event.is_directory:
+            self.sync.queue(event.src_path)
+
+    def on_deleted(self, event):
+        if not event.is_directory:
+            self.sync.queue(event.src_path)
+
+    def on_moved(self, event):
+        if not event.is_directory:
+            self.sync.queue(event.src_path)
+            self.sync.queue(event.dest_path)
+
+def start_ics_sync(folder=ICS_SYNC_DIR, board_id=ICS_SYNC_BOARD):
+    """Start watching the configured folder, if one is configured."""
+    if not folder:
+        return None
+
+    sync = IcsFolderSync(folder, board_id)
+    sync.start()
+    return sync
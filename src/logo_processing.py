@@ -0,0 +1,139 @@
+"""
+logo_processing.py
+----------------
+Author: Nida Anis
+Date: 18/10/2026
+----------------
+Description:
+-> Streams, validates and downscales uploaded team logos
+"""
+
+import os
+import tempfile
+
+from PIL import Image, ImageOps
+
+LOGO_DIR = "assets"
+LOGO_BASENAME = "team_logo"
+# display_team_logo shows the logo 100px high; the 2x variant serves high-DPI screens
+LOGO_HEIGHT = 100
+LOGO_SCALES = (1, 2)
+LOGO_EXTENSIONS = ("png", "webp")
+# Reject images whose decoded size would be excessive (about 160 MB as RGBA)
+MAX_LOGO_PIXELS = 40_000_000
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+def variant_path(extension, scale=1, logo_dir=LOGO_DIR):
+    """Returns the path of a logo variant, e.g. assets/team_logo@2x.webp."""
+    suffix = "" if scale == 1 else f"@{scale}x"
+    return os.path.join(logo_dir, f"{LOGO_BASENAME}{suffix}.{extension}")
+
+def find_logo(logo_dir=LOGO_DIR):
+    """Returns the path of the current 1x logo, or None if none exists."""
+    for extension in LOGO_EXTENSIONS:
+        path = variant_path(extension, 1, logo_dir)
+        if os.path.exists(path):
+            return path
+    return None
+
+def stream_to_file(source, destination):
+    """Copy a file-like upload to disk in fixed-size chunks."""
+    source.seek(0)
+    while True:
+        chunk = source.read(UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        destination.write(chunk)
+
+def decode_logo(upload_path):
+    """
+    Decode an image and downscale it to every logo scale.
+
+    Returns:
+    -> Tuple of (extension, list of (scale, image)); "png" for transparent
+       artwork, "webp" otherwise
+
+    Raises:
+    -> ValueError: If the image is too large
+    -> OSError: If the file is not a readable image
+    """
+    with Image.open(upload_path) as image:
+        # Only the header has been read so far, so this check is cheap
+        width, height = image.size
+        if width * height > MAX_LOGO_PIXELS:
+            raise ValueError(
+                f"Image is too large ({width}x{height}). "
+                f"Please upload an image under {MAX_LOGO_PIXELS // 1_000_000} megapixels."
+            )
+
+        target_height = LOGO_HEIGHT * max(LOGO_SCALES)
+
+        # Let the JPEG decoder downscale while decoding where it can
+        image.draft("RGB", (max(1, width * target_height // height), target_height))
+        image = ImageOps.exif_transpose(image)
+
+        has_alpha = image.mode in ("RGBA", "LA", "P") and (
+            image.mode != "P" or "transparency" in image.info
+        )
+        image = image.convert("RGBA" if has_alpha else "RGB")
+
+    # Transparent artwork stays lossless; photos compress far better as WebP
+    extension = "png" if has_alpha else "webp"
+    variants = []
+
+    for scale in LOGO_SCALES:
+        scaled_height = min(LOGO_HEIGHT * scale, image.height)
+        scaled_width = max(1, round(image.width * scaled_height / image.height))
+        variants.append((scale, image.resize((scaled_width, scaled_height), Image.LANCZOS)))
+
+    return extension, variants
+
+def process_logo(source, logo_dir=LOGO_DIR):
+    """
+    Normalise an uploaded image into display-sized logo variants.
+
+    Args:
+    -> source: File-like object with the uploaded image bytes
+    -> logo_dir: Directory to write the variants to
+
+    Returns:
+    -> Path of the 1x variant
+
+    Raises:
+    -> ValueError: If the upload is not a readable image or is too large
+    """
+    os.makedirs(logo_dir, exist_ok=True)
+
+    with tempfile.NamedTemporaryFile(dir=logo_dir, suffix=".upload", delete=False) as tmp:
+        stream_to_file(source, tmp)
+        upload_path = tmp.name
+
+    try:
+        try:
+            extension, variants = decode_logo(upload_path)
+        except (OSError, SyntaxError, Image.DecompressionBombError):
+            # Corrupt or truncated files often only fail once decoding starts
+            raise ValueError("Could not read image. Please upload a valid .png, .jpg, or .jpeg file.")
+
+        for scale, variant in variants:
+            path = variant_path(extension, scale, logo_dir)
+            tmp_path = f"{path}.tmp"
+            if extension == "png":
+                variant.save(tmp_path, format="PNG", optimize=True)
+            else:
+                variant.save(tmp_path, format="WEBP", quality=85, method=6)
+            os.replace(tmp_path, path)
+
+        # Remove variants left over from a logo in the other format
+        for other in LOGO_EXTENSIONS:
+            if other == extension:
+                continue
+            for scale in LOGO_SCALES:
+                stale_path = variant_path(other, scale, logo_dir)
+                if os.path.exists(stale_path):
+                    os.remove(stale_path)
+
+        return variant_path(extension, 1, logo_dir)
+
+    finally:
+        os.remove(upload_path)
@@ -0,0 +1,216 @@
+"""
+memory_profiling.py
+----------------
+Author: Nida Anis
+Date: 19/10/2026
+----------------
+Description:
+-> Memory accounting for sessions and the whole process
+"""
+
+import json
+import os
+import resource
+import sys
+import threading
+import tracemalloc
+
+from datetime import datetime
+
+# Session keys called out separately in reports
+TRACKED_KEYS = ("events", "themes", "custom_themes")
+
+# tracemalloc is process-wide, so sessions share one tracing state
+_tracing_lock = threading.Lock()
+
+def deep_sizeof(obj, seen=None):
+    """
+    Approximate the memory held by an object and everything it references.
+
+    Shared objects are only counted once per call, so sizing several keys
+    with the same `seen` set does not double count shared data.
+    """
+    if seen is None:
+        seen = set()
+
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(key, seen) + deep_sizeof(value, seen) for key, value in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(item, seen) for item in obj)
+    elif hasattr(obj, "__dict__"):
+        size += deep_sizeof(vars(obj), seen)
+
+    return size
+
+def session_state_breakdown(session_state):
+    """
+    Size every session state key.
+
+    Sizes come from deep_sizeof (sys.getsizeof over the referenced objects),
+    not tracemalloc: tracemalloc attributes memory to the lines that
+    allocated it, not to the keys that hold it, and only sees objects
+    allocated after tracing started.
+
+    Args:
+    -> session_state: st.session_state or any mapping
+
+    Returns:
+    -> Dictionary of key -> bytes, largest first
+    """
+    seen = set()
+    sizes = {}
+
+    for key in list(session_state.keys()):
+        try:
+            sizes[str(key)] = deep_sizeof(session_state[key], seen)
+        except Exception:
+            # Widget values can disappear between listing and reading
+            continue
+
+    return dict(sorted(sizes.items(), key=lambda item: item[1], reverse=True))
+
+def process_rss_bytes():
+    """Current resident set size of the process, falling back to the peak where /proc is missing."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        # ru_maxrss is kilobytes on Linux and bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+def is_tracing():
+    return tracemalloc.is_tracing()
+
+def start_tracing(frames=10):
+    """Start tracemalloc for the whole process if it is not already running."""
+    with _tracing_lock:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+
+def stop_tracing():
+    """Stop tracemalloc for the whole process, including for every other viewer."""
+    with _tracing_lock:
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+def top_allocation_sites(limit=15):
+    """
+    Returns the source lines holding the most traced memory.
+
+    Returns:
+    -> List of dictionaries with file, line, size_bytes and count, or an
+       empty list if tracemalloc is not running
+    """
+    if not tracemalloc.is_tracing():
+        return []
+
+    snapshot = tracemalloc.take_snapshot().filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>")
+    ])
+
+    return [
+        {
+            "file": stat.traceback[0].filename,
+            "line": stat.traceback[0].lineno,
+            "size_bytes": stat.size,
+            "count": stat.count
+        }
+        for stat in snapshot.statistics("lineno")[:limit]
+    ]
+
+def all_sessions_breakdown():
+    """
+    Size the tracked keys of every active Streamlit session in this process.
+
+    This relies on Streamlit runtime internals, so it returns an empty list
+    when they are unavailable rather than failing the report.
+    """
+    try:
+        from streamlit.runtime import Runtime
+
+        session_infos = Runtime.instance()._session_mgr.list_active_sessions()
+    except Exception:
+        return []
+
+    sessions = []
+    for session_info in session_infos:
+        try:
+            state = session_info.session.session_state
+            breakdown = session_state_breakdown({key: state[key] for key in TRACKED_KEYS if key in state})
+            sessions.append({
+                "session_id": session_info.session.id,
+                "total_bytes": sum(breakdown.values()),
+                "keys": breakdown
+            })
+        except Exception:
+            continue
+
+    return sorted(sessions, key=lambda item: item["total_bytes"], reverse=True)
+
+def build_memory_report(session_state=None, include_sessions=True, top_limit=15):
+    """
+    Collect a memory report for the process and, optionally, one session.
+
+    Args:
+    -> session_state: Session state of the calling session, if any
+    -> include_sessions: Also size every active session
+    -> top_limit: Number of allocation sites to include
+
+    Returns:
+    -> JSON-safe dictionary
+    """
+    report = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "pid": os.getpid(),
+        "rss_bytes": process_rss_bytes(),
+        "tracemalloc": None,
+        "session": None,
+        "sessions": [],
+        "top_allocation_sites": top_allocation_sites(top_limit)
+    }
+
+    if tracemalloc.is_tracing():
+        current, peak = tracemalloc.get_traced_memory()
+        report["tracemalloc"] = {"current_bytes": current, "peak_bytes": peak}
+
+    if session_state is not None:
+        breakdown = session_state_breakdown(session_state)
+        report["session"] = {
+            "total_bytes": sum(breakdown.values()),
+            "tracked": {key: breakdown.get(key, 0) for key in TRACKED_KEYS},
+            "keys": breakdown
+        }
+
+    if include_sessions:
+        report["sessions"] = all_sessions_breakdown()
+
+    return report
+
+def dump_memory_report(file_path, session_state=None):
+    """Write a memory report to a JSON file and return the report."""
+    report = build_memory_report(session_state)
+
+    directory = os.path.dirname(file_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    with open(file_path, "w") as f:
+        json.dump(report, f, indent=2)
+
+    return report
+
+def format_bytes(size):
+    """Formats a byte count for display, e.g. 1.5 MB."""
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(size) < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
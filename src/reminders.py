@@ -0,0 +1,405 @@
+"""
+reminders.py
+----------------
+Author: Nida Anis
+Date: 19/10/2026
+----------------
+Description:
+-> Process-wide reminder engine for upcoming events
+"""
+
+import heapq
+import itertools
+import json
+import logging
+import os
+import subprocess
+import threading
+import urllib.request
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from src import clock
+from src.core.boards import DATA_DIR, board_paths, list_board_ids
+from src.core.change_feed import ADDED, UPDATED, REMOVED, BULK, subscribe
+from src.core.persistence import load_board_events
+
+# Lead times used for events without their own "reminders" list
+DEFAULT_LEAD_MINUTES = (15, 5)
+# Reminders never sent that were missed by less than this (e.g. during a restart) still fire
+MISSED_GRACE = timedelta(minutes=1)
+# Recent reminders kept per board for sessions to show as toasts
+TOAST_HISTORY = 50
+
+# Delivery hooks, all optional and local
+WEBHOOK_URL = os.environ.get("COUNTDOWN_REMINDER_WEBHOOK")
+COMMAND_HOOK = os.environ.get("COUNTDOWN_REMINDER_COMMAND")
+LOG_FILE = os.environ.get("COUNTDOWN_REMINDER_LOG", os.path.join(DATA_DIR, "reminders.log"))
+
+logger = logging.getLogger(__name__)
+
+def get_lead_minutes(event):
+    """Returns an event's reminder lead times in minutes."""
+    leads = event.get("reminders")
+    return DEFAULT_LEAD_MINUTES if leads is None else leads
+
+def reminder_key(board_id, event, lead_minutes):
+    """Identifies one reminder; moving the event makes it a new reminder."""
+    return (board_id, event.get("id"), lead_minutes, event["start"])
+
+def build_reminders(board_id, events, now):
+    """
+    Returns (fire_at, board_id, event, lead_minutes) for every reminder still due.
+
+    Reminders up to MISSED_GRACE late are included; the scheduler drops the
+    ones it has already sent.
+    """
+    reminders = []
+
+    for event in events:
+        for lead in get_lead_minutes(event):
+            fire_at = event["start"] - timedelta(minutes=lead)
+            if fire_at >= now - MISSED_GRACE and event["start"] > now:
+                reminders.append((fire_at, board_id, event, lead))
+
+    return reminders
+
+def format_reminder(event, lead_minutes):
+    """Human readable reminder text."""
+    return f"{event['name']} starts in {lead_minutes} minutes ({event['start'].strftime('%H:%M')})"
+
+class ReminderScheduler:
+    """
+    A single timer heap and thread serving reminders for every board and session.
+
+    Rescheduling a board or a single event bumps its generation instead of
+    searching the heap; outdated entries are dropped when they reach the top.
+    The thread only wakes when the earliest reminder is due, so 100k pending
+    reminders cost nothing between firings.
+
+    Sent reminders are remembered (and reloaded from the reminder log after a
+    restart) until their event starts, so rescheduling within the grace
+    window does not send them twice.
+    """
+
+    def __init__(self, webhook_url=WEBHOOK_URL, command_hook=COMMAND_HOOK, log_file=LOG_FILE):
+        self.heap = []
+        self.generations = {}
+        self.event_generations = {}
+        self.counter = itertools.count()
+        self.sent = set()
+        self.condition = threading.Condition()
+        self.thread = None
+        self.running = False
+
+        self.toasts = {}
+        self.toast_sequence = itertools.count(1)
+        self.last_toast_sequence = 0
+
+        self.webhook_url = webhook_url
+        self.command_hook = command_hook
+        self.log_file = log_file
+        self.reminder_logger = None
+
+        # Hooks run off the scheduler thread so a slow receiver cannot delay timers
+        self.executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="countdown-reminder-hook")
+
+    def start(self):
+        """Start the scheduler thread."""
+        if self.running:
+            return
+
+        self.running = True
+        self.thread = threading.Thread(target=self.run, name="countdown-reminders", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        with self.condition:
+            self.running = False
+            self.condition.notify()
+        self.executor.shutdown(wait=False)
+
+    def schedule_board(self, board_id, events, now=None):
+        """
+        Replace all pending reminders of a board.
+
+        Args:
+        -> board_id: Board slug
+        -> events: The board's complete list of events
+        -> now: Reference time (defaults to now)
+        """
+        reminders = build_reminders(board_id, events, now or clock.now())
+
+        with self.condition:
+            generation = self.generations.get(board_id, 0) + 1
+            self.generations[board_id] = generation
+            self.event_generations[board_id] = {}
+
+            for fire_at, _, event, lead in reminders:
+                if reminder_key(board_id, event, lead) not in self.sent:
+                    self.heap.append(self.make_entry(fire_at, board_id, event, lead))
+
+            # One heapify is cheaper than pushing a large board entry by entry
+            if not self.compact():
+                heapq.heapify(self.heap)
+            self.condition.notify()
+
+    def schedule_events(self, board_id, events, removed_ids=(), now=None):
+        """
+        Replace the pending reminders of some events of a board, leaving the rest alone.
+
+        Args:
+        -> board_id: Board slug
+        -> events: Added or changed events to schedule
+        -> removed_ids: IDs of events whose reminders are cancelled
+        -> now: Reference time (defaults to now)
+        """
+        reminders = build_reminders(board_id, events, now or clock.now())
+
+        with self.condition:
+            event_generations = self.event_generations.setdefault(board_id, {})
+            for event_id in itertools.chain(removed_ids, (event["id"] for event in events)):
+                event_generations[event_id] = event_generations.get(event_id, 0) + 1
+
+            for fire_at, _, event, lead in reminders:
+                if reminder_key(board_id, event, lead) not in self.sent:
+                    heapq.heappush(self.heap, self.make_entry(fire_at, board_id, event, lead))
+
+            self.compact()
+            self.condition.notify()
+
+    def apply_change(self, change):
+        """Change feed subscriber: reschedule only the events that changed."""
+        if change["kind"] == BULK:
+            changes = change["changes"]
+        else:
+            changes = [(change["kind"], change["event"], change["previous"])]
+
+        # Unknown deltas, events without IDs or most of a board changing: rebuild it
+        if (
+            changes is None
+            or len(changes) > len(change["events"]) // 2
+            or any((event or previous).get("id") is None for _, event, previous in changes)
+        ):
+            self.schedule_board(change["board_id"], change["events"])
+            return
+
+        self.schedule_events(
+            change["board_id"],
+            [event for kind, event, _ in changes if kind in (ADDED, UPDATED)],
+            [previous["id"] for kind, _, previous in changes if kind in (UPDATED, REMOVED)]
+        )
+
+    def make_entry(self, fire_at, board_id, event, lead):
+        """Heap entry for a reminder, tagged with the current board and event generations."""
+        # Keep only what delivery needs, not the caller's event dictionary
+        payload = {"id": event.get("id"), "name": event["name"], "start": event["start"]}
+        return (
+            fire_at,
+            next(self.counter),
+            board_id,
+            self.generations.get(board_id, 0),
+            self.event_generations.get(board_id, {}).get(payload["id"], 0),
+            payload,
+            lead
+        )
+
+    def is_live(self, entry):
+        """An entry is outdated once its board or event has been rescheduled since."""
+        _, _, board_id, generation, event_generation, payload, _ = entry
+        return (
+            self.generations.get(board_id) == generation
+            and self.event_generations.get(board_id, {}).get(payload["id"], 0) == event_generation
+        )
+
+    def compact(self):
+        """
+        Drop outdated entries once they make up half the heap (called with the lock held).
+
+        Returns:
+        -> True if the heap was rebuilt
+        """
+        if len(self.heap) < 1024:
+            return False
+
+        live = [entry for entry in self.heap if self.is_live(entry)]
+        if len(live) > len(self.heap) // 2:
+            return False
+
+        heapq.heapify(live)
+        self.heap = live
+        return True
+
+    def pending_count(self):
+        with self.condition:
+            return sum(1 for entry in self.heap if self.is_live(entry))
+
+    def load_sent(self, now=None):
+        """Remember the reminders in the log whose events have not started yet."""
+        if not self.log_file or not os.path.exists(self.log_file):
+            return
+
+        now = now or clock.now()
+        sent = set()
+
+        with open(self.log_file) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    key = (record["board"], record["event_id"], record["lead_minutes"], datetime.fromisoformat(record["start"]))
+                except (ValueError, KeyError, TypeError):
+                    continue
+
+                if key[3] > now:
+                    sent.add(key)
+
+        with self.condition:
+            self.sent |= sent
+
+    def forget_sent(self, now):
+        """Drop sent reminders of events that have started and so are never scheduled again (called with the lock held)."""
+        self.sent = {key for key in self.sent if key[3] > now}
+
+    def rebuild_from_store(self, data_dir=DATA_DIR):
+        """
+        Schedule reminders for every board on disk, e.g. after a restart.
+
+        Boards are read straight from their files rather than through the
+        board cache so that scheduling does not keep every board in memory.
+        """
+        self.load_sent()
+
+        for board_id in list_board_ids(data_dir):
+            try:
+                self.schedule_board(board_id, load_board_events(board_paths(board_id)))
+            except Exception:
+                logger.exception("Could not schedule reminders for board %s", board_id)
+
+    def run(self):
+        """Wait for the earliest reminder, then deliver everything that is due."""
+        while True:
+            with self.condition:
+                if not self.running:
+                    return
+
+                due = []
+                now = clock.now()
+                while self.heap and self.heap[0][0] <= now:
+                    entry = heapq.heappop(self.heap)
+                    if self.is_live(entry):
+                        due.append(entry)
+
+                if due:
+                    # Marked before delivery so a reschedule in the meantime cannot queue them again
+                    self.forget_sent(now)
+                    for _, _, board_id, _, _, event, lead in due:
+                        self.sent.add(reminder_key(board_id, event, lead))
+                else:
+                    timeout = clock.real_seconds_until(self.heap[0][0], now) if self.heap else None
+                    self.condition.wait(timeout)
+                    continue
+
+            for _, _, board_id, _, _, event, lead in due:
+                self.deliver(board_id, event, lead)
+
+    def deliver(self, board_id, event, lead_minutes):
+        """Send a due reminder to every configured channel."""
+        message = format_reminder(event, lead_minutes)
+        record = {
+            "board": board_id,
+            "event_id": event["id"],
+            "event_name": event["name"],
+            "start": event["start"].isoformat(),
+            "lead_minutes": lead_minutes,
+            "message": message,
+            "sent_at": clock.now().isoformat(timespec="seconds")
+        }
+
+        # In-app toasts are picked up by sessions on their next rerun
+        with self.condition:
+            sequence = next(self.toast_sequence)
+            self.last_toast_sequence = sequence
+            self.toasts.setdefault(board_id, deque(maxlen=TOAST_HISTORY)).append((sequence, message))
+
+        if self.log_file:
+            self.write_log(record)
+        if self.webhook_url:
+            self.executor.submit(self.post_webhook, record)
+        if self.command_hook:
+            self.executor.submit(self.run_command, record)
+
+    def get_toasts(self, board_id, after_sequence):
+        """Returns (latest sequence, messages newer than after_sequence) for a board."""
+        with self.condition:
+            messages = [message for sequence, message in self.toasts.get(board_id, ()) if sequence > after_sequence]
+            return self.last_toast_sequence, messages
+
+    def write_log(self, record):
+        if self.reminder_logger is None:
+            directory = os.path.dirname(self.log_file)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            self.reminder_logger = logging.getLogger(f"{__name__}.log")
+            self.reminder_logger.propagate = False
+            self.reminder_logger.setLevel(logging.INFO)
+            handler = logging.FileHandler(self.log_file)
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            self.reminder_logger.addHandler(handler)
+
+        self.reminder_logger.info(json.dumps(record))
+
+    def post_webhook(self, record):
+        try:
+            request = urllib.request.Request(
+                self.webhook_url,
+                data=json.dumps(record).encode("utf-8"),
+                headers={"Content-Type": "application/json"},
+                method="POST"
+            )
+            urllib.request.urlopen(request, timeout=5).close()
+        except Exception:
+            logger.exception("Reminder webhook failed")
+
+    def run_command(self, record):
+        # The reminder is passed as JSON on stdin and as environment variables
+        env = {
+            **os.environ,
+            "COUNTDOWN_BOARD": record["board"],
+            "COUNTDOWN_EVENT": record["event_name"],
+            "COUNTDOWN_START": record["start"],
+            "COUNTDOWN_LEAD_MINUTES": str(record["lead_minutes"]),
+            "COUNTDOWN_MESSAGE": record["message"]
+        }
+
+        try:
+            subprocess.run(
+                self.command_hook,
+                shell=True,
+                input=json.dumps(record),
+                text=True,
+                env=env,
+                timeout=30,
+                check=False
+            )
+        except Exception:
+            logger.exception("Reminder command failed")
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+def get_scheduler():
+    """Returns the process-wide scheduler, starting it and loading the store on first use."""
+    global _scheduler
+
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = ReminderScheduler()
+            # Subscribed before loading so no save in between is missed
+            subscribe(_scheduler.apply_change)
+            _scheduler.rebuild_from_store()
+            _scheduler.start()
+
+        return _scheduler
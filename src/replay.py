@@ -0,0 +1,161 @@
+"""
+replay.py
+----------------
+Author: Nida Anis
+Date: 19/10/2026
+----------------
+Description:
+-> Accelerated schedule replay recording state transitions and render cost
+
+Usage:
+-> python -m src.replay --hours 24 --speed 3600
+-> python -m src.replay --board room-1 --start 2026-10-20T08:00 --renderer app --json replay.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import time
+
+from datetime import datetime, timedelta
+
+from src import clock
+from src.core.boards import DEFAULT_BOARD
+from src.core.countdowns import format_remaining_time
+from src.core.queries import get_current_and_next_event, get_next_transition
+from src.core.store import get_board
+
+# Step just past each boundary so the start/end comparison has flipped
+STEP_MARGIN = timedelta(milliseconds=1)
+APP_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "streamlit_app.py")
+
+def render_core(events, now):
+    """Renders what a board shows without Streamlit: active/next event and every countdown."""
+    current_event, next_event = get_current_and_next_event(events, now)
+    countdowns = [
+        format_remaining_time(event["start"] - now)
+        for event in sorted(events, key=lambda x: x["start"])
+        if event["end"] > now
+    ]
+    return current_event, next_event, countdowns
+
+def make_app_renderer(query_params=None):
+    """Returns a renderer that reruns the real app headlessly with AppTest."""
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file(APP_SCRIPT, default_timeout=60)
+    for key, value in (query_params or {}).items():
+        app.query_params[key] = value
+
+    def render_app(events, now):
+        app.run()
+        if app.exception:
+            raise RuntimeError(app.exception[0].message)
+
+    return render_app
+
+def replay_schedule(events, start, end, speed=None, render=render_core):
+    """
+    Replay a schedule between two moments, stopping at every start and end.
+
+    Args:
+    -> events: List of event dictionaries
+    -> start: Datetime to start the replay at
+    -> end: Datetime to stop at
+    -> speed: Simulated seconds per real second; None jumps straight from
+       one transition to the next
+    -> render: Callable (events, now) timed at every step
+
+    Returns:
+    -> Dictionary with the recorded steps and a summary
+    """
+    source = clock.ManualClock(start) if speed is None else clock.ReplayClock(start, speed)
+    steps = []
+    previous_state = None
+    wall_start = time.perf_counter()
+
+    with clock.use_time_source(source):
+        moment = start
+
+        while moment <= end:
+            if speed is None:
+                source.jump(moment)
+            else:
+                time.sleep(clock.real_seconds_until(moment))
+
+            now = clock.now()
+            current_event, next_event = get_current_and_next_event(events, now)
+            state = (
+                current_event["id"] if current_event else None,
+                next_event["id"] if next_event else None
+            )
+
+            render_started = time.perf_counter()
+            render(events, now)
+            render_ms = (time.perf_counter() - render_started) * 1000
+
+            steps.append({
+                "at": now.isoformat(timespec="seconds"),
+                "current_event": current_event["name"] if current_event else None,
+                "next_event": next_event["name"] if next_event else None,
+                "transition": state != previous_state,
+                "render_ms": render_ms
+            })
+            previous_state = state
+
+            next_transition = get_next_transition(events, now)
+            if next_transition is None:
+                break
+            moment = next_transition + STEP_MARGIN
+
+    render_costs = sorted(step["render_ms"] for step in steps)
+    return {
+        "start": start.isoformat(timespec="seconds"),
+        "end": end.isoformat(timespec="seconds"),
+        "speed": speed,
+        "events": len(events),
+        "steps": steps,
+        "summary": {
+            "steps": len(steps),
+            "transitions": sum(1 for step in steps if step["transition"]),
+            "wall_seconds": time.perf_counter() - wall_start,
+            "render_ms_mean": statistics.fmean(render_costs) if render_costs else 0.0,
+            "render_ms_p95": render_costs[int(0.95 * (len(render_costs) - 1))] if render_costs else 0.0,
+            "render_ms_max": render_costs[-1] if render_costs else 0.0
+        }
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a board's schedule at accelerated speed")
+    parser.add_argument("--board", default=DEFAULT_BOARD)
+    parser.add_argument("--start", help="ISO datetime to start at (default: now)")
+    parser.add_argument("--hours", type=float, default=24, help="Length of the replay")
+    parser.add_argument("--speed", type=float, help="Simulated seconds per real second (default: jump between transitions)")
+    parser.add_argument("--renderer", choices=["core", "app"], default="core")
+    parser.add_argument("--json", help="Write the full replay to this file")
+    args = parser.parse_args()
+
+    start = datetime.fromisoformat(args.start) if args.start else datetime.now()
+    end = start + timedelta(hours=args.hours)
+    events = [event.copy() for event in get_board(args.board)["events"]]
+
+    render = render_core if args.renderer == "core" else make_app_renderer({"board": args.board})
+    result = replay_schedule(events, start, end, args.speed, render)
+
+    for step in result["steps"]:
+        if step["transition"]:
+            print(f"{step['at']}  active: {step['current_event'] or '-':<30} next: {step['next_event'] or '-':<30} {step['render_ms']:.2f} ms")
+
+    summary = result["summary"]
+    print(
+        f"{summary['steps']} steps, {summary['transitions']} transitions in {summary['wall_seconds']:.2f}s; "
+        f"render mean {summary['render_ms_mean']:.2f} ms, p95 {summary['render_ms_p95']:.2f} ms, max {summary['render_ms_max']:.2f} ms"
+    )
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(result, f, indent=2)
+
+if __name__ == "__main__":
+    main()
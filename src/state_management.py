@@ -9,9 +9,12 @@ Description:
 """
 
 import streamlit as st
-import os
 
-from datetime import datetime
+from src import clock
+from src.boards import DEFAULT_BOARD, get_session_board_paths
+from src.core.model import split_past_events
+from src.core.store import prune_board
+from src.logo_processing import process_logo
 
 def initialise_session_state():
     """Make sure that session state variables exist."""
@@ -22,21 +25,42 @@ def initialise_session_state():
         st.session_state["error_messages"] = []
     
     if "team_logo" not in st.session_state:
-        st.session_state["team logo"] = None
+        st.session_state["team_logo"] = None
     
 def save_uploaded_file(uploaded_file):
-    """Saves the uploaded file to a designated folder, updates session state."""
-    os.makedirs("assets", exist_ok=True)
-    file_path = os.path.join("assets", "team_logo.png")
-
-    with open(file_path, "wb") as f:
-        f.write(uploaded_file.getbuffer())
+    """
+    Saves the uploaded logo as display-sized variants, updates session state.
 
+    Raises:
+    -> ValueError: If the upload is not a usable image
+    """
+    file_path = process_logo(uploaded_file, get_session_board_paths()["logo_dir"])
     st.session_state["team_logo"] = file_path
 
-def remove_past_events():
-    """Removes past events from session state."""
+def remove_past_events(archive=True):
+    """
+    Moves past events from session state into the monthly archive.
+
+    The board is pruned through the store, which archives each finished
+    event once however many sessions are showing the board.
+
+    Args:
+    -> archive: Write finished events to the archive; read-only views pass False
+    """
     if "events" in st.session_state:
-        st.session_state["events"] = [
-            event for event in st.session_state["events"] if event["end"] > datetime.now()
-        ]
+        now = clock.now()
+        upcoming_events, past_events = split_past_events(st.session_state["events"], now)
+
+        # Nothing finished since the last rerun, so leave the list untouched
+        if not past_events:
+            return
+
+        if archive:
+            try:
+                prune_board(st.session_state.get("board_id", DEFAULT_BOARD), now)
+            except Exception as e:
+                # Keep the events in the hot set rather than losing them
+                st.warning(f"Could not archive past events: {str(e)}")
+                return
+
+        st.session_state["events"] = upcoming_events
@@ -0,0 +1,429 @@
+"""
+static_export.py
+----------------
+Author: Nida Anis
+Date: 19/10/2026
+----------------
+Description:
+-> Renders a board into one self-contained HTML file for offline kiosks
+
+Usage:
+-> python -m src.static_export --board room-1
+-> python -m src.static_export --output /srv/kiosk/index.html
+"""
+
+import argparse
+import base64
+import hashlib
+import html
+import json
+import logging
+import os
+import threading
+
+from string import Template
+
+from src import clock
+from src.core.boards import DEFAULT_BOARD, board_paths
+from src.core.store import get_board, get_persister
+from src.core.themes import adjust_brightness, build_theme_css, resolve_theme
+from src.logo_processing import find_logo, variant_path
+
+EXPORT_FILENAME = "board.html"
+VERSION_MARKER = "<!-- countdown-version: "
+# Quiet period after a save before re-exporting, so a burst of edits costs one render
+EXPORT_DEBOUNCE_SECONDS = 1.0
+
+logger = logging.getLogger(__name__)
+
+# The page keeps itself up to date in the browser: the clock ticks, countdowns
+# run and finished events drop off without any request to the server.
+PAGE_TEMPLATE = Template("""$version_marker$version -->
+<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>$title</title>
+$theme_css
+<style>
+    body {
+        margin: 0 auto;
+        padding: 16px;
+        max-width: 1200px;
+    }
+
+    .logo-container {
+        text-align: center;
+        margin: 3px 0;
+    }
+
+    .logo-container img {
+        height: 100px;
+        width: auto;
+    }
+
+    .logo-container h1 {
+        font-size: 2.5rem;
+        margin: 0;
+    }
+
+    .clock-container {
+        text-align: center;
+        padding: 40px 0;
+        font-size: 150px;
+        font-weight: bold;
+        border-radius: 10px;
+    }
+
+    .active-event, .next-event {
+        text-align: center;
+    }
+
+    .active-event {
+        font-size: 50px;
+        margin-top: 20px;
+    }
+
+    .next-event {
+        font-size: 30px;
+        margin-top: 10px;
+    }
+
+    .event-card {
+        background-color: $card_colour;
+        padding: 15px;
+        border-radius: 10px;
+        margin-bottom: 15px;
+        border-left: 5px solid $primary_colour;
+    }
+</style>
+</head>
+<body>
+<div class="logo-container">$logo_html</div>
+<div class="clock-container" id="clock"></div>
+<h2 class="active-event" id="current-event" hidden></h2>
+<h3 class="next-event" id="next-event" hidden></h3>
+<h3>Upcoming events</h3>
+<div id="event-list"></div>
+<script>
+var EVENTS = $events_json.map(function (event) {
+    // Naive ISO datetimes are parsed as local time, matching the app
+    return {name: event.name, start: new Date(event.start), end: new Date(event.end)};
+});
+
+function pad(value) {
+    return (value < 10 ? "0" : "") + value;
+}
+
+function formatTime(date) {
+    return pad(date.getHours()) + ":" + pad(date.getMinutes()) + ":" + pad(date.getSeconds());
+}
+
+function formatDateTime(date) {
+    return date.getFullYear() + "-" + pad(date.getMonth() + 1) + "-" + pad(date.getDate()) + " " + formatTime(date);
+}
+
+function formatRemaining(milliseconds) {
+    // Same output as format_remaining_time in core/countdowns.py
+    if (milliseconds <= 0) {
+        return "now";
+    }
+
+    var total = Math.floor(milliseconds / 1000);
+    var days = Math.floor(total / 86400);
+    var hours = Math.floor(total % 86400 / 3600);
+    var minutes = Math.floor(total % 3600 / 60);
+    var seconds = total % 60;
+
+    if (days >= 7) {
+        return days + " days";
+    } else if (days > 0) {
+        return days + " days " + pad(hours) + pad(minutes);
+    } else if (hours > 0) {
+        return hours + "h " + pad(minutes) + "m";
+    }
+    return pad(minutes) + ":" + pad(seconds);
+}
+
+function addLine(card, label, value) {
+    var line = document.createElement("p");
+    var strong = document.createElement("strong");
+    strong.textContent = label + ":";
+    line.appendChild(strong);
+    line.appendChild(document.createTextNode(" " + value));
+    card.appendChild(line);
+}
+
+function buildCards(events) {
+    var list = document.getElementById("event-list");
+    list.textContent = "";
+
+    if (!events.length) {
+        var empty = document.createElement("p");
+        empty.textContent = "No upcoming events.";
+        list.appendChild(empty);
+        return [];
+    }
+
+    return events.map(function (event) {
+        var card = document.createElement("div");
+        card.className = "event-card";
+
+        var heading = document.createElement("h3");
+        heading.textContent = event.name;
+        card.appendChild(heading);
+
+        addLine(card, "Start", formatDateTime(event.start));
+        addLine(card, "End", formatDateTime(event.end));
+        addLine(card, "Time until start", "");
+
+        list.appendChild(card);
+        return card.lastChild.lastChild;
+    });
+}
+
+function showEvent(element, text) {
+    element.hidden = text === null;
+    element.textContent = text || "";
+}
+
+var shown = null;
+var countdowns = [];
+
+function tick() {
+    var now = new Date();
+    var upcoming = EVENTS.filter(function (event) { return event.end > now; });
+
+    // Rebuild the list only when an event has finished, not every second
+    if (shown === null || upcoming.length !== shown.length) {
+        shown = upcoming;
+        countdowns = buildCards(upcoming);
+    }
+
+    var current = null;
+    var next = null;
+    for (var i = 0; i < upcoming.length; i++) {
+        var event = upcoming[i];
+        if (current === null && event.start <= now && now <= event.end) {
+            current = event;
+        }
+        if (next === null && event.start > now) {
+            next = event;
+        }
+        countdowns[i].textContent = " " + formatRemaining(event.start - now);
+    }
+
+    document.getElementById("clock").textContent = formatTime(now);
+    showEvent(document.getElementById("current-event"), current ? "Currently active: " + current.name : null);
+    showEvent(
+        document.getElementById("next-event"),
+        next ? "Next event: " + next.name + " at " + pad(next.start.getHours()) + ":" + pad(next.start.getMinutes()) : null
+    );
+
+    // Wake on the next whole second so the clock does not drift
+    setTimeout(tick, 1000 - now.getMilliseconds());
+}
+
+tick();
+</script>
+</body>
+</html>
+""")
+
+def export_path(board_id=DEFAULT_BOARD):
+    """Returns where a board's static page is written by default."""
+    return os.path.join(board_paths(board_id)["data_dir"], EXPORT_FILENAME)
+
+def logo_data_uri(logo_path):
+    """Returns a base64 data URI for a logo file."""
+    mime_type = "image/webp" if logo_path.endswith(".webp") else "image/png"
+
+    with open(logo_path, "rb") as f:
+        encoded = base64.b64encode(f.read()).decode("utf-8")
+
+    return f"data:{mime_type};base64,{encoded}"
+
+def get_board_logo(board_id, settings):
+    """Returns the paths of a board's 1x and, if present, 2x logo, or (None, None)."""
+    logo_path = settings.get("team_logo") or find_logo(board_paths(board_id)["logo_dir"])
+    if not logo_path or not os.path.exists(logo_path):
+        return None, None
+
+    extension = logo_path.rsplit(".", 1)[-1]
+    hidpi_path = variant_path(extension, 2, os.path.dirname(logo_path))
+    return logo_path, hidpi_path if os.path.exists(hidpi_path) else None
+
+def get_export_version(board_id=DEFAULT_BOARD):
+    """
+    Returns the version a board's static page is built from.
+
+    Combines the store version with the logo files, so a new upload also
+    triggers a rebuild.
+    """
+    board = get_board(board_id)
+    logo_stats = [
+        f"{path}:{os.stat(path).st_mtime_ns}"
+        for path in get_board_logo(board_id, board["settings"])
+        if path
+    ]
+    key = "|".join([board_id, *board["version"], *logo_stats])
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+def render_board_html(board_id=DEFAULT_BOARD, version=None, now=None):
+    """
+    Render a board as a standalone HTML page.
+
+    Args:
+    -> board_id: Board slug
+    -> version: Version recorded in the page (defaults to get_export_version)
+    -> now: Events that ended before this are left out (defaults to now)
+
+    Returns:
+    -> The HTML as a string
+    """
+    board = get_board(board_id)
+    now = now or clock.now()
+    theme = resolve_theme(board["settings"].get("active_theme", "light"), board["themes"])
+
+    logo_path, hidpi_path = get_board_logo(board_id, board["settings"])
+    if logo_path:
+        # src is the 1x candidate and the fallback for browsers without srcset
+        srcset = f' srcset="{logo_data_uri(hidpi_path)} 2x"' if hidpi_path else ""
+        logo_html = f'<img src="{logo_data_uri(logo_path)}"{srcset} alt="Team logo">'
+    else:
+        logo_html = "<h1>Countdown Timer Pro</h1>"
+
+    events = [
+        {"name": event["name"], "start": event["start"].isoformat(), "end": event["end"].isoformat()}
+        for event in board["events"]
+        if event["end"] > now
+    ]
+
+    return PAGE_TEMPLATE.substitute(
+        version_marker=VERSION_MARKER,
+        version=version or get_export_version(board_id),
+        title=html.escape(f"Countdown - {board_id}"),
+        theme_css=build_theme_css(theme),
+        card_colour=adjust_brightness(theme["background_colour"], 10),
+        primary_colour=theme["primary_colour"],
+        logo_html=logo_html,
+        # "</" would end the script element early if an event name contained it
+        events_json=json.dumps(events).replace("</", "<\\/")
+    )
+
+def read_export_version(output_path):
+    """Returns the version recorded in an existing export, or None."""
+    try:
+        with open(output_path, "r", encoding="utf-8") as f:
+            first_line = f.readline()
+    except FileNotFoundError:
+        return None
+
+    if not first_line.startswith(VERSION_MARKER):
+        return None
+    return first_line[len(VERSION_MARKER):].split(" ", 1)[0]
+
+def export_board_html(board_id=DEFAULT_BOARD, output_path=None, force=False):
+    """
+    Write a board's static page, skipping the write if the store has not changed.
+
+    Args:
+    -> board_id: Board slug
+    -> output_path: File to write (defaults to board.html in the board's data folder)
+    -> force: Rebuild even if the existing file is current
+
+    Returns:
+    -> Tuple of (output path, True if the file was rewritten)
+    """
+    output_path = output_path or export_path(board_id)
+    version = get_export_version(board_id)
+
+    if not force and read_export_version(output_path) == version:
+        return output_path, False
+
+    page = render_board_html(board_id, version)
+
+    directory = os.path.dirname(output_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    tmp_path = f"{output_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(page)
+    os.replace(tmp_path, output_path)
+
+    return output_path, True
+
+class StaticExporter:
+    """
+    Keeps exported board pages current as boards are saved.
+
+    Listens for completed writes rather than edits, so the page is built
+    from the version on disk. Only boards already exported to their default
+    location (by the CLI or /board.html) are rewritten.
+    """
+
+    def __init__(self, debounce=EXPORT_DEBOUNCE_SECONDS):
+        self.debounce = debounce
+        self.lock = threading.Lock()
+        self.pending = set()
+        self.timer = None
+        self.remove_listener = None
+
+    def queue(self, board_id):
+        """Collect a written board and export once saves have been quiet briefly."""
+        with self.lock:
+            self.pending.add(board_id)
+            if self.timer is not None:
+                self.timer.cancel()
+            self.timer = threading.Timer(self.debounce, self.flush)
+            self.timer.daemon = True
+            self.timer.start()
+
+    def flush(self):
+        with self.lock:
+            board_ids = self.pending
+            self.pending = set()
+            self.timer = None
+
+        for board_id in board_ids:
+            if not os.path.exists(export_path(board_id)):
+                continue
+            try:
+                export_board_html(board_id)
+            except Exception:
+                logger.exception("Static export of board %s failed", board_id)
+
+    def start(self):
+        self.remove_listener = get_persister().add_listener(self.queue)
+
+    def stop(self):
+        if self.remove_listener is not None:
+            self.remove_listener()
+            self.remove_listener = None
+
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+            self.pending = set()
+
+def start_static_export():
+    """Start rewriting exported board pages whenever their board is saved."""
+    exporter = StaticExporter()
+    exporter.start()
+    return exporter
+
+def main():
+    parser = argparse.ArgumentParser(description="Export a board as a self-contained HTML page")
+    parser.add_argument("--board", default=DEFAULT_BOARD)
+    parser.add_argument("--output", help="File to write (default: board.html in the board's data folder)")
+    parser.add_argument("--force", action="store_true", help="Rebuild even if the store has not changed")
+    args = parser.parse_args()
+
+    output_path, written = export_board_html(args.board, args.output, args.force)
+    print(f"{'Wrote' if written else 'Up to date:'} {output_path}")
+
+if __name__ == "__main__":
+    main()
@@ -12,26 +12,85 @@ import streamlit as st
 import os
 
 from datetime import datetime
+from streamlit_autorefresh import st_autorefresh
 
+from src import clock
 from src.state_management import initialise_session_state
-from src.display import display_clock, display_event_list, display_team_logo
-from src.forms import add_event_form, edit_event_form, upload_logo_form
+from src.display import (
+    display_clock,
+    display_event_list,
+    display_team_logo,
+    display_memory_debug_panel,
+    display_reminder_toasts,
+    display_save_status
+)
+from src.forms import add_event_form, edit_event_form, upload_logo_form, bulk_edit_form
 from src.calendar_view import display_calendar_view
+from src.timeline_view import display_timeline_view
 from src.export_events import display_export_options
 from src.import_events import display_import_options
 from src.ui_themes import initialise_themes, apply_theme
 from src.theme_controls import dark_mode_toggle
 from src.database import initialise_db, save_session_data
+from src.api import start_api_server
+from src.reminders import get_scheduler
+from src.ics_sync import start_ics_sync
+from src.static_export import start_static_export
 
-def configure_page():
+# Kiosk displays can also be forced for the whole process, e.g. on wall screens
+KIOSK_ENV_VAR = "COUNTDOWN_KIOSK"
+KIOSK_REFRESH_MS = 1000
+TRUTHY_VALUES = ("1", "true", "yes", "on")
+
+def is_kiosk_mode():
+    """Kiosk mode is enabled with ?kiosk=1 or the COUNTDOWN_KIOSK environment variable."""
+    if os.environ.get(KIOSK_ENV_VAR, "").lower() in TRUTHY_VALUES:
+        return True
+    return st.query_params.get("kiosk", "").lower() in TRUTHY_VALUES
+
+def is_debug_mode():
+    """Debug panels are shown with ?debug=1 or the COUNTDOWN_DEBUG environment variable."""
+    return (
+        os.environ.get("COUNTDOWN_DEBUG", "").lower() in TRUTHY_VALUES
+        or st.query_params.get("debug", "").lower() in TRUTHY_VALUES
+    )
+
+def configure_page(kiosk=False):
     """Configure streamlit page settings."""
     st.set_page_config(
         page_title="Countdown Timer Pro",
         page_icon="⏳",
         layout="wide",
-        initial_sidebar_state="auto"
+        initial_sidebar_state="collapsed" if kiosk else "auto"
     )
 
+@st.cache_resource
+def start_background_services():
+    """Start process-wide services once, shared by every session."""
+    # Replay mode runs the whole app on an accelerated clock (COUNTDOWN_REPLAY_SPEED=60)
+    replay_speed = os.environ.get("COUNTDOWN_REPLAY_SPEED")
+    if replay_speed:
+        replay_start = os.environ.get("COUNTDOWN_REPLAY_START")
+        clock.set_time_source(clock.ReplayClock(
+            datetime.fromisoformat(replay_start) if replay_start else datetime.now(),
+            float(replay_speed)
+        ))
+
+    try:
+        start_api_server()
+    except OSError:
+        # Another app process already serves the API on this port
+        pass
+
+    # Reminders for every board, rebuilt from the store after a restart
+    get_scheduler()
+
+    # Keep a board in step with a folder of .ics exports (COUNTDOWN_ICS_DIR)
+    start_ics_sync()
+
+    # Rewrite exported offline pages (data/.../board.html) on every save
+    start_static_export()
+
 def apply_styles():
     """Apply custom styles and themes."""
     # Initialise and apply theme
@@ -80,10 +139,38 @@ def apply_styles():
 
     return theme
 
+def kiosk_main():
+    """
+    Minimal read-only board for wall screens.
+
+    Renders only the logo, clock and (unless ?list=0) the upcoming events,
+    with no sidebar, editors or uploaders, and never writes to the store.
+    """
+    initialise_db(read_only=True)
+    apply_styles()
+
+    # Tick the clock without any user interaction
+    st_autorefresh(interval=KIOSK_REFRESH_MS, key="kiosk_refresh")
+
+    display_team_logo()
+    display_reminder_toasts()
+    display_clock(read_only=True)
+
+    if st.query_params.get("list", "1") != "0":
+        display_event_list(read_only=True)
+
 def main():
     """Main Countdown Timer Pro program."""
+    kiosk = is_kiosk_mode()
+
     # Configure page and initialise session state
-    configure_page()
+    configure_page(kiosk)
+    start_background_services()
+
+    if kiosk:
+        kiosk_main()
+        return
+
     initialise_session_state()
 
     # Initialise database and load savefd data
@@ -95,6 +182,12 @@ def main():
     # Display logo
     display_team_logo()
 
+    # Show reminders fired since the last rerun
+    display_reminder_toasts()
+
+    # Saves are written in the background, so report writes that keep failing
+    display_save_status()
+
     # Display clock
     display_clock()
 
@@ -102,6 +195,7 @@ def main():
     tabs = st.tabs([
         "Upcoming events",
         "Calendar view",
+        "Timeline",
         "Import/export"
     ])
 
@@ -110,6 +204,9 @@ def main():
 
         # Display events list
         display_event_list()
+
+        # Bulk operations on many events at once
+        bulk_edit_form()
     
     with tabs[1]:
         st.subheader("Calendar view")
@@ -118,6 +215,12 @@ def main():
         display_calendar_view()
 
     with tabs[2]:
+        st.subheader("Timeline")
+
+        # Aggregated density, for schedules too large to draw event by event
+        display_timeline_view()
+
+    with tabs[3]:
         col1, col2 = st.columns(2)
 
         with col1:
@@ -163,6 +266,10 @@ def main():
             Version 0.0.1 © Nida Anis, 2025     
             """)
 
+    # Memory accounting for sizing hosts and spotting session leaks
+    if is_debug_mode():
+        display_memory_debug_panel()
+
     # Save session data to database when app refreshes
     save_session_data()
 
@@ -0,0 +1,15 @@
+import pytest
+
+from src.core import store
+
+@pytest.fixture
+def board_dir(tmp_path, monkeypatch):
+    """Runs a test against empty board storage in a temporary directory."""
+    monkeypatch.chdir(tmp_path)
+    store._board_cache.clear()
+
+    yield tmp_path
+
+    # Queued writes use relative paths, so finish them before leaving the directory
+    store.get_persister().flush()
+    store._board_cache.clear()
@@ -0,0 +1,78 @@
+import http.client
+import json
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.api import start_api_server
+from src.core.model import new_event_id
+from src.core.store import save_board_events
+
+@pytest.fixture(scope="module")
+def api_port():
+    _, port = start_api_server(port=0)
+    return port
+
+def make_event(name, start):
+    return {"id": new_event_id(), "name": name, "start": start, "end": start + timedelta(hours=1)}
+
+def request(port, path, headers=None):
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+    try:
+        connection.request("GET", path, headers=headers or {})
+        response = connection.getresponse()
+        return response.status, response.getheader("Etag"), response.read()
+    finally:
+        connection.close()
+
+def test_events_returns_saved_events(board_dir, api_port):
+    start = datetime(2030, 1, 1, 9)
+    save_board_events("default", [make_event("Second", start + timedelta(hours=2)), make_event("First", start)])
+
+    status, etag, body = request(api_port, "/api/events")
+
+    assert status == 200
+    assert etag
+    assert [event["name"] for event in json.loads(body)["events"]] == ["First", "Second"]
+
+def test_events_window(board_dir, api_port):
+    start = datetime(2030, 1, 1, 9)
+    save_board_events("default", [make_event("Morning", start), make_event("Evening", start + timedelta(hours=9))])
+
+    status, _, body = request(api_port, "/api/events?start=2030-01-01T12:00")
+
+    assert status == 200
+    assert [event["name"] for event in json.loads(body)["events"]] == ["Evening"]
+
+def test_if_none_match_returns_304_until_the_board_changes(board_dir, api_port):
+    start = datetime(2030, 1, 1, 9)
+    events = [make_event("Standup", start)]
+    save_board_events("default", events)
+
+    _, etag, _ = request(api_port, "/api/events")
+    status, _, body = request(api_port, "/api/events", {"If-None-Match": etag})
+
+    assert status == 304
+    assert body == b""
+
+    save_board_events("default", events + [make_event("Review", start + timedelta(hours=3))])
+    status, new_etag, body = request(api_port, "/api/events", {"If-None-Match": etag})
+
+    assert status == 200
+    assert new_etag != etag
+    assert len(json.loads(body)["events"]) == 2
+
+def test_state_etag(board_dir, api_port):
+    save_board_events("default", [make_event("Later", datetime(2030, 1, 1, 9))])
+
+    status, etag, body = request(api_port, "/api/state")
+    assert status == 200
+    assert json.loads(body)["next_event"]["name"] == "Later"
+
+    status, _, _ = request(api_port, "/api/state", {"If-None-Match": etag})
+    assert status == 304
+
+def test_invalid_arguments_are_rejected(board_dir, api_port):
+    assert request(api_port, "/api/events?start=tomorrow")[0] == 400
+    assert request(api_port, "/api/events?board=Not%20A%20Board")[0] == 400
@@ -0,0 +1,74 @@
+import gzip
+import threading
+import time
+
+from datetime import datetime, timedelta
+
+from src.core.archive import archive_events, list_partitions, partition_path, query_archive
+from src.core import store
+from src.core.store import get_board, prune_board, save_board_events
+
+def make_event(name, start, hours=1):
+    return {"id": name.lower(), "name": name, "start": start, "end": start + timedelta(hours=hours)}
+
+def test_round_trip(tmp_path):
+    events = [make_event("First", datetime(2030, 1, 5, 9)), make_event("Second", datetime(2030, 1, 6, 9))]
+
+    assert archive_events(events, str(tmp_path)) == 2
+    assert archive_events([], str(tmp_path)) == 0
+
+    assert list(query_archive(archive_dir=str(tmp_path))) == events
+
+def test_appends_across_partitions(tmp_path):
+    january = make_event("January", datetime(2030, 1, 31, 9))
+    # Partitioned by end time, so this one lands in February
+    overnight = make_event("Overnight", datetime(2030, 1, 31, 23), hours=2)
+    march = make_event("March", datetime(2030, 3, 1, 9))
+
+    archive_events([january, overnight], str(tmp_path))
+    archive_events([march], str(tmp_path))
+
+    assert list_partitions(str(tmp_path)) == ["2030-01", "2030-02", "2030-03"]
+    assert [event["name"] for event in query_archive(archive_dir=str(tmp_path))] == ["January", "Overnight", "March"]
+
+    # Two appends to one partition are two gzip members, read back as one stream
+    archive_events([make_event("Later", datetime(2030, 3, 2, 9))], str(tmp_path))
+    with gzip.open(partition_path("2030-03", str(tmp_path)), "rt") as f:
+        assert len(f.readlines()) == 2
+
+def test_window_filter(tmp_path):
+    events = [make_event(f"Day {day}", datetime(2030, month, day, 9)) for month in (1, 2, 3) for day in (1, 15)]
+    archive_events(events, str(tmp_path))
+
+    names = lambda **window: [event["name"] for event in query_archive(archive_dir=str(tmp_path), **window)]
+
+    assert len(names(start=datetime(2030, 2, 1))) == 4
+    assert len(names(end=datetime(2030, 1, 31))) == 2
+    assert len(names(start=datetime(2030, 1, 15, 9, 30), end=datetime(2030, 2, 1, 9, 30))) == 2
+    assert names(start=datetime(2031, 1, 1)) == []
+
+def test_missing_archive(tmp_path):
+    assert list_partitions(str(tmp_path / "missing")) == []
+    assert list(query_archive(archive_dir=str(tmp_path / "missing"))) == []
+
+def test_concurrent_prunes_archive_each_event_once(board_dir, monkeypatch):
+    def slow_archive_events(events, archive_dir):
+        # Widen the window in which sessions would otherwise both see the same finished events
+        time.sleep(0.05)
+        return archive_events(events, archive_dir)
+
+    monkeypatch.setattr(store, "archive_events", slow_archive_events)
+    start = datetime(2030, 1, 1, 9)
+    save_board_events("default", [make_event(f"Event {i}", start + timedelta(hours=i)) for i in range(20)])
+    now = start + timedelta(hours=10, minutes=30)
+
+    threads = [threading.Thread(target=prune_board, args=("default", now)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    archived = list(query_archive(archive_dir="data/archive"))
+    assert len(archived) == 10
+    assert len({event["id"] for event in archived}) == 10
+    assert len(get_board("default")["events"]) == 10
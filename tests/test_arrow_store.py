@@ -0,0 +1,37 @@
+from datetime import datetime, timedelta
+
+from src.arrow_store import load_snapshot_events, write_snapshot
+
+def make_event(name, start, **fields):
+    return {"id": name.lower(), "name": name, "start": start, "end": start + timedelta(hours=1), **fields}
+
+def test_round_trip_keeps_every_field(tmp_path):
+    start = datetime(2030, 1, 1, 9, 0, 0, 123456)
+    events = [
+        make_event("Whole", start, duration=60),
+        make_event("Fraction", start, duration=30.5),
+        make_event("Text", start, duration="45"),
+        make_event("Missing", start),
+        make_event("Extra", start, duration=15, reminders=[10], location="Room 1")
+    ]
+    snapshot_file = str(tmp_path / "events.arrow")
+
+    write_snapshot(events, snapshot_file)
+    loaded = load_snapshot_events(snapshot_file)
+
+    assert loaded[0] == events[0]
+    assert loaded[1]["duration"] == 30.5
+    assert loaded[2]["duration"] == "45"
+    assert loaded[3]["duration"] is None
+    assert loaded[4] == events[4]
+    assert type(loaded[0]["duration"]) is int
+
+def test_window_filter(tmp_path):
+    start = datetime(2030, 1, 1, 9)
+    events = [make_event(f"Event {i}", start + timedelta(days=i), duration=60) for i in range(5)]
+    snapshot_file = str(tmp_path / "events.arrow")
+    write_snapshot(events, snapshot_file)
+
+    loaded = load_snapshot_events(snapshot_file, start + timedelta(days=1), start + timedelta(days=2))
+
+    assert [event["name"] for event in loaded] == ["Event 1", "Event 2"]
@@ -0,0 +1,127 @@
+import asyncio
+import json
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from tornado.websocket import websocket_connect
+
+from src.api import start_api_server
+from src.broadcast import BroadcastHub, HubRegistry
+from src.core.model import new_event_id
+from src.core.store import save_board_events
+
+@pytest.fixture(scope="module")
+def api_server():
+    return start_api_server(port=0)
+
+class FakeClient:
+    def __init__(self):
+        self.payloads = []
+
+    def send_payload(self, payload):
+        self.payloads.append(json.loads(payload))
+
+def make_event(name, start):
+    return {"id": new_event_id(), "name": name, "start": start, "end": start + timedelta(hours=1)}
+
+def test_refresh_counts_every_call_and_broadcasts_changes(board_dir):
+    start = datetime(2030, 1, 1, 9)
+    save_board_events("default", [make_event("Standup", start)])
+
+    hub = BroadcastHub("default")
+    client = FakeClient()
+    hub.add_client(client)
+
+    now = start - timedelta(hours=1)
+    hub.refresh(now)
+    hub.refresh(now + timedelta(minutes=1))
+
+    assert hub.refresh_count == 2
+    assert hub.broadcast_count == 1
+    assert [payload["next_event"]["name"] for payload in client.payloads] == ["Standup"]
+
+    # The event starting changes the state
+    hub.refresh(start + timedelta(minutes=1))
+
+    assert hub.refresh_count == 3
+    assert hub.broadcast_count == 2
+    assert client.payloads[-1]["current_event"]["name"] == "Standup"
+
+def test_new_client_gets_the_latest_state(board_dir):
+    save_board_events("default", [make_event("Standup", datetime(2030, 1, 1, 9))])
+
+    hub = BroadcastHub("default")
+    hub.refresh(datetime(2030, 1, 1, 8))
+
+    client = FakeClient()
+    hub.add_client(client)
+
+    assert len(client.payloads) == 1
+    assert hub.broadcast_count == 1
+
+def test_registry_shares_a_hub_and_stops_it_after_the_last_client(board_dir):
+    async def scenario():
+        registry = HubRegistry()
+        first, second = FakeClient(), FakeClient()
+
+        hub = registry.subscribe("default", first)
+        assert registry.subscribe("default", second) is hub
+        assert hub.clients == {first, second}
+
+        registry.unsubscribe(hub, first)
+        assert registry.hubs == {"default": hub}
+        assert hub.task is not None
+
+        task = hub.task
+        registry.unsubscribe(hub, second)
+        assert registry.hubs == {}
+        assert hub.task is None
+        assert hub.unsubscribe is None
+
+        # Let the cancellation land
+        await asyncio.sleep(0)
+        assert task.cancelled() or task.done()
+
+    asyncio.run(scenario())
+
+def test_registry_keeps_one_hub_per_board(board_dir):
+    async def scenario():
+        registry = HubRegistry()
+        hub = registry.subscribe("default", FakeClient())
+        other = registry.subscribe("team-a", FakeClient())
+
+        assert hub is not other
+        assert set(registry.hubs) == {"default", "team-a"}
+
+        for board_hub in list(registry.hubs.values()):
+            for client in list(board_hub.clients):
+                registry.unsubscribe(board_hub, client)
+        assert registry.hubs == {}
+
+    asyncio.run(scenario())
+
+def test_websocket_pushes_saves_and_releases_the_hub(board_dir, api_server):
+    server, port = api_server
+    hubs = server.request_callback.hubs
+    start = datetime(2030, 1, 1, 9)
+    save_board_events("default", [make_event("Standup", start)])
+
+    async def scenario():
+        client = await websocket_connect(f"ws://127.0.0.1:{port}/ws/board")
+        first = json.loads(await client.read_message())
+        assert first["next_event"]["name"] == "Standup"
+
+        save_board_events("default", [make_event("Kickoff", start - timedelta(hours=1)), make_event("Standup", start)])
+        pushed = json.loads(await asyncio.wait_for(client.read_message(), 5))
+        assert pushed["next_event"]["name"] == "Kickoff"
+
+        client.close()
+        for _ in range(50):
+            if "default" not in hubs.hubs:
+                break
+            await asyncio.sleep(0.05)
+
+    asyncio.run(scenario())
+    assert "default" not in hubs.hubs
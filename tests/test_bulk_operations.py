@@ -0,0 +1,94 @@
+from datetime import date, datetime, timedelta
+
+from src.bulk_operations import (
+    apply_to_board,
+    delete_events,
+    duplicate_day,
+    select_event_ids,
+    set_duration,
+    shift_events
+)
+from src.core.store import get_board, save_board_events
+from src.ics_sync import IcsFolderSync
+
+from tests.test_ics_sync import vevent, write_ics
+
+START = datetime(2030, 1, 1, 9)
+
+def make_event(event_id, start, minutes=60):
+    return {"id": event_id, "name": event_id.title(), "start": start, "end": start + timedelta(minutes=minutes), "duration": minutes}
+
+EVENTS = [
+    make_event("early", START),
+    make_event("late", START + timedelta(hours=8)),
+    make_event("tomorrow", START + timedelta(days=1))
+]
+
+def test_select_event_ids():
+    assert select_event_ids(EVENTS) == {"early", "late", "tomorrow"}
+    assert select_event_ids(EVENTS, event_ids=["late", "missing"]) == {"late"}
+    # start is inclusive, end exclusive
+    assert select_event_ids(EVENTS, start=START + timedelta(hours=8)) == {"late", "tomorrow"}
+    assert select_event_ids(EVENTS, end=START + timedelta(days=1)) == {"early", "late"}
+    assert select_event_ids(EVENTS, event_ids=["early", "tomorrow"], start=START + timedelta(hours=1)) == {"tomorrow"}
+
+def test_delete_events():
+    assert [event["id"] for event in delete_events(EVENTS, ["late", "missing"])] == ["early", "tomorrow"]
+
+def test_shift_events_leaves_the_input_unchanged():
+    shifted = shift_events(EVENTS, {"early"}, -30)
+
+    assert shifted[0]["start"] == START - timedelta(minutes=30)
+    assert shifted[0]["end"] == START + timedelta(minutes=30)
+    assert shifted[1] is EVENTS[1]
+    assert EVENTS[0]["start"] == START
+
+def test_set_duration():
+    changed = set_duration(EVENTS, {"late"}, 15)
+
+    assert changed[1]["end"] == changed[1]["start"] + timedelta(minutes=15)
+    assert changed[1]["duration"] == 15
+    assert changed[0] is EVENTS[0]
+
+def test_duplicate_day():
+    events = duplicate_day(EVENTS, date(2030, 1, 1), date(2030, 1, 5))
+
+    assert len(events) == 5
+    copies = events[3:]
+    assert [event["name"] for event in copies] == ["Early", "Late"]
+    assert [event["start"] for event in copies] == [START + timedelta(days=4), START + timedelta(days=4, hours=8)]
+    assert not {event["id"] for event in copies} & {event["id"] for event in EVENTS}
+
+def test_duplicate_day_copies_are_not_synced_events():
+    synced = {**EVENTS[0], "uid": "one", "sequence": 2, "source": "a.ics"}
+
+    copy = duplicate_day([synced], date(2030, 1, 1), date(2030, 1, 2))[1]
+
+    assert not {"uid", "sequence", "source"} & copy.keys()
+    assert copy["name"] == "Early"
+
+def test_apply_to_board_saves_once(board_dir):
+    save_board_events("default", EVENTS)
+
+    events = apply_to_board(shift_events, {"late"}, 60)
+
+    assert get_board("default")["events"] == sorted(events, key=lambda event: event["start"])
+    assert next(event for event in events if event["id"] == "late")["start"] == START + timedelta(hours=9)
+    # The cached board is not edited in place
+    assert EVENTS[1]["start"] == START + timedelta(hours=8)
+
+def test_duplicated_calendar_event_outlives_the_calendar(board_dir):
+    folder = board_dir / "calendars"
+    folder.mkdir()
+    write_ics(folder / "a.ics", vevent("one", "One", START))
+    sync = IcsFolderSync(str(folder))
+    sync.scan()
+
+    apply_to_board(duplicate_day, date(2030, 1, 1), date(2030, 1, 2))
+    assert len(get_board("default")["events"]) == 2
+
+    (folder / "a.ics").unlink()
+    sync.scan()
+
+    events = get_board("default")["events"]
+    assert [(event["name"], event["start"]) for event in events] == [("One", START + timedelta(days=1))]
@@ -0,0 +1,120 @@
+from datetime import datetime, timedelta
+
+from src.core import change_feed
+from src.core.change_feed import ADDED, BULK, REMOVED, UPDATED, ChangeFeed, diff_events
+from src.core.store import save_board_events
+from src.reminders import ReminderScheduler
+
+NOW = datetime(2030, 1, 1, 9)
+
+def make_event(event_id, offset_minutes, name=None):
+    start = NOW + timedelta(minutes=offset_minutes)
+    return {"id": event_id, "name": name or event_id, "start": start, "end": start + timedelta(minutes=30)}
+
+def test_diff_events():
+    a, b, c = make_event("a", 30), make_event("b", 60), make_event("c", 90)
+    renamed_b = {**b, "name": "B"}
+
+    changes = diff_events([a, b], [renamed_b, c])
+
+    assert sorted((kind, (event or previous)["id"]) for kind, event, previous in changes) == [
+        (ADDED, "c"), (REMOVED, "a"), (UPDATED, "b")
+    ]
+    assert diff_events([a, b], [a, b]) == []
+
+def test_single_and_bulk_changes():
+    feed = ChangeFeed()
+    received = []
+    feed.subscribe(received.append, board_id="room")
+    a, b = make_event("a", 30), make_event("b", 60)
+
+    assert feed.publish("room", [], [a])["kind"] == ADDED
+    assert feed.publish("room", [a], [a]) is None
+    bulk = feed.publish("room", [a], [b, {**a, "name": "A"}])
+    feed.publish("other", [], [a])
+
+    assert bulk["kind"] == BULK
+    assert len(bulk["changes"]) == 2
+    assert [change["version"] for change in received] == [1, 2]
+    assert feed.get_version() == 3
+    assert feed.get_version("room") == 2
+
+def test_unknown_previous_events_ask_for_a_rebuild():
+    change = ChangeFeed().publish("room", None, [make_event("a", 30)])
+
+    assert change["kind"] == BULK
+    assert change["changes"] is None
+
+def test_changes_since_and_history_overflow():
+    feed = ChangeFeed(history=2)
+    events = []
+    for i in range(4):
+        previous, events = events, events + [make_event(str(i), i)]
+        feed.publish("room", previous, events)
+
+    assert [change["version"] for change in feed.changes_since(2)] == [3, 4]
+    assert feed.changes_since(4) == []
+    # Versions 2 and earlier are gone, so the caller must rebuild
+    assert feed.changes_since(1) is None
+
+def test_saves_publish_to_the_process_feed(board_dir):
+    received = []
+    unsubscribe = change_feed.subscribe(received.append, board_id="default")
+    try:
+        save_board_events("default", [make_event("a", 30)])
+        save_board_events("default", [make_event("a", 30)])
+        save_board_events("default", [make_event("a", 30, name="Renamed")])
+    finally:
+        unsubscribe()
+
+    assert [change["kind"] for change in received] == [ADDED, UPDATED]
+    assert received[1]["event"]["name"] == "Renamed"
+
+def make_scheduler():
+    return ReminderScheduler(webhook_url=None, command_hook=None, log_file=None)
+
+def pending_reminders(scheduler):
+    with scheduler.condition:
+        return sorted(
+            (entry[5]["id"], entry[6], entry[0]) for entry in scheduler.heap if scheduler.is_live(entry)
+        )
+
+def test_changed_event_invalidates_only_its_own_reminders():
+    scheduler = make_scheduler()
+    feed = ChangeFeed()
+    feed.subscribe(scheduler.apply_change)
+
+    a, b, c = make_event("a", 60), make_event("b", 120), make_event("c", 180)
+    scheduler.schedule_board("room", [a, b, c], now=NOW)
+    board_generation = scheduler.generations["room"]
+    assert scheduler.pending_count() == 6
+
+    moved_a = make_event("a", 90)
+    feed.publish("room", [a, b, c], [moved_a, b, c])
+
+    # Only "a" was rescheduled; the board generation is untouched
+    assert scheduler.generations["room"] == board_generation
+    assert scheduler.event_generations["room"].keys() == {"a"}
+    reminders = pending_reminders(scheduler)
+    assert len(reminders) == 6
+    assert ("a", 15, moved_a["start"] - timedelta(minutes=15)) in reminders
+    assert ("a", 15, a["start"] - timedelta(minutes=15)) not in reminders
+
+    feed.publish("room", [moved_a, b, c], [moved_a, c])
+    assert [event_id for event_id, _, _ in pending_reminders(scheduler)] == ["a", "a", "c", "c"]
+
+def test_large_or_unknown_changes_rebuild_the_board():
+    scheduler = make_scheduler()
+    feed = ChangeFeed()
+    feed.subscribe(scheduler.apply_change)
+
+    events = [make_event(str(i), 60 + i) for i in range(4)]
+    scheduler.schedule_board("room", events, now=NOW)
+    generation = scheduler.generations["room"]
+
+    feed.publish("room", events, [make_event(str(i), 120 + i) for i in range(4)])
+    assert scheduler.generations["room"] == generation + 1
+
+    feed.publish("room", None, [])
+    assert scheduler.generations["room"] == generation + 2
+    assert scheduler.pending_count() == 0
@@ -0,0 +1,72 @@
+import json
+import sys
+
+from datetime import datetime
+
+import pytest
+
+from src import cli
+from src.core.store import get_board
+
+def run_cli(monkeypatch, capsys, *args):
+    monkeypatch.setattr(sys, "argv", ["countdown", *args])
+    cli.main()
+    return capsys.readouterr().out
+
+def write_json(path, events):
+    path.write_text(json.dumps(events))
+    return str(path)
+
+EVENTS_WITHOUT_IDS = [
+    {"name": "Standup", "start": "2030-01-01T09:00:00", "end": "2030-01-01T09:15:00", "duration": 15},
+    {"name": "Review", "start": "2030-01-01T14:00:00", "end": "2030-01-01T15:00:00", "duration": 60}
+]
+
+def test_reimporting_events_without_ids_adds_nothing(board_dir, monkeypatch, capsys):
+    file_path = write_json(board_dir / "events.json", EVENTS_WITHOUT_IDS)
+
+    assert "2 added, 0 updated" in run_cli(monkeypatch, capsys, "import", file_path)
+    ids = sorted(event["id"] for event in get_board("default")["events"])
+
+    assert "0 added, 0 updated" in run_cli(monkeypatch, capsys, "import", file_path)
+    assert sorted(event["id"] for event in get_board("default")["events"]) == ids
+
+    changed = [{**EVENTS_WITHOUT_IDS[0], "duration": 20}, EVENTS_WITHOUT_IDS[1]]
+    assert "0 added, 1 updated" in run_cli(monkeypatch, capsys, "import", write_json(board_dir / "changed.json", changed))
+    assert len(get_board("default")["events"]) == 2
+
+def test_export_import_round_trip(board_dir, monkeypatch, capsys):
+    run_cli(monkeypatch, capsys, "import", write_json(board_dir / "events.json", EVENTS_WITHOUT_IDS), "--board", "room-1")
+    exported = board_dir / "export" / "room-1.json"
+
+    run_cli(monkeypatch, capsys, "export", "--board", "room-1", "--output", str(exported))
+    assert "0 added, 0 updated" in run_cli(monkeypatch, capsys, "import", str(exported), "--board", "room-1")
+
+    assert "2 added" in run_cli(monkeypatch, capsys, "import", str(exported), "--board", "room-2")
+    assert get_board("room-2")["events"] == get_board("room-1")["events"]
+
+def test_replace_and_prune(board_dir, monkeypatch, capsys):
+    file_path = write_json(board_dir / "events.json", EVENTS_WITHOUT_IDS)
+    run_cli(monkeypatch, capsys, "import", file_path)
+    run_cli(monkeypatch, capsys, "import", write_json(board_dir / "one.json", EVENTS_WITHOUT_IDS[:1]), "--replace")
+
+    assert [event["name"] for event in get_board("default")["events"]] == ["Standup"]
+
+    assert "Archived 1 finished events" in run_cli(monkeypatch, capsys, "prune", "--before", "2030-01-02T00:00")
+    assert get_board("default")["events"] == []
+
+def test_report_json(board_dir, monkeypatch, capsys):
+    run_cli(monkeypatch, capsys, "import", write_json(board_dir / "events.json", EVENTS_WITHOUT_IDS))
+
+    report = json.loads(run_cli(monkeypatch, capsys, "report", "--json"))
+
+    assert report["events"] == 2
+    assert report["busiest_day"] == "2030-01-01"
+    assert report["first_start"] == datetime(2030, 1, 1, 9).isoformat()
+
+def test_missing_file_is_an_error(board_dir, monkeypatch, capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        run_cli(monkeypatch, capsys, "import", str(board_dir / "missing.json"))
+
+    assert exit_info.value.code == 1
+    assert "countdown: error:" in capsys.readouterr().err
@@ -0,0 +1,81 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.core.countdowns import CountdownService, format_remaining_time
+from src.static_export import PAGE_TEMPLATE
+
+NOW = datetime(2030, 1, 1, 12, 0, 0)
+SECOND = timedelta(seconds=1)
+HOUR = timedelta(hours=1)
+DAY = timedelta(days=1)
+
+# Every granularity boundary, on both sides
+BOUNDARIES = [
+    (timedelta(0), "now"),
+    (-SECOND, "now"),
+    (timedelta(microseconds=1), "00:00"),
+    (SECOND, "00:01"),
+    (timedelta(minutes=1, seconds=5), "01:05"),
+    (HOUR - SECOND, "59:59"),
+    (HOUR, "1h 00m"),
+    (timedelta(hours=1, minutes=5), "1h 05m"),
+    (timedelta(hours=1, minutes=5, seconds=59), "1h 05m"),
+    (DAY - SECOND, "23h 59m"),
+    (DAY, "1 days 0000"),
+    (DAY + timedelta(hours=3, minutes=5), "1 days 0305"),
+    (7 * DAY - SECOND, "6 days 2359"),
+    (7 * DAY, "7 days"),
+    (400 * DAY + 5 * HOUR, "400 days")
+]
+
+@pytest.mark.parametrize("remaining, expected", BOUNDARIES)
+def test_format_remaining_time(remaining, expected):
+    assert format_remaining_time(remaining) == expected
+
+def test_hours_never_read_like_minutes_and_seconds():
+    # 1h05m and 1m05s used to both show as "01:05"
+    assert format_remaining_time(timedelta(hours=1, minutes=5)) != format_remaining_time(timedelta(minutes=1, seconds=5))
+
+def test_batch_matches_single_formatting():
+    service = CountdownService()
+    events = [{"start": NOW + remaining} for remaining, _ in BOUNDARIES]
+
+    assert service.format_events(events, NOW) == [expected for _, expected in BOUNDARIES]
+    assert service.format_events([], NOW) == []
+
+def test_strings_are_cached_by_unit():
+    service = CountdownService(cache_size=2)
+    events = [{"start": NOW + timedelta(days=10, seconds=offset)} for offset in range(10)]
+
+    assert set(service.format_events(events, NOW)) == {"10 days"}
+    assert (service.misses, service.hits) == (1, 9)
+
+    service.format_events([{"start": NOW + HOUR * hours} for hours in (2, 3, 4)], NOW)
+    assert len(service.cache) == 2
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="needs node")
+def test_static_export_formats_the_same_way():
+    script = PAGE_TEMPLATE.template.split("<script>")[1].split("</script>")[0]
+    source = script[script.index("function pad"):script.index("function addLine")]
+    cases = [int(remaining.total_seconds() * 1000) for remaining, _ in BOUNDARIES]
+    program = source + f"console.log(JSON.stringify({json.dumps(cases)}.map(formatRemaining)));"
+
+    output = subprocess.run(["node", "-e", program], capture_output=True, text=True, check=True).stdout
+
+    # The page works in whole milliseconds, so 1 microsecond is "now" there
+    expected = [format_remaining_time(timedelta(milliseconds=ms)) for ms in cases]
+    assert json.loads(output) == expected
+
+def test_core_import_does_not_load_numpy_or_pandas():
+    code = "import sys, src.core.countdowns, src.core.store; print('numpy' in sys.modules or 'pandas' in sys.modules)"
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    output = subprocess.run([sys.executable, "-c", code], cwd=repo_root, capture_output=True, text=True, check=True).stdout
+
+    assert output.strip() == "False"
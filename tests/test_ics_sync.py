@@ -0,0 +1,83 @@
+from datetime import datetime
+
+from src.core.store import get_board, save_board_events
+from src.ics_sync import IcsFolderSync, ics_event_id
+
+def vevent(uid, summary, start, sequence=0):
+    return (
+        "BEGIN:VEVENT\r\n"
+        f"UID:{uid}\r\n"
+        f"SUMMARY:{summary}\r\n"
+        f"DTSTART:{start:%Y%m%dT%H%M%S}\r\n"
+        "DURATION:PT1H\r\n"
+        f"SEQUENCE:{sequence}\r\n"
+        "END:VEVENT\r\n"
+    )
+
+def write_ics(path, *events):
+    path.write_text("BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//test//EN\r\n" + "".join(events) + "END:VCALENDAR\r\n")
+
+def board_names():
+    return sorted(event["name"] for event in get_board("default")["events"])
+
+START = datetime(2030, 1, 1, 9)
+
+def test_scan_adds_updates_and_removes(board_dir):
+    folder = board_dir / "calendars"
+    folder.mkdir()
+    write_ics(folder / "a.ics", vevent("one", "One", START), vevent("two", "Two", START))
+    sync = IcsFolderSync(str(folder))
+
+    assert sync.scan() == {"added": 2, "updated": 0, "removed": 0}
+    assert board_names() == ["One", "Two"]
+
+    # Unchanged files are skipped without parsing
+    assert sync.scan() == {"added": 0, "updated": 0, "removed": 0}
+
+    write_ics(folder / "a.ics", vevent("one", "One renamed", START, sequence=1))
+    assert sync.scan() == {"added": 0, "updated": 1, "removed": 1}
+    assert board_names() == ["One renamed"]
+
+    (folder / "a.ics").unlink()
+    assert sync.scan() == {"added": 0, "updated": 0, "removed": 1}
+    assert board_names() == []
+
+def test_app_events_and_fields_are_kept(board_dir):
+    folder = board_dir / "calendars"
+    folder.mkdir()
+    save_board_events("default", [{"id": "manual", "name": "Manual", "start": START, "end": START}])
+    write_ics(folder / "a.ics", vevent("one", "One", START))
+    sync = IcsFolderSync(str(folder))
+    sync.scan()
+
+    events = [{**event, "reminders": [5]} if event.get("uid") == "one" else event for event in get_board("default")["events"]]
+    save_board_events("default", events)
+
+    write_ics(folder / "a.ics", vevent("one", "One moved", START, sequence=1))
+    sync.scan()
+
+    synced = next(event for event in get_board("default")["events"] if event.get("uid") == "one")
+    assert synced["id"] == ics_event_id("one")
+    assert synced["reminders"] == [5]
+    assert board_names() == ["Manual", "One moved"]
+
+def test_uid_moved_to_a_file_synced_earlier_is_kept(board_dir):
+    folder = board_dir / "calendars"
+    folder.mkdir()
+    write_ics(folder / "a.ics", vevent("shared", "Shared", START), vevent("a-only", "A only", START))
+    write_ics(folder / "b.ics", vevent("b-only", "B only", START))
+    sync = IcsFolderSync(str(folder))
+    sync.scan()
+
+    # The UID moves to b.ics, and b.ics is synced before a.ics
+    write_ics(folder / "b.ics", vevent("b-only", "B only", START), vevent("shared", "Shared", START))
+    assert sync.sync_files([str(folder / "b.ics")])["removed"] == 0
+
+    write_ics(folder / "a.ics", vevent("a-only", "A only", START))
+    assert sync.sync_files([str(folder / "a.ics")]) == {"added": 0, "updated": 0, "removed": 0}
+    assert board_names() == ["A only", "B only", "Shared"]
+
+    # Once no file lists it, it is removed
+    write_ics(folder / "b.ics", vevent("b-only", "B only", START))
+    assert sync.sync_files([str(folder / "b.ics")])["removed"] == 1
+    assert board_names() == ["A only", "B only"]
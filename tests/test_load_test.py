@@ -0,0 +1,25 @@
+from datetime import datetime
+
+from benchmarks.load_test import generate_events, percentile
+
+def test_generated_schedule_is_reproducible():
+    first = generate_events(100, seed=7)
+    second = generate_events(100, seed=7)
+
+    # Start times are relative to now, so compare everything else
+    strip = lambda events: [{**event, "start": None, "end": None} for event in events]
+    assert strip(first) == strip(second)
+    assert strip(first) != strip(generate_events(100, seed=8))
+
+    for event in first:
+        start = datetime.fromisoformat(event["start"])
+        end = datetime.fromisoformat(event["end"])
+        assert (end - start).total_seconds() == event["duration"] * 60
+
+def test_percentile_is_nearest_rank():
+    values = list(range(1, 101))
+
+    assert percentile(values, 0.5) == 50
+    assert percentile(values, 0.95) == 95
+    assert percentile(values, 1.0) == 100
+    assert percentile([], 0.5) == 0.0
@@ -0,0 +1,39 @@
+import io
+import os
+
+import pytest
+
+from PIL import Image
+
+from src.logo_processing import process_logo
+
+def image_bytes(mode, image_format, size=(800, 600)):
+    buffer = io.BytesIO()
+    Image.new(mode, size).save(buffer, format=image_format)
+    return buffer.getvalue()
+
+def test_photo_becomes_webp_variants(tmp_path):
+    path = process_logo(io.BytesIO(image_bytes("RGB", "JPEG")), str(tmp_path))
+
+    assert path.endswith("team_logo.webp")
+    with Image.open(path) as logo:
+        assert logo.height == 100
+    with Image.open(tmp_path / "team_logo@2x.webp") as logo:
+        assert logo.height == 200
+
+def test_transparent_image_stays_png(tmp_path):
+    path = process_logo(io.BytesIO(image_bytes("RGBA", "PNG")), str(tmp_path))
+
+    assert path.endswith("team_logo.png")
+
+@pytest.mark.parametrize("data", [
+    b"not an image",
+    image_bytes("RGB", "JPEG")[:2000],
+    image_bytes("RGBA", "PNG")[:200]
+])
+def test_unreadable_upload_raises_value_error(tmp_path, data):
+    with pytest.raises(ValueError, match="Could not read image"):
+        process_logo(io.BytesIO(data), str(tmp_path))
+
+    # The streamed upload is cleaned up and no variant is left behind
+    assert os.listdir(tmp_path) == []
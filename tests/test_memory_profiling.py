@@ -0,0 +1,95 @@
+import json
+import sys
+
+import pytest
+
+from src.memory_profiling import (
+    all_sessions_breakdown,
+    build_memory_report,
+    deep_sizeof,
+    dump_memory_report,
+    format_bytes,
+    is_tracing,
+    start_tracing,
+    stop_tracing
+)
+
+class Holder:
+    def __init__(self, value):
+        self.value = value
+
+def test_deep_sizeof_includes_contents():
+    payload = "x" * 10_000
+
+    assert deep_sizeof([payload]) >= sys.getsizeof([payload]) + sys.getsizeof(payload)
+    assert deep_sizeof({"key": payload}) > sys.getsizeof(payload)
+    assert deep_sizeof(Holder(payload)) > sys.getsizeof(payload)
+
+def test_deep_sizeof_counts_shared_objects_once():
+    payload = "x" * 10_000
+
+    assert deep_sizeof([payload, payload]) < sys.getsizeof(payload) * 2
+
+    seen = set()
+    deep_sizeof(payload, seen)
+    assert deep_sizeof([payload], seen) == sys.getsizeof([payload])
+
+def test_deep_sizeof_handles_cycles():
+    cycle = []
+    cycle.append(cycle)
+
+    assert deep_sizeof(cycle) == sys.getsizeof(cycle)
+
+def test_report_sizes_the_session():
+    session_state = {"events": ["x" * 10_000], "theme": "dark"}
+
+    report = build_memory_report(session_state, include_sessions=False)
+
+    assert report["rss_bytes"] > 0
+    assert list(report["session"]["keys"]) == ["events", "theme"]
+    assert report["session"]["tracked"]["events"] == report["session"]["keys"]["events"]
+    assert report["session"]["tracked"]["custom_themes"] == 0
+    assert report["session"]["total_bytes"] == sum(report["session"]["keys"].values())
+    json.dumps(report)
+
+def test_report_without_session_or_tracing():
+    if is_tracing():
+        pytest.skip("tracemalloc is already running")
+
+    report = build_memory_report()
+
+    assert report["session"] is None
+    assert report["tracemalloc"] is None
+    assert report["top_allocation_sites"] == []
+
+def test_report_with_tracing():
+    if is_tracing():
+        pytest.skip("tracemalloc is already running")
+
+    start_tracing()
+    try:
+        kept = ["x" * 1000 for _ in range(1000)]
+        report = build_memory_report(top_limit=3)
+    finally:
+        stop_tracing()
+
+    assert kept
+    assert report["tracemalloc"]["peak_bytes"] >= report["tracemalloc"]["current_bytes"] > 0
+    assert 0 < len(report["top_allocation_sites"]) <= 3
+    assert not is_tracing()
+
+def test_dump_memory_report(tmp_path):
+    path = tmp_path / "reports" / "memory.json"
+
+    report = dump_memory_report(str(path), {"events": []})
+
+    assert json.loads(path.read_text()) == report
+
+def test_all_sessions_breakdown_without_a_runtime():
+    assert all_sessions_breakdown() == []
+
+def test_format_bytes():
+    assert format_bytes(512) == "512 B"
+    assert format_bytes(1536) == "1.5 KB"
+    assert format_bytes(5 * 1024 ** 2) == "5.0 MB"
+    assert format_bytes(3 * 1024 ** 4) == "3072.0 GB"
@@ -0,0 +1,152 @@
+import json
+import time
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src import clock
+from src.clock import ManualClock
+from src.core import store
+from src.core.store import save_board_events
+from src.reminders import ReminderScheduler
+
+NOW = datetime(2030, 1, 1, 9)
+
+def make_event(event_id, start, reminders=(5,)):
+    return {"id": event_id, "name": event_id.title(), "start": start, "end": start + timedelta(hours=1), "reminders": list(reminders)}
+
+@pytest.fixture
+def manual_clock():
+    with clock.use_time_source(ManualClock(NOW)) as source:
+        yield source
+
+@pytest.fixture
+def scheduler(tmp_path, manual_clock):
+    scheduler = ReminderScheduler(webhook_url=None, command_hook=None, log_file=str(tmp_path / "reminders.log"))
+    yield scheduler
+    scheduler.stop()
+
+def advance(scheduler, manual_clock, delta):
+    """Move the clock on and wake the scheduler thread."""
+    manual_clock.advance(delta)
+    with scheduler.condition:
+        scheduler.condition.notify()
+
+def wait_for_toasts(scheduler, board_id, count):
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        _, messages = scheduler.get_toasts(board_id, 0)
+        if len(messages) >= count:
+            return messages
+        time.sleep(0.01)
+    raise AssertionError(f"expected {count} reminders, got {scheduler.get_toasts(board_id, 0)[1]}")
+
+def read_log(scheduler):
+    with open(scheduler.log_file) as f:
+        return [json.loads(line) for line in f]
+
+def test_run_delivers_due_reminders(scheduler, manual_clock):
+    scheduler.schedule_board("default", [
+        make_event("standup", NOW + timedelta(minutes=20), reminders=(15, 5)),
+        make_event("review", NOW + timedelta(hours=2))
+    ])
+    scheduler.start()
+
+    advance(scheduler, manual_clock, timedelta(minutes=5))
+    assert wait_for_toasts(scheduler, "default", 1) == ["Standup starts in 15 minutes (09:20)"]
+
+    advance(scheduler, manual_clock, timedelta(minutes=10))
+    wait_for_toasts(scheduler, "default", 2)
+
+    assert [(record["event_id"], record["lead_minutes"]) for record in read_log(scheduler)] == [("standup", 15), ("standup", 5)]
+    assert scheduler.pending_count() == 1
+
+def test_missed_reminder_within_grace_still_fires(scheduler):
+    scheduler.schedule_board("default", [
+        make_event("just-missed", NOW + timedelta(minutes=4, seconds=30)),
+        make_event("long-missed", NOW + timedelta(minutes=2))
+    ])
+
+    assert scheduler.pending_count() == 1
+
+def test_reschedule_does_not_repeat_sent_reminders(scheduler, manual_clock):
+    standup = make_event("standup", NOW + timedelta(minutes=5, seconds=30))
+    scheduler.schedule_board("default", [standup])
+    scheduler.start()
+
+    advance(scheduler, manual_clock, timedelta(seconds=40))
+    wait_for_toasts(scheduler, "default", 1)
+
+    # Still within the grace window: a rename, a board rebuild and a bulk change reschedule it
+    scheduler.schedule_events("default", [{**standup, "name": "Renamed"}], [standup["id"]])
+    scheduler.schedule_board("default", [standup])
+    scheduler.apply_change({"kind": "bulk", "board_id": "default", "events": [standup], "changes": None})
+    assert scheduler.pending_count() == 0
+
+    # Moving the event makes it a new reminder
+    scheduler.schedule_events("default", [{**standup, "start": standup["start"] + timedelta(minutes=10)}], [standup["id"]])
+    assert scheduler.pending_count() == 1
+
+def test_sent_reminders_survive_a_restart(tmp_path, scheduler, manual_clock):
+    standup = make_event("standup", NOW + timedelta(minutes=5, seconds=30))
+    scheduler.schedule_board("default", [standup])
+    scheduler.start()
+    advance(scheduler, manual_clock, timedelta(seconds=40))
+    wait_for_toasts(scheduler, "default", 1)
+
+    restarted = ReminderScheduler(webhook_url=None, command_hook=None, log_file=scheduler.log_file)
+    try:
+        restarted.load_sent()
+        restarted.schedule_board("default", [standup])
+        assert restarted.pending_count() == 0
+    finally:
+        restarted.stop()
+
+def test_rebuild_from_store(board_dir, scheduler):
+    save_board_events("default", [make_event("standup", NOW + timedelta(hours=1))])
+    save_board_events("team-a", [make_event("retro", NOW + timedelta(hours=1), reminders=(15, 5))])
+    # Past events have nothing left to remind about
+    save_board_events("team-b", [make_event("done", NOW - timedelta(hours=1))])
+    store.get_persister().flush()
+
+    scheduler.rebuild_from_store()
+
+    assert scheduler.pending_count() == 3
+    assert set(scheduler.generations) == {"default", "team-a", "team-b"}
+
+def test_compact_drops_outdated_entries(scheduler):
+    events = [make_event(f"event-{i}", NOW + timedelta(hours=1, minutes=i), reminders=(15, 5)) for i in range(250)]
+
+    scheduler.schedule_board("default", events)
+    scheduler.schedule_board("default", events)
+    # Below 1024 entries outdated ones are left for the thread to skip
+    assert len(scheduler.heap) == 1000
+
+    scheduler.schedule_board("default", events)
+    assert len(scheduler.heap) == 500
+    assert scheduler.pending_count() == 500
+
+def test_small_heap_is_not_compacted(scheduler):
+    events = [make_event(f"event-{i}", NOW + timedelta(hours=1, minutes=i)) for i in range(100)]
+
+    for _ in range(5):
+        scheduler.schedule_board("default", events)
+
+    assert len(scheduler.heap) == 500
+    assert scheduler.pending_count() == 100
+
+def test_schedule_100k_reminders(scheduler):
+    events = [make_event(f"event-{i}", NOW + timedelta(hours=1, seconds=i), reminders=(15, 5)) for i in range(50_000)]
+
+    started = time.perf_counter()
+    scheduler.schedule_board("default", events)
+    elapsed = time.perf_counter() - started
+
+    assert scheduler.pending_count() == 100_000
+    assert scheduler.heap[0][0] == NOW + timedelta(minutes=45)
+    assert elapsed < 5
+
+    # Rescheduling one event leaves the others alone
+    scheduler.schedule_events("default", [{**events[0], "reminders": [30]}], [events[0]["id"]])
+    assert scheduler.pending_count() == 99_999
@@ -0,0 +1,56 @@
+from datetime import datetime, timedelta
+
+from src import clock
+from src.replay import render_core, replay_schedule
+
+START = datetime(2030, 1, 1, 9)
+
+def make_event(name, offset_minutes, minutes=30):
+    start = START + timedelta(minutes=offset_minutes)
+    return {"id": name.lower(), "name": name, "start": start, "end": start + timedelta(minutes=minutes)}
+
+def test_manual_clock_only_moves_when_told():
+    source = clock.ManualClock(START)
+
+    with clock.use_time_source(source):
+        assert clock.now() == START
+        source.advance(timedelta(minutes=5))
+        assert clock.now() == START + timedelta(minutes=5)
+
+    assert isinstance(clock.get_time_source(), clock.SystemClock)
+
+def test_replay_clock_runs_faster_and_scales_waits():
+    source = clock.ReplayClock(START, speed=3600)
+
+    with clock.use_time_source(source):
+        assert clock.now() >= START
+        # An hour of schedule is one real second at 3600x
+        assert clock.real_seconds_until(START + timedelta(hours=1), START) == 1.0
+
+def test_replay_steps_through_every_transition():
+    events = [make_event("First", 10), make_event("Second", 60)]
+    rendered = []
+
+    result = replay_schedule(events, START, START + timedelta(hours=2), render=lambda events, now: rendered.append(now))
+
+    steps = [(step["current_event"], step["next_event"]) for step in result["steps"]]
+    assert steps == [
+        (None, "First"),
+        ("First", "Second"),
+        (None, "Second"),
+        ("Second", None),
+        (None, None)
+    ]
+    assert result["summary"]["transitions"] == 5
+    assert len(rendered) == 5
+    # The replay restores the real clock afterwards
+    assert isinstance(clock.get_time_source(), clock.SystemClock)
+
+def test_render_core_lists_countdowns_of_unfinished_events():
+    events = [make_event("Done", -60), make_event("Soon", 10)]
+
+    current_event, next_event, countdowns = render_core(events, START)
+
+    assert current_event is None
+    assert next_event["name"] == "Soon"
+    assert countdowns == ["10:00"]
@@ -0,0 +1,77 @@
+import io
+import os
+
+from datetime import datetime, timedelta
+
+from PIL import Image
+
+from src.core.model import new_event_id
+from src.core.store import save_board_events
+from src.logo_processing import process_logo
+from src.core import store
+from src.static_export import StaticExporter, export_board_html, export_path, get_export_version, read_export_version, render_board_html
+
+def test_export_is_only_rewritten_when_the_board_changes(board_dir):
+    start = datetime(2030, 1, 1, 9)
+    events = [{"id": new_event_id(), "name": "Opening </script>", "start": start, "end": start + timedelta(hours=1)}]
+    save_board_events("default", events)
+
+    path, written = export_board_html("default")
+    assert written
+    assert read_export_version(path)
+
+    assert export_board_html("default") == (path, False)
+
+    save_board_events("default", events + [{**events[0], "id": new_event_id(), "name": "Closing"}])
+    assert export_board_html("default") == (path, True)
+
+    with open(path, encoding="utf-8") as f:
+        page = f.read()
+    assert "Closing" in page
+    assert "Opening <\\/script>" in page
+
+def test_logo_has_src_fallback(board_dir):
+    buffer = io.BytesIO()
+    Image.new("RGB", (400, 300)).save(buffer, format="JPEG")
+    process_logo(buffer, "assets")
+
+    page = render_board_html("default")
+
+    assert '<img src="data:image/webp;base64,' in page
+    assert ' 2x"' in page
+
+def test_exporter_rewrites_exported_boards_after_each_write(board_dir):
+    start = datetime(2030, 1, 1, 9)
+    save_board_events("default", [{"id": "a", "name": "Opening", "start": start, "end": start + timedelta(hours=1)}])
+    save_board_events("other", [{"id": "b", "name": "Other", "start": start, "end": start + timedelta(hours=1)}])
+    path, _ = export_board_html("default")
+
+    exporter = StaticExporter(debounce=60)
+    exporter.start()
+    try:
+        save_board_events("default", [{"id": "a", "name": "Renamed", "start": start, "end": start + timedelta(hours=1)}])
+        save_board_events("other", [])
+        store.get_persister().flush()
+        assert exporter.pending == {"default", "other"}
+
+        exporter.flush()
+    finally:
+        exporter.stop()
+
+    with open(path, encoding="utf-8") as f:
+        page = f.read()
+    assert "Renamed" in page
+    assert read_export_version(path) == get_export_version("default")
+    # Boards that were never exported are left alone
+    assert not os.path.exists(export_path("other"))
+
+def test_stopped_exporter_ignores_writes(board_dir):
+    exporter = StaticExporter(debounce=60)
+    exporter.start()
+    exporter.stop()
+
+    start = datetime(2030, 1, 1, 9)
+    save_board_events("default", [{"id": "a", "name": "Opening", "start": start, "end": start + timedelta(hours=1)}])
+    store.get_persister().flush()
+
+    assert exporter.pending == set()
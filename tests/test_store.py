@@ -0,0 +1,52 @@
+import time
+
+from datetime import datetime, timedelta
+
+from src.core import store
+from src.core.model import new_event_id
+from src.core.store import get_board, peek_board, save_board_events
+
+def make_event(name, start):
+    return {"id": new_event_id(), "name": name, "start": start, "end": start + timedelta(hours=1)}
+
+def test_cache_keeps_the_most_recently_used_boards(board_dir, monkeypatch):
+    monkeypatch.setattr(store, "BOARD_CACHE_SIZE", 3)
+
+    for board_id in ("a", "b", "c"):
+        get_board(board_id)
+    # Touching a makes b the least recently used
+    get_board("a")
+    get_board("d")
+
+    assert list(store._board_cache) == ["c", "a", "d"]
+    assert peek_board("b") is None
+
+def test_evicted_board_is_reloaded_from_disk(board_dir, monkeypatch):
+    monkeypatch.setattr(store, "BOARD_CACHE_SIZE", 1)
+    save_board_events("a", [make_event("Standup", datetime(2030, 1, 1, 9))])
+    store.get_persister().flush()
+
+    get_board("b")
+    assert peek_board("a") is None
+
+    assert [event["name"] for event in get_board("a")["events"]] == ["Standup"]
+
+def test_idle_boards_are_dropped_on_read(board_dir, monkeypatch):
+    get_board("a")
+    get_board("b")
+
+    # Only reads of b follow, which never re-cache anything
+    store._board_cache["a"]["last_access"] = time.monotonic() - store.BOARD_IDLE_SECONDS - 1
+    store._board_cache["b"]["last_access"] = time.monotonic()
+    get_board("b")
+
+    assert peek_board("a") is None
+    assert peek_board("b") is not None
+
+def test_idle_board_with_pending_write_keeps_its_changes(board_dir):
+    save_board_events("a", [make_event("Standup", datetime(2030, 1, 1, 9))])
+    store._board_cache["a"]["last_access"] = time.monotonic() - store.BOARD_IDLE_SECONDS - 1
+
+    get_board("b")
+
+    assert [event["name"] for event in get_board("a")["events"]] == ["Standup"]
@@ -0,0 +1,60 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from src.timeline_view import MAX_BINS, bin_events, choose_resolution
+
+START = datetime(2030, 1, 1)
+
+def to_seconds(moments):
+    # bin_events works on naive datetimes as UTC seconds
+    return np.sort(np.array([np.datetime64(moment, "s").astype(np.int64) for moment in moments]))
+
+def test_choose_resolution_picks_the_finest_that_fits():
+    assert choose_resolution(START, START + timedelta(hours=100)) == ("15 minutes", timedelta(minutes=15))
+    assert choose_resolution(START, START + timedelta(hours=101)) == ("Hour", timedelta(hours=1))
+    assert choose_resolution(START, START + timedelta(days=400)) == ("Day", timedelta(days=1))
+    assert choose_resolution(START, START + timedelta(weeks=400)) == ("Week", timedelta(weeks=1))
+
+def test_choose_resolution_past_weekly_buckets_stays_within_max_bins():
+    for weeks in (401, 800, 801, 5000, 52 * 100):
+        end = START + timedelta(weeks=weeks)
+        name, bucket = choose_resolution(START, end)
+
+        assert (end - START) / bucket <= MAX_BINS
+        assert bucket % timedelta(weeks=1) == timedelta(0)
+        assert name == f"{bucket // timedelta(weeks=1)} weeks"
+
+    assert choose_resolution(START, START + timedelta(weeks=801)) == ("3 weeks", timedelta(weeks=3))
+
+    end = START + timedelta(weeks=5000)
+    _, bucket = choose_resolution(START, end)
+    assert len(bin_events(to_seconds([START]), to_seconds([end]), START, end, bucket)) <= MAX_BINS
+
+def test_bin_events_counts_at_bucket_edges():
+    hour = timedelta(hours=1)
+    events = [
+        # Starts exactly on the second bucket's edge
+        (START + hour, START + 2 * hour),
+        # Ends exactly where the third bucket begins
+        (START + timedelta(minutes=30), START + 2 * hour),
+        # Runs across every bucket
+        (START - hour, START + 5 * hour),
+        # Starts where the range ends
+        (START + 3 * hour, START + 4 * hour)
+    ]
+    starts = to_seconds([start for start, _ in events])
+    ends = to_seconds([end for _, end in events])
+
+    bins = bin_events(starts, ends, START, START + 3 * hour, hour)
+
+    assert list(bins["bucket"]) == [START, START + hour, START + 2 * hour]
+    assert list(bins["starting"]) == [1, 1, 0]
+    assert list(bins["running"]) == [2, 3, 1]
+
+def test_bin_events_partial_last_bucket():
+    bins = bin_events(to_seconds([START]), to_seconds([START + timedelta(minutes=5)]), START, START + timedelta(minutes=90), timedelta(hours=1))
+
+    assert len(bins) == 2
+    assert list(bins["starting"]) == [1, 0]
+    assert list(bins["running"]) == [1, 0]
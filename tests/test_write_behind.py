@@ -0,0 +1,136 @@
+import threading
+import time
+
+from datetime import datetime, timedelta
+
+from src.core import store
+from src.core.store import get_board, save_board_events
+from src.core.write_behind import WriteBehindPersister
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.005)
+
+def make_entry(board_id, events):
+    return {"board_id": board_id, "events": events, "settings": {}, "themes": {}}
+
+class RecordingWriter:
+    """Write callable that records entries and can fail a set number of times."""
+
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.written = []
+        self.attempts = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, entry, events_changed):
+        with self.lock:
+            self.attempts += 1
+            if self.failures:
+                self.failures -= 1
+                raise OSError("disk full")
+            self.written.append((entry["board_id"], list(entry["events"]), events_changed))
+
+def test_burst_of_saves_is_coalesced():
+    writer = RecordingWriter()
+    persister = WriteBehindPersister(writer, window=0.05)
+    try:
+        for i in range(50):
+            persister.enqueue(make_entry("room", [i]), events_changed=i == 0)
+        assert persister.is_pending("room")
+
+        wait_for(lambda: not persister.is_pending("room"))
+        assert writer.written == [("room", [49], True)]
+    finally:
+        persister.stop()
+
+def test_flush_writes_immediately():
+    writer = RecordingWriter()
+    persister = WriteBehindPersister(writer, window=60)
+    try:
+        persister.enqueue(make_entry("room", [1]))
+        persister.flush()
+        assert writer.written == [("room", [1], True)]
+        assert not persister.is_pending("room")
+    finally:
+        persister.stop()
+
+def test_failed_write_is_retried_with_backoff():
+    writer = RecordingWriter(failures=2)
+    persister = WriteBehindPersister(writer, window=0.01, retry_base=0.05)
+    try:
+        started = time.monotonic()
+        persister.enqueue(make_entry("room", [1]))
+
+        wait_for(lambda: persister.get_failure("room") is not None)
+        assert persister.get_failure("room") == {"attempts": 1, "error": "disk full", "gave_up": False}
+        assert persister.is_pending("room")
+
+        wait_for(lambda: writer.written)
+        # Retries waited 0.05s and then 0.1s
+        assert time.monotonic() - started >= 0.15
+        assert writer.attempts == 3
+        assert persister.get_failure("room") is None
+        assert not persister.is_pending("room")
+    finally:
+        persister.stop()
+
+def test_retries_stop_at_the_cap_until_the_next_save():
+    writer = RecordingWriter(failures=100)
+    persister = WriteBehindPersister(writer, window=0.01, retry_base=0.01, max_attempts=3)
+    try:
+        persister.enqueue(make_entry("room", [1]))
+        wait_for(lambda: (persister.get_failure("room") or {}).get("gave_up"))
+
+        time.sleep(0.1)
+        assert writer.attempts == 3
+        # The data is kept for the next attempt rather than dropped
+        assert persister.get_queued("room")["events"] == [1]
+        assert persister.is_pending("room")
+
+        writer.failures = 0
+        persister.enqueue(make_entry("room", [2]))
+        wait_for(lambda: writer.written)
+        assert writer.written == [("room", [2], True)]
+        assert persister.get_failure("room") is None
+    finally:
+        persister.stop()
+
+def test_stop_flushes_queued_writes():
+    writer = RecordingWriter()
+    persister = WriteBehindPersister(writer, window=60)
+    persister.enqueue(make_entry("room", [1]))
+
+    persister.stop()
+
+    assert writer.written == [("room", [1], True)]
+
+def test_pending_version_until_written(board_dir):
+    start = datetime(2030, 1, 1, 9)
+    events = [{"id": "a", "name": "A", "start": start, "end": start + timedelta(hours=1)}]
+
+    save_board_events("default", events)
+    entry = get_board("default")
+
+    assert entry["version"][0].startswith("pending-")
+    assert len(set(entry["version"])) == 1
+    # Served from the cache while the files are behind
+    assert not (board_dir / "data" / "events.arrow").exists()
+    assert get_board("default") is entry
+
+    store.get_persister().flush()
+
+    assert (board_dir / "data" / "events.arrow").exists()
+    assert not entry["version"][0].startswith("pending-")
+    assert get_board("default")["events"] == entry["events"]
+
+def test_evicted_board_with_pending_write_is_not_lost(board_dir):
+    start = datetime(2030, 1, 1, 9)
+    events = [{"id": "a", "name": "A", "start": start, "end": start + timedelta(hours=1)}]
+
+    save_board_events("room", events)
+    store.evict_board("room")
+
+    assert get_board("room")["events"] == events